@@ -0,0 +1,137 @@
+import numpy as np
+from collections import Counter, deque
+from yolov12.ultralytics.trackers.basetrack import BaseTrack
+from yolov12.ultralytics.trackers.track import TRACKER_MAP
+from yolov12.ultralytics.utils import IterableSimpleNamespace, yaml_load
+from yolov12.ultralytics.utils.checks import check_yaml
+
+
+def build_tracker(tracker_args, frame_rate=30):
+    """A tracker of `tracker_args.tracker_type` that leaves the process-wide track id counter untouched.
+
+    Trackers reset the id counter shared by all trackers of the process when they are built, so a tracker
+    added for a new camera would hand out ids still in use by the trackers of the other cameras.
+    """
+    count = BaseTrack._count
+    tracker = TRACKER_MAP[tracker_args.tracker_type](args=tracker_args, frame_rate=frame_rate)
+    BaseTrack._count = count
+    return tracker
+
+
+class ModelCascade:
+    """Small model on every frame, large model only where it matters.
+
+    Both models come from a `ModelManager`. The small model runs on every frame. The large model
+    is invoked when a Hand is near an ROI or when a Hand/Scooper detection falls in the ambiguous
+    confidence band, as long as the camera's escalation budget (max fraction of the last
+    `budget_window` frames) allows it. Tracking is done by one ByteTrack instance per camera on
+    whichever detections were kept, so track ids stay stable across escalated and non-escalated frames.
+    All cameras draw their ids from the same counter, so track ids never collide across cameras.
+    """
+
+    def __init__(self, models, roi_zones, small_name="small", large_name="default", escalate_classes=(0, 3),
+                 hand_class=0, ambiguous_range=(0.2, 0.5), roi_margin=40, budget=0.5, budget_window=100,
+                 camera_budgets=None, conf=0.2, imgsz=640, tracker_cfg="bytetrack.yaml"):
+        self.models = models  # ModelManager, models are looked up per frame so hot-swaps take effect
+        self.small_name = small_name
+        self.large_name = large_name
+        self.roi_zones = roi_zones
+        self.escalate_classes = set(escalate_classes)
+        self.hand_class = hand_class
+        self.ambiguous_range = ambiguous_range
+        self.roi_margin = roi_margin
+        self.budget = budget
+        self.budget_window = budget_window
+        self.camera_budgets = camera_budgets or {}
+        self.conf = conf
+        self.imgsz = imgsz
+        self.tracker_args = IterableSimpleNamespace(**yaml_load(check_yaml(tracker_cfg)))
+
+        self.trackers = {}  # camera_id -> tracker of the configured tracker_type
+        self.history = {}   # camera_id -> deque of escalation flags
+        self.metrics = {}   # camera_id -> Counter
+
+    def _near_roi(self, box):
+        x1, y1, x2, y2 = box
+        m = self.roi_margin
+        for rx1, ry1, rx2, ry2 in self.roi_zones.values():
+            if x1 < rx2 + m and x2 > rx1 - m and y1 < ry2 + m and y2 > ry1 - m:
+                return True
+        return False
+
+    def escalation_reason(self, boxes):
+        """Return why the large model should run on this frame, or None."""
+        low, high = self.ambiguous_range
+        for cls, conf, box in zip(boxes.cls.astype(int), boxes.conf, boxes.xyxy):
+            if cls == self.hand_class and self._near_roi(box):
+                return "hand_near_roi"
+            if cls in self.escalate_classes and low <= conf < high:
+                return "ambiguous_conf"
+        return None
+
+    def _within_budget(self, camera_id):
+        history = self.history[camera_id]
+        budget = self.camera_budgets.get(camera_id, self.budget)
+        return sum(history) < budget * self.budget_window
+
+    def _predict(self, name, frame):
+        results = self.models.get(name).predict(frame, conf=self.conf, imgsz=self.imgsz, verbose=False)
+        return results[0].boxes.cpu().numpy()
+
+    def _add_camera(self, camera_id):
+        self.trackers[camera_id] = build_tracker(self.tracker_args)
+        self.history[camera_id] = deque(maxlen=self.budget_window)
+        self.metrics[camera_id] = Counter()
+
+    def state_dict(self):
+        """Tracker state and escalation history per camera, for snapshots (needs trackers with `state_dict`)."""
+        return {
+            camera_id: {"tracker": tracker.state_dict(), "history": np.array(self.history[camera_id], dtype=bool)}
+            for camera_id, tracker in self.trackers.items()
+            if hasattr(tracker, "state_dict")
+        }
+
+    def load_state_dict(self, state):
+        count = BaseTrack._count
+        for camera_id, camera_state in state.items():
+            if camera_id not in self.trackers:
+                self._add_camera(camera_id)
+            self.trackers[camera_id].load_state_dict(camera_state["tracker"])  # sets the counter to its next id
+            self.history[camera_id].extend(camera_state["history"].tolist())
+            count = max(count, BaseTrack._count)
+        BaseTrack._count = count  # above the ids of every camera
+
+    def track(self, frame, camera_id="default"):
+        """Detect and track objects in `frame`, returning (class_ids, xyxy, track_ids) arrays."""
+        if camera_id not in self.trackers:
+            self._add_camera(camera_id)
+        metrics = self.metrics[camera_id]
+        metrics["frames"] += 1
+
+        boxes = self._predict(self.small_name, frame)
+        escalated = False
+        reason = self.escalation_reason(boxes)
+        if reason:
+            metrics[reason] += 1
+            if self._within_budget(camera_id):
+                boxes = self._predict(self.large_name, frame)
+                escalated = True
+                metrics["escalated"] += 1
+            else:
+                metrics["budget_denied"] += 1
+        self.history[camera_id].append(escalated)
+
+        tracks = self.trackers[camera_id].update(boxes, frame) if len(boxes) else np.empty((0, 8))
+        if len(tracks) == 0:
+            return np.empty(0, dtype=int), np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=int)
+        return tracks[:, 6].astype(int), tracks[:, :4], tracks[:, 4].astype(int)
+
+    def escalation_rate(self, camera_id="default"):
+        metrics = self.metrics.get(camera_id)
+        return metrics["escalated"] / metrics["frames"] if metrics and metrics["frames"] else 0.0
+
+    def stats(self):
+        return {
+            camera_id: {**metrics, "escalation_rate": round(self.escalation_rate(camera_id), 4)}
+            for camera_id, metrics in self.metrics.items()
+        }
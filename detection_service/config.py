@@ -11,3 +11,67 @@ ROI_ZONES = {
     "protein_2": [425, 473, 475, 525],
     # Add more if needed
 }
+
+# Prep-table regions watched by the motion gate in addition to ROI_ZONES
+PREP_ZONES = {
+    # "prep_table": [x1, y1, x2, y2],
+}
+
+# Motion gate: skip YOLO on frames where nothing changed in the watched zones
+MOTION_GATE_ENABLED = True
+MOTION_SCALE = 0.25              # downscale factor used for frame differencing
+MOTION_PIXEL_THRESHOLD = 25      # gray-level delta for a pixel to count as changed
+MOTION_MIN_CHANGED_RATIO = 0.002 # fraction of changed zone pixels that triggers inference
+MOTION_REFRESH_INTERVAL = 30     # force a full inference at least every N frames
+MOTION_ZONE_PADDING = 40         # pixels added around each zone to catch approaching hands
+MOTION_STATS_INTERVAL = 300      # print skip-rate stats every N frames
+
+MODEL_PATH = "models/best.pt"
+MODEL_IMGSZ = 640
+WARMUP_BATCH = 1                        # batch size used for the warmup pass at load time
+MODEL_CACHE_DIR = "results/model_cache" # ready-to-run models reused across starts, None to rebuild every start
+TRACKER_CFG = "detection_service/tracker.yaml"  # per-class ByteTrack settings
+
+# INT8 post-training quantization (python -m detection_service.quantize)
+QUANT_DATA = "datasets/PizzaStore-5/data.yaml"  # calibration and validation split come from here
+QUANT_SPLIT = "val"
+QUANT_FORMAT = "onnx"                           # "onnx" (ONNX Runtime) or "openvino"
+QUANT_CRITICAL_CLASSES = ("Hand", "Scooper")    # classes whose accuracy gates the INT8 model
+QUANT_MAX_MAP_DROP = 0.01                       # max mAP50-95 drop per critical class vs FP32
+QUANT_REPORT_PATH = "results/int8_report.json"
+
+# CPU BF16 mode: channels_last + bfloat16 autocast, box decoding and NMS in FP32 (python -m detection_service.quantize --bf16)
+BF16_ENABLED = False                    # enable only after the BF16 check passed on this dataset and CPU
+BF16_MAX_MAP_DROP = 0.01                # max mAP50-95 drop per critical class vs FP32
+BF16_REPORT_PATH = "results/bf16_report.json"
+
+# Worker pool for multi-camera CPU nodes: K pinned model processes sharing one copy of the weights
+WORKER_PROCESSES = 0                    # 0 runs the model in the service process
+WORKER_THREADS = None                   # torch threads (and cores) per worker, None splits all cores evenly
+
+# State snapshots: tracks, virtual ids and in-flight ROI entries survive worker restarts and failover
+SNAPSHOT_ENABLED = True
+SNAPSHOT_PATH = "results/state_snapshot.npz"  # shared by all workers that may take over this camera
+SNAPSHOT_INTERVAL = 150                       # write a snapshot every N frames (and always on shutdown)
+SNAPSHOT_MAX_AGE = 300                        # seconds, older snapshots are ignored on startup
+
+# Extra models per camera type, loaded by the ModelManager (same weights path -> shared weights)
+CAMERA_MODELS = {
+    # "overhead": "models/best.pt",
+}
+# Camera id -> camera type in CAMERA_MODELS; other cameras (and the cascade and worker pool) use MODEL_PATH
+CAMERA_TYPES = {
+    # "camera_1": "overhead",
+}
+
+# Model cascade: small model on every frame, MODEL_PATH (large) only when needed
+CASCADE_ENABLED = False
+CASCADE_SMALL_MODEL_PATH = "models/best_small.pt"
+CASCADE_ESCALATE_CLASSES = (0, 3)       # Hand, Scooper
+CASCADE_AMBIGUOUS_CONF = (0.2, 0.5)     # small-model confidence band that triggers the large model
+CASCADE_ROI_MARGIN = 40                 # a Hand within this many pixels of an ROI triggers the large model
+CASCADE_BUDGET = 0.5                    # max fraction of frames per camera sent to the large model
+CASCADE_BUDGET_WINDOW = 100             # sliding window (frames) the budget is measured over
+CASCADE_CAMERA_BUDGETS = {
+    # "camera_1": 0.3,
+}
@@ -1,4 +1,5 @@
 import cv2
+import numpy as np
 import pika
 import pickle
 import logging
@@ -6,14 +7,56 @@ import json
 import os
 import time
 import tempfile
+import copy
+import signal
+import sys
 from multiprocessing import Queue
-from yolov12.ultralytics import YOLO
-from detection_service.config import CLASS_NAMES, ROI_ZONES
+from detection_service.config import (
+    CLASS_NAMES, ROI_ZONES, PREP_ZONES, MOTION_GATE_ENABLED, MOTION_SCALE, MOTION_PIXEL_THRESHOLD,
+    MOTION_MIN_CHANGED_RATIO, MOTION_REFRESH_INTERVAL, MOTION_ZONE_PADDING, MOTION_STATS_INTERVAL,
+    MODEL_PATH, MODEL_IMGSZ, WARMUP_BATCH, MODEL_CACHE_DIR, BF16_ENABLED, TRACKER_CFG,
+    SNAPSHOT_ENABLED, SNAPSHOT_PATH, SNAPSHOT_INTERVAL, SNAPSHOT_MAX_AGE, WORKER_PROCESSES, WORKER_THREADS,
+    CAMERA_MODELS, CAMERA_TYPES, CASCADE_ENABLED, CASCADE_SMALL_MODEL_PATH, CASCADE_ESCALATE_CLASSES,
+    CASCADE_AMBIGUOUS_CONF, CASCADE_ROI_MARGIN, CASCADE_BUDGET, CASCADE_BUDGET_WINDOW, CASCADE_CAMERA_BUDGETS
+)
+from detection_service.cascade import ModelCascade, build_tracker
+from detection_service.model_manager import ModelManager
+from detection_service.worker_pool import InferenceWorkerPool
+from yolov12.ultralytics.trackers.basetrack import BaseTrack
+from yolov12.ultralytics.trackers.utils.snapshot import load_state, save_state
 from utils.helpers import get_center, draw_rois, save_violation_frame
+from utils.motion_gate import MotionGate
 from utils.virtual_id_tracker import VirtualIDTracker
 
 logging.getLogger("ultralytics").setLevel(logging.WARNING)
-model = YOLO("models/best.pt")
+# Loads lazily, see main()
+models = ModelManager(imgsz=MODEL_IMGSZ, batch=WARMUP_BATCH, cache_dir=MODEL_CACHE_DIR, bf16=BF16_ENABLED)
+models.register("default", MODEL_PATH)
+for camera_type, weights in CAMERA_MODELS.items():
+    models.register(camera_type, weights)
+if CASCADE_ENABLED:
+    models.register("small", CASCADE_SMALL_MODEL_PATH)
+cascade = ModelCascade(
+    models=models,
+    roi_zones=ROI_ZONES,
+    escalate_classes=CASCADE_ESCALATE_CLASSES,
+    ambiguous_range=CASCADE_AMBIGUOUS_CONF,
+    roi_margin=CASCADE_ROI_MARGIN,
+    budget=CASCADE_BUDGET,
+    budget_window=CASCADE_BUDGET_WINDOW,
+    camera_budgets=CASCADE_CAMERA_BUDGETS,
+    imgsz=MODEL_IMGSZ,
+    tracker_cfg=TRACKER_CFG,
+) if CASCADE_ENABLED else None
+pool = InferenceWorkerPool(
+    MODEL_PATH,
+    processes=WORKER_PROCESSES,
+    threads=WORKER_THREADS,
+    imgsz=MODEL_IMGSZ,
+    tracker_cfg=TRACKER_CFG,
+    cache_dir=MODEL_CACHE_DIR,
+    bf16=BF16_ENABLED,
+) if WORKER_PROCESSES and cascade is None else None
 
 output_video_path = "results/processed_video.mp4"
 os.makedirs(os.path.dirname(output_video_path), exist_ok=True)
@@ -21,10 +64,15 @@ fourcc = cv2.VideoWriter_fourcc(*'mp4v')
 video_writer = None
 
 violation_count = 0
-roi_entry_log = {}
-hand_roi_appearances = {}  # virtual_id -> list of frame_ids
-last_violation_frame = {}  # (virtual_id, roi_id) -> frame_id
-tracker = VirtualIDTracker(distance_threshold=80)
+last_frame_id = None
+# Frames of different cameras arrive interleaved, so all per-frame state is kept per camera_id
+roi_entry_log = {}         # camera_id -> virtual_id -> entry
+hand_roi_appearances = {}  # camera_id -> virtual_id -> list of frame_ids
+last_violation_frame = {}  # camera_id -> virtual_id -> frame_id
+virtual_trackers = {}      # camera_id -> VirtualIDTracker
+motion_gates = {}          # camera_id -> MotionGate
+last_detections = {}       # camera_id -> track_id -> {"label", "bbox"} from the last inferred frame
+yolo_trackers = {}         # camera_id -> tracker of the default model, swapped into its predictor per frame
 
 CLEANING_TIMEOUT_FRAMES = 330
 ENTRY_CONFIRMATION_FRAMES = 30
@@ -33,6 +81,7 @@ PIZZA_TOUCH_DIST = 70
 SCOOPER_TOUCH_DIST = 80
 
 violations_queue = Queue()
+TRACK_ARGS = dict(persist=True, conf=0.2, imgsz=MODEL_IMGSZ, tracker=TRACKER_CFG, raw=True, verbose=False)
 
 def bboxes_intersect(b1, b2):
     x1, y1, x2, y2 = b1
@@ -42,25 +91,218 @@ def bboxes_intersect(b1, b2):
 def is_point_in_roi_bbox(hand_box, roi_box):
     return bboxes_intersect(hand_box, roi_box)
 
-def process_frame(frame, frame_id):
-    global roi_entry_log, violation_count, video_writer
-
-    results = model.track(frame, persist=True, conf=0.2, verbose=False)
-    if not results:
-        return frame, violation_count
+def virtual_tracker(camera_id):
+    if camera_id not in virtual_trackers:
+        virtual_trackers[camera_id] = VirtualIDTracker(distance_threshold=80)
+    return virtual_trackers[camera_id]
+
+def motion_gate(camera_id):
+    """The motion gate of `camera_id`, so each camera's frames are only compared with its own."""
+    if camera_id not in motion_gates:
+        motion_gates[camera_id] = MotionGate(
+            zones={**ROI_ZONES, **PREP_ZONES},
+            scale=MOTION_SCALE,
+            pixel_threshold=MOTION_PIXEL_THRESHOLD,
+            min_changed_ratio=MOTION_MIN_CHANGED_RATIO,
+            refresh_interval=MOTION_REFRESH_INTERVAL,
+            padding=MOTION_ZONE_PADDING,
+        )
+    return motion_gates[camera_id]
+
+def predict_detections(camera_id, steps):
+    """Advance the last detections of `camera_id` by `steps` frames with its tracker's Kalman state, read-only."""
+    detections = last_detections.get(camera_id, {})
+    if pool is not None:
+        return detections  # tracks live in the worker processes
+    if cascade is not None:
+        tracker = cascade.trackers.get(camera_id)
+    else:
+        tracker = yolo_trackers.get(camera_id)
+    if tracker is None:
+        return detections
+    tracks = {t.track_id: t for t in tracker.tracked_stracks if t.is_activated}
+    predicted = {}
+    for tid, obj in detections.items():
+        track = tracks.get(tid)
+        if track is None or track.mean is None:
+            predicted[tid] = obj
+            continue
+        ghost = copy.copy(track)
+        ghost.mean = track.mean.copy()
+        ghost.mean[:4] += steps * track.mean[4:]  # constant-velocity model of the Kalman filter
+        predicted[tid] = {"label": obj["label"], "bbox": ghost.xyxy}
+    return predicted
+
+def camera_model(camera_id):
+    """Name of the model registered for the camera type of `camera_id`, "default" for cameras without one."""
+    camera_type = CAMERA_TYPES.get(camera_id)
+    return camera_type if camera_type in CAMERA_MODELS else "default"
+
+def detect(frame, camera_id="default"):
+    # While a hand is being evaluated in an ROI every frame matters, so the gate is bypassed
+    gate = motion_gate(camera_id)
+    if MOTION_GATE_ENABLED and not gate.should_infer(frame, force=bool(roi_entry_log.get(camera_id))):
+        return predict_detections(camera_id, gate.frames_since_inference)
+
+    if cascade is not None:
+        class_ids, bboxes, track_ids = cascade.track(frame, camera_id)
+    elif pool is not None:
+        class_ids, bboxes, track_ids = pool.track(frame, camera_id)
+    else:
+        model = models.get(camera_model(camera_id))
+        predictor = model.predictor
+        if hasattr(predictor, "trackers"):
+            predictor.trackers[0] = yolo_tracker(camera_id)  # the model tracks one camera per call
+        if hasattr(predictor, "trackers") and predictor.args.mode == "track" and predictor.args.raw:
+            # Args, source and trackers are already set up, skip the per-call setup of model.track()
+            results = predictor.infer_frames([frame])
+        else:
+            # raw=True: one structured NumPy array per frame instead of Results/Boxes objects
+            results = model.track(frame, **TRACK_ARGS)
+            yolo_trackers.setdefault(camera_id, model.predictor.trackers[0])
+        if not results:
+            last_detections[camera_id] = {}
+            return last_detections[camera_id]
 
-    r = results[0]
-    boxes = r.boxes
-    class_ids = boxes.cls.cpu().numpy().astype(int)
-    bboxes = boxes.xyxy.cpu().numpy()
-    track_ids = boxes.id.cpu().numpy().astype(int) if boxes.id is not None else []
+        det = results[0][results[0]["track_id"] >= 0]
+        class_ids, bboxes, track_ids = det["cls"], det["xyxy"], det["track_id"]
 
-    detections = {
+    last_detections[camera_id] = {
         tid: {"label": CLASS_NAMES.get(cls, "Unknown"), "bbox": bbox}
         for cls, bbox, tid in zip(class_ids, bboxes, track_ids)
     }
-
-    virtual_map = tracker.update(detections)
+    return last_detections[camera_id]
+
+def yolo_tracker(camera_id="default", create=False):
+    """The tracker of `camera_id` on its camera type's model, created by a blank-frame track call if `create`."""
+    model = models.get(camera_model(camera_id))
+    if create and not hasattr(model.predictor, "trackers"):
+        model.track(np.zeros((MODEL_IMGSZ, MODEL_IMGSZ, 3), dtype=np.uint8), **TRACK_ARGS)
+    trackers = getattr(model.predictor, "trackers", None)
+    if not trackers:
+        return None
+    if camera_id not in yolo_trackers:
+        # The first camera takes the tracker created by model.track(), the others get their own
+        yolo_trackers[camera_id] = build_tracker(trackers[0].args) if yolo_trackers else trackers[0]
+    return yolo_trackers[camera_id]
+
+def snapshot_state():
+    """Write tracks, virtual ids and the rule-engine state to SNAPSHOT_PATH."""
+    start = time.perf_counter()
+    if cascade is not None:
+        tracks = {"cascade": cascade.state_dict()}
+    elif pool is not None:
+        tracks = {}  # tracks live in the worker processes and are not snapshotted
+    else:
+        tracks = {"yolo": {c: t.state_dict() for c, t in yolo_trackers.items() if hasattr(t, "state_dict")}}
+    entries = [(camera_id, vid, e) for camera_id, log in roi_entry_log.items() for vid, e in log.items()]
+    appearances = [(c, vid, f) for c, camera in hand_roi_appearances.items() for vid, f in camera.items()]
+    violations = [(c, vid, f) for c, camera in last_violation_frame.items() for vid, f in camera.items()]
+    state = {
+        "frame_id": -1 if last_frame_id is None else last_frame_id,
+        "violation_count": violation_count,
+        **tracks,
+        "virtual_ids": {camera_id: t.state_dict() for camera_id, t in virtual_trackers.items()},
+        "roi_entry_log": {
+            "camera_id": np.array([c for c, _, _ in entries], dtype=str),
+            "virtual_id": np.array([vid for _, vid, _ in entries], dtype=np.int64),
+            "roi_id": np.array([e["roi_id"] for _, _, e in entries], dtype=str),
+            "entry_frame": np.array([e["entry_frame"] for _, _, e in entries], dtype=np.int64),
+            "last_seen": np.array([e["last_seen"] for _, _, e in entries], dtype=np.int64),
+            "touched_pizza": np.array([e["touched_pizza"] for _, _, e in entries], dtype=bool),
+            "used_scooper": np.array([e["used_scooper"] for _, _, e in entries], dtype=bool),
+            "scooper_id": np.array([-1 if e["scooper_id"] is None else e["scooper_id"] for _, _, e in entries],
+                                   dtype=np.int64),
+        },
+        "hand_roi_appearances": {
+            "camera_id": np.array([c for c, _, _ in appearances], dtype=str),
+            "virtual_id": np.array([vid for _, vid, _ in appearances], dtype=np.int64),
+            "lengths": np.array([len(f) for _, _, f in appearances], dtype=np.int64),
+            "frames": np.array([x for _, _, f in appearances for x in f], dtype=np.int64),
+        },
+        "last_violation_frame": {
+            "camera_id": np.array([c for c, _, _ in violations], dtype=str),
+            "virtual_id": np.array([vid for _, vid, _ in violations], dtype=np.int64),
+            "frame_id": np.array([f for _, _, f in violations], dtype=np.int64),
+        },
+    }
+    save_state(SNAPSHOT_PATH, state)
+    print(f"[SNAPSHOT] Saved frame {state['frame_id']} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+def restore_state():
+    """Restore the state written by `snapshot_state`, returns False if there is no recent snapshot."""
+    global violation_count, last_frame_id
+    if not os.path.exists(SNAPSHOT_PATH):
+        return False
+    age = time.time() - os.path.getmtime(SNAPSHOT_PATH)
+    if age > SNAPSHOT_MAX_AGE:
+        print(f"[SNAPSHOT] Ignoring {SNAPSHOT_PATH}, {age:.0f}s old")
+        return False
+    start = time.perf_counter()
+    state = load_state(SNAPSHOT_PATH)
+    if "camera_id" not in state["roi_entry_log"]:
+        print(f"[SNAPSHOT] Ignoring {SNAPSHOT_PATH}, written before the state was kept per camera")
+        return False
+    if cascade is not None and "cascade" in state:
+        cascade.load_state_dict(state["cascade"])
+    elif cascade is None and pool is None and "yolo" in state:
+        count = BaseTrack._count
+        for camera_id, camera_state in state["yolo"].items():
+            yolo = yolo_tracker(camera_id, create=True)
+            if not hasattr(yolo, "load_state_dict"):
+                print(f"[WARNING] {type(yolo).__name__} has no state_dict, tracks are not restored")
+                break
+            yolo.load_state_dict(camera_state)  # sets the shared id counter to this camera's next id
+            count = max(count, BaseTrack._count)
+        BaseTrack._count = count
+    virtual_trackers.clear()
+    for camera_id, camera_state in state.get("virtual_ids", {}).items():  # absent without cameras
+        virtual_tracker(camera_id).load_state_dict(camera_state)
+
+    entries = state["roi_entry_log"]
+    roi_entry_log.clear()
+    for camera_id, vid, roi_id, entry_frame, last_seen, touched, used, scooper_id in zip(*(
+        entries[k].tolist() for k in
+        ("camera_id", "virtual_id", "roi_id", "entry_frame", "last_seen", "touched_pizza", "used_scooper", "scooper_id")
+    )):
+        roi_entry_log.setdefault(camera_id, {})[vid] = {
+            "roi_id": roi_id,
+            "entry_frame": entry_frame,
+            "last_seen": last_seen,
+            "touched_pizza": touched,
+            "used_scooper": used,
+            "scooper_id": None if scooper_id < 0 else scooper_id
+        }
+    appearances = state["hand_roi_appearances"]
+    frames = np.split(appearances["frames"], np.cumsum(appearances["lengths"])[:-1])
+    hand_roi_appearances.clear()
+    for camera_id, vid, f in zip(appearances["camera_id"].tolist(), appearances["virtual_id"].tolist(), frames):
+        hand_roi_appearances.setdefault(camera_id, {})[vid] = f.tolist()
+    violations = state["last_violation_frame"]
+    last_violation_frame.clear()
+    for camera_id, vid, f in zip(*(violations[k].tolist() for k in ("camera_id", "virtual_id", "frame_id"))):
+        last_violation_frame.setdefault(camera_id, {})[vid] = f
+    violation_count = state["violation_count"]
+    last_frame_id = None if state["frame_id"] < 0 else state["frame_id"]
+    print(f"[SNAPSHOT] Restored frame {last_frame_id} with {sum(map(len, roi_entry_log.values()))} ROI entries "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return True
+
+def process_frame(frame, frame_id, camera_id="default"):
+    global roi_entry_log, violation_count, video_writer, last_frame_id
+    last_frame_id = frame_id
+
+    detections = detect(frame, camera_id)
+    if MOTION_GATE_ENABLED and motion_gate(camera_id).frames % MOTION_STATS_INTERVAL == 0:
+        print(f"[MOTION] {camera_id}: {motion_gate(camera_id).stats()}")
+    if cascade is not None and frame_id % MOTION_STATS_INTERVAL == 0:
+        print(f"[CASCADE] {cascade.stats()}")
+
+    # Virtual ids, ROI entries and cooldowns of one camera never see the hands of another
+    virtual_map = virtual_tracker(camera_id).update(detections)
+    entries = roi_entry_log.setdefault(camera_id, {})
+    appearances = hand_roi_appearances.setdefault(camera_id, {})
+    last_violations = last_violation_frame.setdefault(camera_id, {})
 
     # Track hand appearances in ROI
     for real_id, obj in detections.items():
@@ -78,14 +320,14 @@ def process_frame(frame, frame_id):
 
         if in_roi:
             # Track frame appearances within sliding window
-            hand_roi_appearances.setdefault(virtual_id, []).append(frame_id)
-            hand_roi_appearances[virtual_id] = [
-                f for f in hand_roi_appearances[virtual_id]
+            appearances.setdefault(virtual_id, []).append(frame_id)
+            appearances[virtual_id] = [
+                f for f in appearances[virtual_id]
                 if f >= frame_id - ENTRY_CONFIRMATION_FRAMES
             ]
 
-            if virtual_id not in roi_entry_log and len(hand_roi_appearances[virtual_id]) >= 1:
-                roi_entry_log[virtual_id] = {
+            if virtual_id not in entries and len(appearances[virtual_id]) >= 1:
+                entries[virtual_id] = {
                     "roi_id": in_roi,
                     "entry_frame": frame_id,
                     "last_seen": frame_id,
@@ -94,8 +336,8 @@ def process_frame(frame, frame_id):
                     "scooper_id": None
                 }
                 print(f"[DEBUG] Hand {virtual_id} confirmed in ROI {in_roi} at frame {frame_id}")
-            elif virtual_id in roi_entry_log:
-                roi_entry_log[virtual_id]["last_seen"] = frame_id
+            elif virtual_id in entries:
+                entries[virtual_id]["last_seen"] = frame_id
 
     # Scooper detection
     for real_id, obj in detections.items():
@@ -105,9 +347,9 @@ def process_frame(frame, frame_id):
             if hobj["label"] != "Hand":
                 continue
             vid = virtual_map.get(hand_id)
-            if vid in roi_entry_log and bboxes_intersect(obj["bbox"], hobj["bbox"]):
-                roi_entry_log[vid]["used_scooper"] = True
-                roi_entry_log[vid]["scooper_id"] = real_id
+            if vid in entries and bboxes_intersect(obj["bbox"], hobj["bbox"]):
+                entries[vid]["used_scooper"] = True
+                entries[vid]["scooper_id"] = real_id
                 print(f"[DEBUG] Hand {vid} used scooper {real_id} at frame {frame_id}")
 
     # Pizza interaction
@@ -118,26 +360,26 @@ def process_frame(frame, frame_id):
             if hobj["label"] != "Hand":
                 continue
             vid = virtual_map.get(hand_id)
-            if vid in roi_entry_log and bboxes_intersect(obj["bbox"], hobj["bbox"]):
-                roi_entry_log[vid]["touched_pizza"] = True
+            if vid in entries and bboxes_intersect(obj["bbox"], hobj["bbox"]):
+                entries[vid]["touched_pizza"] = True
                 print(f"[DEBUG] Hand {vid} touched pizza at frame {frame_id}")
 
     # Evaluation logic
     to_delete = []
-    for vid, entry in roi_entry_log.items():
+    for vid, entry in entries.items():
         duration = frame_id - entry["entry_frame"]
         roi_id = entry["roi_id"]
         print(f"[TRACE] Hand {vid} | ROI: {roi_id} | Scooper: {entry['used_scooper']} | Pizza: {entry['touched_pizza']} | Duration: {duration}")
 
-        last_frame = last_violation_frame.get(vid, -VIOLATION_COOLDOWN_FRAMES - 1)
+        last_frame = last_violations.get(vid, -VIOLATION_COOLDOWN_FRAMES - 1)
 
         if entry["touched_pizza"] and not entry["used_scooper"] and duration < CLEANING_TIMEOUT_FRAMES:
             if frame_id - last_frame >= VIOLATION_COOLDOWN_FRAMES:
                 violation_count += 1
-                last_violation_frame[vid] = frame_id
+                last_violations[vid] = frame_id
                 print(f"[🚨 VIOLATION] Hand {vid} touched pizza too early without scooper in ROI {roi_id}")
                 save_violation_frame(frame, "results/violations")
-                log_violation_info(frame_id, vid, roi_id, entry["scooper_id"])
+                log_violation_info(frame_id, vid, roi_id, entry["scooper_id"], camera_id)
             to_delete.append(vid)
 
         elif not entry["touched_pizza"] and duration >= CLEANING_TIMEOUT_FRAMES:
@@ -153,7 +395,7 @@ def process_frame(frame, frame_id):
             to_delete.append(vid)
 
     for vid in to_delete:
-        roi_entry_log.pop(vid, None)
+        entries.pop(vid, None)
 
     # Draw results
     annotated_frame = frame.copy()
@@ -178,11 +420,12 @@ def process_frame(frame, frame_id):
 
     return annotated_frame, violation_count
 
-def log_violation_info(frame_id, hand_id, roi_id, scooper_id=None):
+def log_violation_info(frame_id, hand_id, roi_id, scooper_id=None, camera_id="default"):
     log_file = "results/violations/violations.json"
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
     entry = {
         "frame_id": frame_id,
+        "camera_id": camera_id,
         "hand_id": hand_id,
         "roi_id": roi_id,
         "scooper_id": scooper_id,
@@ -206,8 +449,10 @@ def log_violation_info(frame_id, hand_id, roi_id, scooper_id=None):
 
 def callback(ch, method, properties, body):
     try:
-        frame_id, frame = pickle.loads(body)
-        result_frame, v_count = process_frame(frame, frame_id)
+        frame_id, frame, *camera = pickle.loads(body)  # (frame_id, frame[, camera_id])
+        result_frame, v_count = process_frame(frame, frame_id, camera[0] if camera else "default")
+        if SNAPSHOT_ENABLED and SNAPSHOT_INTERVAL and frame_id % SNAPSHOT_INTERVAL == 0:
+            snapshot_state()
         ch.basic_publish(
             exchange='results',
             routing_key='detections',
@@ -217,7 +462,26 @@ def callback(ch, method, properties, body):
     except Exception as e:
         print("[ERROR] Failed to process frame:", str(e))
 
+def reload_models():
+    if pool is not None:
+        print("[MODEL] Reload is not supported with WORKER_PROCESSES > 0, the workers own their models; "
+              "restart the service to load new weights")
+        return
+    models.reload_all()
+
 def main():
+    if pool is not None:
+        pool.start()
+    else:
+        models.load_all()  # pay model load + warmup before the first frame arrives
+    if hasattr(signal, "SIGHUP"):
+        # `kill -HUP <pid>` reloads weights from disk without stopping the consumer
+        signal.signal(signal.SIGHUP, lambda signum, stack: reload_models())
+    if SNAPSHOT_ENABLED:
+        restore_state()
+        # Exit through the `finally` below on `kill`/docker stop so the final snapshot is written
+        signal.signal(signal.SIGTERM, lambda signum, stack: sys.exit(0))
+
     connection = pika.BlockingConnection(pika.ConnectionParameters('localhost'))
     channel = connection.channel()
     channel.exchange_declare(exchange='results', exchange_type='fanout', durable=True)
@@ -228,6 +492,10 @@ def main():
     try:
         channel.start_consuming()
     finally:
+        if SNAPSHOT_ENABLED:
+            snapshot_state()
+        if pool is not None:
+            pool.close()
         if video_writer is not None:
             video_writer.release()
         connection.close()
@@ -0,0 +1,124 @@
+import copy
+import threading
+import numpy as np
+from yolov12.ultralytics import YOLO
+
+TRACKER_EVENTS = ("on_predict_start", "on_predict_postprocess_end")
+
+
+class ModelManager:
+    """Owns the YOLO models used by the detection service.
+
+    Models are registered by name (e.g. per camera type) and loaded on first `get()` or
+    eagerly with `load_all()` at service start. Every load is followed by a warmup pass at the
+    configured `imgsz`/`batch` so the first real frame does not pay predictor setup. Names that
+    point to the same weights file share one set of weights. `swap()` loads and warms new weights
+    in the background and replaces the model atomically, carrying the tracker state over.
+    With `cache_dir`, predictors reuse the ready-to-run models (fused layers, optimized ONNX
+    graphs, OpenVINO blobs) cached there by earlier starts instead of rebuilding them. `bf16`
+    runs PyTorch models on CPU in channels_last + bfloat16 autocast (see quantize.check_bf16).
+    """
+
+    def __init__(self, imgsz=640, batch=1, warmup=True, cache_dir=None, bf16=False):
+        self.imgsz = imgsz
+        self.batch = batch
+        self.warmup_enabled = warmup
+        self.cache_dir = cache_dir
+        self.bf16 = bf16
+        self.weights = {}   # name -> weights path
+        self.models = {}    # name -> YOLO
+        self._bases = {}    # weights path -> first YOLO loaded from it (owner of the shared weights)
+        self._lock = threading.RLock()
+
+    def register(self, name, weights):
+        with self._lock:
+            self.weights[name] = str(weights)
+
+    def get(self, name="default"):
+        """Return the model registered under `name`, loading and warming it up on first use."""
+        with self._lock:
+            model = self.models.get(name)
+            if model is None:
+                if name not in self.weights:
+                    raise KeyError(f"No model registered under '{name}', available: {list(self.weights)}")
+                model = self.models[name] = self._load(self.weights[name])
+            return model
+
+    def load_all(self):
+        for name in list(self.weights):
+            self.get(name)
+
+    def _share(self, base):
+        """A model on the same nn.Module as `base`, with its own predictor/tracker state."""
+        model = copy.copy(base)
+        model.predictor = None
+        model.callbacks = {event: list(funcs) for event, funcs in base.callbacks.items()}
+        model.overrides = dict(base.overrides)
+        return model
+
+    def _load(self, weights, shared=True):
+        base = self._bases.get(weights) if shared else None
+        if base is None:
+            model = YOLO(weights)
+            if self.cache_dir:
+                model.overrides["model_cache"] = str(self.cache_dir)
+            if self.bf16:
+                model.overrides["bf16"] = True
+            if shared:
+                self._bases[weights] = model
+        else:
+            model = self._share(base)
+        self.warmup(model)
+        return model
+
+    def warmup(self, model):
+        if not self.warmup_enabled:
+            return
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        model.predict([dummy] * self.batch, imgsz=self.imgsz, batch=self.batch, verbose=False)
+
+    def swap(self, name, weights=None, background=True):
+        """Replace the model under `name` with freshly loaded `weights` without interrupting `get()` callers.
+
+        The weights file is loaded once, and every loaded name registered to the same path is switched to
+        it together with `name`, so names on one file keep sharing one set of weights after the swap.
+        """
+        weights = str(weights or self.weights[name])
+
+        def _swap():
+            base = self._load(weights, shared=False)
+            with self._lock:
+                names = [name] + [n for n in self.models if n != name and self.weights[n] == weights]
+            new = {n: base if n == name else self._share(base) for n in names}
+            for model in new.values():
+                if model is not base:
+                    self.warmup(model)
+            with self._lock:
+                for n, model in new.items():
+                    old = self.models.get(n)
+                    if old is not None and hasattr(old.predictor, "trackers"):
+                        for event in TRACKER_EVENTS:
+                            model.callbacks[event] = list(old.callbacks[event])
+                        model.predictor.trackers = old.predictor.trackers
+                        model.predictor.vid_path = old.predictor.vid_path
+                    self.weights[n] = weights
+                    self.models[n] = model
+                self._bases[weights] = base
+                for path in set(self._bases) - set(self.weights.values()):
+                    del self._bases[path]  # no name left on the old weights
+            print(f"[MODEL] {names} swapped to {weights}")
+
+        if not background:
+            _swap()
+            return None
+        thread = threading.Thread(target=_swap, daemon=True)
+        thread.start()
+        return thread
+
+    def reload_all(self, background=True):
+        """Reload every weights file in use once, names sharing a file are switched together."""
+        with self._lock:
+            names = {}
+            for name in self.models:
+                names.setdefault(self.weights[name], name)
+        return [self.swap(name, background=background) for name in names.values()]
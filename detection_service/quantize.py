@@ -0,0 +1,105 @@
+import json
+import sys
+from pathlib import Path
+
+from detection_service.config import (
+    BF16_MAX_MAP_DROP, BF16_REPORT_PATH, MODEL_IMGSZ, MODEL_PATH, QUANT_CRITICAL_CLASSES, QUANT_DATA, QUANT_FORMAT,
+    QUANT_MAX_MAP_DROP, QUANT_REPORT_PATH, QUANT_SPLIT,
+)
+from yolov12.ultralytics.utils.benchmarks import benchmark_bf16, benchmark_int8
+
+
+def _critical_drops(classes, critical, max_drop):
+    """Return the mAP50-95 drop of each critical class and the classes dropping more than `max_drop`."""
+    drops = {c: float(-classes.loc[c, "Delta mAP50-95"]) for c in critical if c in classes.index}
+    return drops, [c for c, drop in drops.items() if drop > max_drop]
+
+
+def _write_report(report, report_path):
+    Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(report_path).write_text(json.dumps(report, indent=2, default=str))
+
+
+def quantize(weights=MODEL_PATH, data=QUANT_DATA, format=QUANT_FORMAT, split=QUANT_SPLIT, imgsz=MODEL_IMGSZ,
+             critical=QUANT_CRITICAL_CLASSES, max_drop=QUANT_MAX_MAP_DROP, report_path=QUANT_REPORT_PATH):
+    """Export an INT8 model calibrated on `split` of `data` and check it against FP32 on the critical classes.
+
+    Writes the per-class mAP, latency and size report to `report_path` and returns it. `report["passed"]` is False
+    when any critical class loses more than `max_drop` mAP50-95, in which case the FP32 model should stay in service.
+    """
+    result = benchmark_int8(weights, data=data, format=format, imgsz=imgsz, split=split)
+    classes = result["classes"]
+    drops, failed = _critical_drops(classes, critical, max_drop)
+    report = {
+        "weights": str(weights),
+        "data": data,
+        "split": split,
+        "format": format,
+        "fp32": result["fp32"],
+        "int8": result["int8"],
+        "speedup": result["speedup"],
+        "classes": classes.to_dict(orient="index"),
+        "critical_drop": drops,
+        "max_drop": max_drop,
+        "passed": not failed,
+    }
+    _write_report(report, report_path)
+
+    for c, drop in drops.items():
+        print(f"[QUANT] {c}: mAP50-95 {classes.loc[c, 'mAP50-95 FP32']:.4f} -> {classes.loc[c, 'mAP50-95 INT8']:.4f}"
+              f" ({-drop:+.4f})")
+    status = "PASS" if not failed else f"FAIL, {failed} lose more than {max_drop} mAP50-95"
+    print(f"[QUANT] {result['int8']['file']}: {result['speedup']}x faster than FP32, {status}. Report: {report_path}")
+    return report
+
+
+def check_bf16(weights=MODEL_PATH, data=QUANT_DATA, split=QUANT_SPLIT, imgsz=MODEL_IMGSZ,
+               critical=QUANT_CRITICAL_CLASSES, max_drop=BF16_MAX_MAP_DROP, report_path=BF16_REPORT_PATH):
+    """Validate the PyTorch model in FP32 and in BF16 mode (`bf16=True`) on CPU and check the critical classes.
+
+    Writes the per-class mAP and latency report to `report_path` and returns it. `report["passed"]` is False when
+    any critical class loses more than `max_drop` mAP50-95, in which case BF16_ENABLED should stay off.
+    """
+    result = benchmark_bf16(weights, data=data, imgsz=imgsz, split=split)
+    classes = result["classes"]
+    drops, failed = _critical_drops(classes, critical, max_drop)
+    report = {
+        "weights": str(weights),
+        "data": data,
+        "split": split,
+        "fp32": result["fp32"],
+        "bf16": result["bf16"],
+        "speedup": result["speedup"],
+        "classes": classes.to_dict(orient="index"),
+        "critical_drop": drops,
+        "max_drop": max_drop,
+        "passed": not failed,
+    }
+    _write_report(report, report_path)
+
+    for c, drop in drops.items():
+        print(f"[BF16] {c}: mAP50-95 {classes.loc[c, 'mAP50-95 FP32']:.4f} -> {classes.loc[c, 'mAP50-95 BF16']:.4f}"
+              f" ({-drop:+.4f})")
+    status = "PASS" if not failed else f"FAIL, {failed} lose more than {max_drop} mAP50-95"
+    print(f"[BF16] {weights}: {result['speedup']}x faster than FP32, {status}. Report: {report_path}")
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Quantize the detection model to INT8 and validate it per class")
+    parser.add_argument("--bf16", action="store_true", help="validate CPU BF16 mode instead of exporting INT8")
+    parser.add_argument("--weights", default=MODEL_PATH)
+    parser.add_argument("--data", default=QUANT_DATA)
+    parser.add_argument("--format", default=QUANT_FORMAT, choices=["onnx", "openvino"])
+    parser.add_argument("--split", default=QUANT_SPLIT)
+    parser.add_argument("--imgsz", type=int, default=MODEL_IMGSZ)
+    parser.add_argument("--report")
+    opt = parser.parse_args()
+    if opt.bf16:
+        report = check_bf16(opt.weights, opt.data, opt.split, opt.imgsz, report_path=opt.report or BF16_REPORT_PATH)
+    else:
+        report = quantize(opt.weights, opt.data, opt.format, opt.split, opt.imgsz,
+                          report_path=opt.report or QUANT_REPORT_PATH)
+    sys.exit(0 if report["passed"] else 1)
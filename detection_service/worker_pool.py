@@ -0,0 +1,235 @@
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+
+from detection_service.cascade import build_tracker
+from yolov12.ultralytics import YOLO
+from yolov12.ultralytics.models.yolo.detect import DetectionPredictor
+from yolov12.ultralytics.nn.autobackend import AutoBackend
+from yolov12.ultralytics.trackers.basetrack import BaseTrack
+from yolov12.ultralytics.trackers.track import update_raw_results
+from yolov12.ultralytics.utils import IterableSimpleNamespace, yaml_load
+from yolov12.ultralytics.utils.checks import check_yaml
+
+TRACK_ID_LIMIT = 2**24  # trackers return ids as float32, which holds integers exactly up to 2**24
+LIVENESS_INTERVAL = 1.0  # seconds between checks for dead workers
+
+
+def split_cores(processes, threads=None, cores=None):
+    """Split `cores` (default: the cores this process may run on) into `processes` disjoint subsets of `threads`."""
+    if cores is None:
+        cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count()))
+    threads = min(threads or max(len(cores) // processes, 1), len(cores))
+    return [[cores[(i * threads + j) % len(cores)] for j in range(threads)] for i in range(processes)]
+
+
+def _worker(index, model, cores, overrides, tracker_args, id_range, tasks, results):
+    """Worker process: pinned to `cores`, one predictor on the shared model, one tracker per camera."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    torch.set_num_threads(len(cores))
+    torch.set_num_interop_threads(1)
+
+    predictor = DetectionPredictor(overrides=overrides)
+    predictor.setup_model(model, verbose=False)
+    BaseTrack._count = index * id_range  # each process has its own counter, shared by its cameras
+    trackers = {}  # camera_id -> tracker, cameras are pinned to one worker so their frames arrive in order
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        request_id, camera_id, frame = task
+        try:
+            start = time.perf_counter()
+            predictor.infer_frames([frame])  # raw=True: one structured array, no Results/Boxes objects
+            if camera_id not in trackers:
+                trackers[camera_id] = build_tracker(tracker_args)
+            update_raw_results(predictor, 0, trackers[camera_id], frame)
+            det = predictor.results[0][predictor.results[0]["track_id"] >= 0]
+            output = det["cls"].astype(int), det["xyxy"], det["track_id"].astype(int)
+            results.put((request_id, index, output, time.perf_counter() - start))
+        except Exception as e:
+            results.put((request_id, index, e, 0.0))
+
+
+class InferenceWorkerPool:
+    """Data-parallel detection + tracking over K model processes for CPU-only nodes.
+
+    One PyTorch process with many intra-op threads stops scaling long before all cores are busy, so the
+    pool runs `processes` workers, each pinned to its own subset of cores with `torch.set_num_threads`
+    set to that subset. The weights are loaded and fused once in the parent and moved to shared memory;
+    workers attach to the same tensors instead of loading their own copy. Each camera is assigned to the
+    worker with the fewest cameras on its first frame and stays there, so its frames are processed in
+    order by a single tracker while different cameras run in parallel. Track ids are unique across all
+    cameras and workers. Workers are checked every LIVENESS_INTERVAL seconds, also while others keep
+    producing results; if one dies, its pending and later frames fail instead of hanging, and `track()`
+    raises a RuntimeError after `timeout` seconds for a worker that is alive but stuck.
+    `cache_dir` and `bf16` work as in `ModelManager`; the parent applies them before sharing so workers
+    keep mapping the same tensors.
+    """
+
+    def __init__(self, weights, processes=2, threads=None, cores=None, imgsz=640, conf=0.2,
+                 tracker_cfg="bytetrack.yaml", cache_dir=None, bf16=False, timeout=60.0):
+        self.weights = str(weights)
+        self.timeout = timeout  # seconds track() waits for a frame
+        self.processes = processes
+        self.cores = split_cores(processes, threads, cores)
+        self.overrides = dict(imgsz=imgsz, conf=conf, verbose=False, save=False, mode="predict", raw=True,
+                              model_cache=str(cache_dir) if cache_dir else None, bf16=bf16)
+        self.tracker_args = IterableSimpleNamespace(**yaml_load(check_yaml(tracker_cfg)))
+        self.id_range = TRACK_ID_LIMIT // processes  # track ids of worker i start above i * id_range
+
+        self.workers = []
+        self.tasks = []           # one FIFO input queue per worker
+        self.results = None
+        self.cameras = {}         # camera_id -> worker index
+        self.pending = {}         # request_id -> (Future, worker index)
+        self.metrics = Counter()  # frames per worker and seconds of work per worker
+        self._next_request = 0
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def start(self):
+        # Fuse (with the cached layers) and convert to channels_last for bf16 once, workers find the module ready
+        model = AutoBackend(YOLO(self.weights).model, fuse=True, verbose=False, cache_dir=self.overrides["model_cache"],
+                            bf16=self.overrides["bf16"]).model.requires_grad_(False).eval()
+        model.share_memory()  # workers map these tensors instead of loading their own copy
+        ctx = mp.get_context("spawn")
+        self.results = ctx.Queue()
+        for i, cores in enumerate(self.cores):
+            tasks = ctx.Queue()
+            worker = ctx.Process(
+                target=_worker,
+                args=(i, model, cores, self.overrides, self.tracker_args, self.id_range, tasks, self.results),
+                daemon=True,
+            )
+            worker.start()
+            self.tasks.append(tasks)
+            self.workers.append(worker)
+        self._listener = threading.Thread(target=self._collect, daemon=True)
+        self._listener.start()
+        print(f"[POOL] {self.processes} workers on cores {self.cores}")
+        return self
+
+    def _collect(self):
+        checked = time.monotonic()
+        while True:
+            if time.monotonic() - checked >= LIVENESS_INTERVAL:  # also while healthy workers keep the queue busy
+                self._fail_dead_workers()
+                checked = time.monotonic()
+            try:
+                item = self.results.get(timeout=LIVENESS_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            request_id, index, output, seconds = item
+            with self._lock:
+                future, _ = self.pending.pop(request_id, (None, index))
+                self.metrics[f"frames_{index}"] += 1
+                self.metrics[f"seconds_{index}"] += seconds
+            if future is None:  # already failed as its worker was found dead
+                continue
+            if isinstance(output, Exception):
+                future.set_exception(output)
+            else:
+                future.set_result(output)
+
+    def _worker_error(self, index):
+        return RuntimeError(f"Worker {index} exited with code {self.workers[index].exitcode}")
+
+    def _fail_dead_workers(self):
+        """Fail the pending futures of workers that died (OOM kill, segfault), they would never resolve."""
+        with self._lock:
+            dead = {i for i, worker in enumerate(self.workers) if not worker.is_alive()}
+            futures = [self.pending.pop(rid) for rid in [rid for rid, (_, i) in self.pending.items() if i in dead]]
+        if futures:
+            print(f"[POOL] Workers {sorted(dead)} died, failing {len(futures)} pending frames")
+        for future, index in futures:
+            future.set_exception(self._worker_error(index))
+
+    def submit(self, frame, camera_id="default"):
+        """Queue `frame` of `camera_id`, returns a Future of (class_ids, xyxy, track_ids) like `ModelCascade.track`."""
+        future = Future()
+        with self._lock:
+            if camera_id not in self.cameras:
+                load = Counter(self.cameras.values())
+                self.cameras[camera_id] = min(range(self.processes), key=lambda i: load[i])
+            index = self.cameras[camera_id]
+            if not self.workers[index].is_alive():
+                future.set_exception(self._worker_error(index))
+                return future
+            request_id = self._next_request
+            self._next_request += 1
+            self.pending[request_id] = future, index
+        self.tasks[index].put((request_id, camera_id, frame))
+        return future
+
+    def track(self, frame, camera_id="default", timeout=None):
+        """Process `frame` of `camera_id` and wait at most `timeout` (default: the pool's) seconds for it."""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return self.submit(frame, camera_id).result(timeout=timeout)
+        except FutureTimeoutError:
+            raise RuntimeError(f"Worker {self.cameras[camera_id]} did not process a frame of '{camera_id}' "
+                               f"within {timeout}s") from None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "cameras": dict(self.cameras),
+                "pending": len(self.pending),
+                "frames": [self.metrics[f"frames_{i}"] for i in range(self.processes)],
+                "busy_seconds": [round(self.metrics[f"seconds_{i}"], 2) for i in range(self.processes)],
+            }
+
+    def close(self):
+        for tasks in self.tasks:
+            tasks.put(None)
+        for worker in self.workers:
+            worker.join(timeout=10)
+        if self.results is not None:
+            self.results.put(None)
+            self._listener.join()
+        self.workers, self.tasks = [], []
+
+
+def benchmark(weights, cameras=8, frames=30, imgsz=640, shape=(720, 1280), processes=(1, 2, 4)):
+    """Frames per second over all cameras for each number of worker processes, sharing all cores between them."""
+    rng = np.random.default_rng(0)
+    streams = [rng.integers(0, 255, (*shape, 3), dtype=np.uint8) for _ in range(cameras)]
+    results = {}
+    for k in processes:
+        pool = InferenceWorkerPool(weights, processes=k, imgsz=imgsz).start()
+        try:
+            for c, frame in enumerate(streams):  # warmup, also assigns the cameras
+                pool.track(frame, f"cam_{c}")
+            start = time.perf_counter()
+            futures = [pool.submit(frame, f"cam_{c}") for _ in range(frames) for c, frame in enumerate(streams)]
+            for future in futures:
+                future.result()
+            results[k] = cameras * frames / (time.perf_counter() - start)
+            print(f"[POOL] {k} processes x {len(pool.cores[0])} threads: {results[k]:.1f} FPS "
+                  f"{pool.stats()['frames']}")
+        finally:
+            pool.close()
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the multi-process inference pool")
+    parser.add_argument("--weights", default="models/best.pt")
+    parser.add_argument("--cameras", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    opt = parser.parse_args()
+    benchmark(opt.weights, cameras=opt.cameras, frames=opt.frames, processes=opt.processes)
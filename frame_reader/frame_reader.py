@@ -6,10 +6,11 @@ from utils.helpers import draw_rois
 from detection_service.config import ROI_ZONES
 
 VIDEO_PATH = r"samples\Sah w b3dha ghalt (3).mp4"
+CAMERA_ID = "default"  # sent with every frame, selects the camera's cascade budget and worker
 
-def publish_frame(channel, frame, frame_id):
+def publish_frame(channel, frame, frame_id, camera_id=CAMERA_ID):
     try:
-        data = pickle.dumps((frame_id, frame))
+        data = pickle.dumps((frame_id, frame, camera_id))
         channel.basic_publish(
             exchange='frames',
             routing_key='video',
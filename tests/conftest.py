@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+# Service modules import `yolov12.ultralytics`, whose own imports resolve `ultralytics` from the yolov12 folder
+for path in (ROOT, ROOT / "yolov12"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+
+from detection_service.cascade import ModelCascade
+from yolov12.ultralytics.engine.results import Boxes
+
+ROI_ZONES = {"protein_1": [400, 400, 450, 450]}
+HAND, PIZZA, SCOOPER = 0, 2, 3
+
+
+class FakeModels:
+    """ModelManager stand-in returning fixed detections per model name and counting the calls."""
+
+    def __init__(self, detections):
+        self.detections = detections  # name -> rows of (x1, y1, x2, y2, conf, cls)
+        self.calls = {name: 0 for name in detections}
+
+    def get(self, name):
+        def predict(frame, **kwargs):
+            self.calls[name] += 1
+            data = torch.tensor(self.detections[name], dtype=torch.float32).reshape(-1, 6)
+            return [SimpleNamespace(boxes=Boxes(data, frame.shape[:2]))]
+
+        return SimpleNamespace(predict=predict)
+
+
+def cascade(small, large=((100, 100, 150, 150, 0.9, HAND),), **kwargs):
+    models = FakeModels({"small": small, "default": large})
+    return models, ModelCascade(models, ROI_ZONES, budget_window=4, **kwargs)
+
+
+FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+
+
+def test_ambiguous_hand_or_scooper_escalates():
+    for cls in HAND, SCOOPER:
+        models, c = cascade([(100, 100, 150, 150, 0.3, cls)])
+        class_ids, boxes, track_ids = c.track(FRAME, "cam")
+        assert models.calls == {"small": 1, "default": 1}
+        assert c.stats()["cam"]["ambiguous_conf"] == 1 and c.stats()["cam"]["escalated"] == 1
+
+
+def test_confident_or_other_classes_stay_on_small_model():
+    for row in (100, 100, 150, 150, 0.9, HAND), (100, 100, 150, 150, 0.3, PIZZA):
+        models, c = cascade([row])
+        c.track(FRAME, "cam")
+        assert models.calls == {"small": 1, "default": 0}
+
+
+def test_hand_near_roi_escalates():
+    models, c = cascade([(420, 420, 440, 440, 0.9, HAND)])
+    c.track(FRAME, "cam")
+    assert models.calls["default"] == 1 and c.stats()["cam"]["hand_near_roi"] == 1
+
+
+def test_budget_caps_escalations_per_window():
+    models, c = cascade([(100, 100, 150, 150, 0.3, HAND)], budget=0.5)
+    for _ in range(8):
+        c.track(FRAME, "cam")
+    stats = c.stats()["cam"]
+    assert stats["frames"] == 8 and stats["ambiguous_conf"] == 8
+    assert stats["escalated"] == 4 and stats["budget_denied"] == 4  # at most 2 of every 4 frames
+    assert models.calls["default"] == 4 and stats["escalation_rate"] == 0.5
+
+
+def test_camera_budgets_and_stats_are_per_camera():
+    models, c = cascade([(100, 100, 150, 150, 0.3, HAND)], budget=1.0, camera_budgets={"cam_b": 0.0})
+    for _ in range(3):
+        c.track(FRAME, "cam_a")
+        c.track(FRAME, "cam_b")
+    stats = c.stats()
+    assert stats["cam_a"]["escalated"] == 3 and stats["cam_a"].get("budget_denied", 0) == 0
+    assert stats["cam_b"].get("escalated", 0) == 0 and stats["cam_b"]["budget_denied"] == 3
+    assert c.trackers["cam_a"] is not c.trackers["cam_b"]
+
+
+def test_track_ids_never_collide_across_cameras():
+    boxes = [(100 * i, 100, 100 * i + 50, 150, 0.9, PIZZA) for i in range(1, 4)]
+    models, c = cascade(boxes)
+    for _ in range(3):
+        ids_a = set(c.track(FRAME, "cam_a")[2].tolist())
+    assert len(ids_a) == 3
+
+    models.detections["small"] = boxes[:2]
+    ids_b = set()
+    for _ in range(3):  # adding cam_b's tracker must not restart the ids cam_a is using
+        ids_b |= set(c.track(FRAME, "cam_b")[2].tolist())
+    assert len(ids_b) == 2 and not ids_a & ids_b
+
+    models.detections["small"] = [*boxes, (500, 300, 550, 350, 0.9, PIZZA)]
+    for _ in range(3):  # a new track of cam_a gets a fresh id while its old tracks are live
+        ids = c.track(FRAME, "cam_a")[2].tolist()
+    assert len(ids) == 4 and ids_a < set(ids) and not set(ids) & ids_b
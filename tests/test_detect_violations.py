@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+import detection_service.detect_violations as dv
+from detection_service.cascade import ModelCascade
+from detection_service.model_manager import ModelManager
+from yolov12.ultralytics import YOLO
+from yolov12.ultralytics.engine.results import Boxes
+
+HAND, PIZZA = 0, 2
+
+
+class FakeModels:
+    """ModelManager stand-in whose model returns the rows of `detections` (x1, y1, x2, y2, conf, cls).
+
+    `track()` returns no detections and gives the predictor a tracker named after the model, `used` lists the names
+    of the models that ran, in order.
+    """
+
+    def __init__(self):
+        self.detections = []
+        self.calls = 0
+        self.used = []
+
+    def get(self, name="default"):
+        def predict(frame, **kwargs):
+            self.calls += 1
+            self.used.append(name)
+            data = torch.tensor(self.detections, dtype=torch.float32).reshape(-1, 6)
+            return [SimpleNamespace(boxes=Boxes(data, frame.shape[:2]))]
+
+        def track(frame, **kwargs):
+            self.used.append(name)
+            model.predictor.trackers = [f"{name}_tracker"]
+            return []
+
+        model = SimpleNamespace(predict=predict, track=track, predictor=SimpleNamespace())
+        return model
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    """detect_violations with fresh per-camera state, a cascade on FakeModels and the snapshot in `tmp_path`."""
+    models = FakeModels()
+    cascade = ModelCascade(models, {}, small_name="default", escalate_classes=(), hand_class=-1, conf=0.1)
+    monkeypatch.setattr(dv, "cascade", cascade)
+    monkeypatch.setattr(dv, "SNAPSHOT_PATH", str(tmp_path / "snapshot.npz"))
+    for name in ("roi_entry_log", "hand_roi_appearances", "last_violation_frame", "virtual_trackers",
+                 "motion_gates", "last_detections", "yolo_trackers"):
+        monkeypatch.setattr(dv, name, {})
+    return models
+
+
+def frame(value=64):
+    return np.full((480, 640, 3), value, dtype=np.uint8)
+
+
+def test_detect_keeps_detections_and_tracks_per_camera(service, monkeypatch):
+    monkeypatch.setattr(dv, "MOTION_GATE_ENABLED", False)
+    service.detections = [(100, 100, 150, 150, 0.9, HAND)]
+    a = dv.detect(frame(), "cam_a")
+    service.detections = [(300, 300, 360, 360, 0.9, PIZZA), (400, 100, 450, 150, 0.9, HAND)]
+    b = dv.detect(frame(), "cam_b")
+    assert len(a) == 1 and len(b) == 2 and not set(a) & set(b)
+    assert dv.last_detections == {"cam_a": a, "cam_b": b}
+    assert set(dv.cascade.trackers) == {"cam_a", "cam_b"}
+
+
+def test_snapshot_restores_state_per_camera(service):
+    for camera_id, box in ("cam_a", [100, 100, 150, 150]), ("rtsp://10.0.0.2/stream", [400, 100, 450, 150]):
+        dv.virtual_tracker(camera_id).update({1: {"label": "Hand", "bbox": box}})
+    dv.roi_entry_log["cam_a"] = {1: {"roi_id": "protein_1", "entry_frame": 10, "last_seen": 12,
+                                     "touched_pizza": True, "used_scooper": False, "scooper_id": None}}
+    dv.hand_roi_appearances.update({"cam_a": {1: [10, 11, 12]}, "rtsp://10.0.0.2/stream": {1: [5]}})
+    dv.last_violation_frame["rtsp://10.0.0.2/stream"] = {1: 7}
+    expected = {name: getattr(dv, name).copy() for name in ("roi_entry_log", "hand_roi_appearances",
+                                                            "last_violation_frame")}
+    dv.snapshot_state()
+
+    for state in dv.roi_entry_log, dv.hand_roi_appearances, dv.last_violation_frame, dv.virtual_trackers:
+        state.clear()
+    assert dv.restore_state()
+    assert {name: getattr(dv, name) for name in expected} == expected
+    assert dv.virtual_tracker("rtsp://10.0.0.2/stream").get_path(1) == [(425.0, 125.0)]
+    assert dv.virtual_tracker("cam_a").get_path(1) == [(125.0, 125.0)]
+
+
+def test_default_model_tracks_each_camera_separately(service, monkeypatch, tmp_path):
+    YOLO("yolo11n.yaml").save(tmp_path / "model.pt")
+    models = ModelManager(imgsz=64)
+    models.register("default", tmp_path / "model.pt")
+    monkeypatch.setattr(dv, "models", models)
+    monkeypatch.setattr(dv, "cascade", None)
+    monkeypatch.setattr(dv, "MOTION_GATE_ENABLED", False)
+    monkeypatch.setitem(dv.TRACK_ARGS, "imgsz", 64)
+    for camera_id in "cam_a", "cam_b", "cam_a":
+        dv.detect(frame(), camera_id)
+        assert models.get().predictor.trackers[0] is dv.yolo_trackers[camera_id]
+    assert set(dv.yolo_trackers) == {"cam_a", "cam_b"}
+    assert dv.yolo_trackers["cam_a"] is not dv.yolo_trackers["cam_b"]
+
+
+def test_detect_uses_the_model_of_each_camera_type(service, monkeypatch):
+    monkeypatch.setattr(dv, "models", service)
+    monkeypatch.setattr(dv, "cascade", None)
+    monkeypatch.setattr(dv, "MOTION_GATE_ENABLED", False)
+    monkeypatch.setattr(dv, "CAMERA_MODELS", {"overhead": "overhead.pt"})
+    monkeypatch.setattr(dv, "CAMERA_TYPES", {"cam_top": "overhead", "cam_side": "unregistered"})
+    for camera_id in "cam_top", "cam_side", "cam_other":
+        assert dv.detect(frame(), camera_id) == {}
+    assert service.used == ["overhead", "default", "default"]
+    assert dv.yolo_trackers["cam_top"] == "overhead_tracker" and dv.yolo_trackers["cam_side"] == "default_tracker"
+
+
+def test_motion_gate_with_interleaved_cameras(service):
+    static = np.full((720, 1280, 3), 64, dtype=np.uint8)
+    moving = [static.copy() for _ in range(2)]
+    moving[1][535:575, 420:460] = 255  # a hand flickering in protein_1
+    rows = {"cam_a": [(600, 200, 700, 300, 0.9, PIZZA)], "cam_b": [(420, 535, 460, 575, 0.9, HAND)]}
+    results = {"cam_a": [], "cam_b": []}
+    for i in range(4):
+        for camera_id, im in ("cam_a", static), ("cam_b", moving[i % 2]):
+            service.detections = rows[camera_id]
+            results[camera_id].append(dv.detect(im, camera_id))
+
+    # cam_a is static and only inferred on its first frame, cam_b's motion does not wake it up
+    assert service.calls == 1 + 4
+    assert dv.motion_gates["cam_a"].stats()["skipped"] == 3 and dv.motion_gates["cam_b"].stats()["skipped"] == 0
+    # Skipped frames of cam_a return its own tracks advanced by its own tracker, never cam_b's detections
+    ids_a = {track.track_id for track in dv.cascade.trackers["cam_a"].tracked_stracks}
+    for detections in results["cam_a"]:
+        assert set(detections) == ids_a
+        assert [obj["label"] for obj in detections.values()] == ["Pizza"]
+        assert np.allclose(next(iter(detections.values()))["bbox"], rows["cam_a"][0][:4], atol=1)
+    assert all([obj["label"] for obj in detections.values()] == ["Hand"] for detections in results["cam_b"])
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from detection_service.model_manager import ModelManager
+from yolov12.ultralytics import YOLO
+
+FRAME = np.zeros((64, 64, 3), dtype=np.uint8)
+
+
+@pytest.fixture(scope="module")
+def weights(tmp_path_factory):
+    """Two weights files of a small untrained model."""
+    root = tmp_path_factory.mktemp("weights")
+    for name in "a.pt", "b.pt":
+        YOLO("yolo11n.yaml").save(root / name)
+    return str(root / "a.pt"), str(root / "b.pt")
+
+
+def manager(weights):
+    models = ModelManager(imgsz=64)
+    models.register("default", weights[0])
+    models.register("overhead", weights[0])
+    models.register("side", weights[1])
+    return models
+
+
+def test_get_loads_lazily_and_warms_up(weights):
+    models = manager(weights)
+    assert models.models == {}
+    model = models.get("side")
+    assert list(models.models) == ["side"] and model.predictor is not None  # warmed up
+    assert models.get("side") is model
+    with pytest.raises(KeyError):
+        models.get("missing")
+    models.load_all()
+    assert set(models.models) == {"default", "overhead", "side"}
+
+
+def test_names_on_one_file_share_weights(weights):
+    models = manager(weights)
+    models.load_all()
+    default, overhead, side = (models.get(n) for n in ("default", "overhead", "side"))
+    assert default.model is overhead.model and default.predictor is not overhead.predictor
+    assert side.model is not default.model
+
+
+def test_reload_keeps_weights_shared_and_trackers(weights):
+    models = manager(weights)
+    models.load_all()
+    old = models.get("default")
+    old.track(FRAME, persist=True, imgsz=64, verbose=False)
+    trackers = old.predictor.trackers
+
+    models.reload_all(background=False)
+    default, overhead, side = (models.get(n) for n in ("default", "overhead", "side"))
+    assert default is not old and default.model is not old.model  # fresh weights
+    assert default.model is overhead.model and side.model is not default.model  # still one copy per file
+    assert default.predictor.trackers is trackers  # tracker state carried over
+    default.track(FRAME, persist=True, imgsz=64, verbose=False)
+    assert default.predictor.trackers is trackers
+
+
+def test_swap_to_other_weights_joins_their_names(weights):
+    models = manager(weights)
+    models.load_all()
+    models.swap("overhead", weights[1], background=False)
+    assert models.get("overhead").model is models.get("side").model
+    assert models.get("default").model is not models.get("side").model
+    assert set(models._bases) == set(weights)
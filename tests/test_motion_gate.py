@@ -0,0 +1,59 @@
+import numpy as np
+
+from utils.motion_gate import MotionGate
+
+ZONES = {"protein_1": [100, 100, 160, 160]}
+
+
+def frame(box=None, value=255):
+    """Gray 320x240 BGR frame with an optional bright rectangle (x1, y1, x2, y2)."""
+    im = np.full((240, 320, 3), 64, dtype=np.uint8)
+    if box is not None:
+        x1, y1, x2, y2 = box
+        im[y1:y2, x1:x2] = value
+    return im
+
+
+def gate(**kwargs):
+    return MotionGate(zones=ZONES, scale=0.5, padding=10, **{"refresh_interval": 100, **kwargs})
+
+
+def test_first_frame_then_static_frames_are_skipped():
+    g = gate()
+    assert g.should_infer(frame())  # no reference yet
+    assert not any(g.should_infer(frame()) for _ in range(5))
+
+
+def test_motion_inside_roi_triggers_inference():
+    g = gate()
+    g.should_infer(frame())
+    assert g.should_infer(frame((110, 110, 140, 140)))
+    assert not g.should_infer(frame((110, 110, 140, 140)))  # the moved-in object is the new reference
+
+
+def test_motion_outside_watched_zones_is_ignored():
+    g = gate()
+    g.should_infer(frame())
+    assert not g.should_infer(frame((250, 10, 310, 60)))  # far from the padded ROI
+    assert g.last_changed_ratio == 0.0
+
+
+def test_prep_zones_are_watched_like_rois():
+    g = MotionGate(zones={**ZONES, "prep_table": [240, 0, 320, 80]}, scale=0.5, padding=10, refresh_interval=100)
+    g.should_infer(frame())
+    assert g.should_infer(frame((250, 10, 310, 60)))
+
+
+def test_refresh_interval_forces_inference():
+    g = gate(refresh_interval=4)
+    decisions = [g.should_infer(frame()) for _ in range(9)]
+    assert decisions == [True, False, False, False, True, False, False, False, True]
+
+
+def test_stats_count_skips():
+    g = gate(refresh_interval=4)
+    for _ in range(8):
+        g.should_infer(frame())
+    stats = g.stats()
+    assert stats["frames"] == 8 and stats["inferred"] == 2 and stats["skipped"] == 6
+    assert stats["skip_rate"] == 0.75 and stats["inferred"] + stats["skipped"] == stats["frames"]
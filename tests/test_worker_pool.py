@@ -0,0 +1,119 @@
+import os
+import signal
+import threading
+
+import numpy as np
+import pytest
+
+from detection_service.worker_pool import InferenceWorkerPool, split_cores
+from yolov12.ultralytics import YOLO
+
+
+@pytest.fixture(scope="module")
+def weights(tmp_path_factory):
+    """Weights file of a small untrained model."""
+    path = tmp_path_factory.mktemp("weights") / "pool.pt"
+    YOLO("yolo11n.yaml").save(path)
+    return str(path)
+
+
+def test_split_cores():
+    assert split_cores(2, cores=[0, 1, 2, 3]) == [[0, 1], [2, 3]]
+    assert split_cores(4, threads=1, cores=[0, 1]) == [[0], [1], [0], [1]]
+
+
+def test_two_workers_keep_camera_order(weights, tmp_path):
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 255, (64, 96, 3), dtype=np.uint8) for _ in range(6)]
+    cameras = ["cam_0", "cam_1", "cam_2", "cam_3"]
+    done = []  # (camera, frame index) in completion order
+    pool = InferenceWorkerPool(weights, processes=2, threads=1, imgsz=64, cache_dir=tmp_path, bf16=False).start()
+    try:
+        futures = []
+        for i, frame in enumerate(frames):
+            for camera in cameras:
+                future = pool.submit(frame, camera)
+                future.add_done_callback(lambda _, key=(camera, i): done.append(key))
+                futures.append(future)
+        for future in futures:
+            class_ids, xyxy, track_ids = future.result(timeout=120)
+            assert len(class_ids) == len(xyxy) == len(track_ids) and xyxy.shape[1:] == (4,)
+        stats = pool.stats()
+    finally:
+        pool.close()
+
+    assert sorted(stats["cameras"].values()) == [0, 0, 1, 1]
+    assert stats["frames"] == [12, 12] and stats["pending"] == 0
+    for camera in cameras:
+        assert [i for c, i in done if c == camera] == list(range(len(frames)))
+    assert list(tmp_path.iterdir())  # fused layers cached by the parent
+
+
+def test_track_ids_are_unique_across_cameras_and_workers(weights, tmp_path):
+    cfg = tmp_path / "tracker.yaml"  # the untrained model scores ~0, track everything it returns
+    cfg.write_text("tracker_type: bytetrack\ntrack_high_thresh: 0.0\ntrack_low_thresh: 0.0\nnew_track_thresh: 0.0\n"
+                   "track_buffer: 30\nmatch_thresh: 0.8\nfuse_score: True\n")
+    frame = np.random.default_rng(0).integers(0, 255, (64, 96, 3), dtype=np.uint8)
+    cameras = ["cam_0", "cam_1", "cam_2", "cam_3"]
+    pool = InferenceWorkerPool(weights, processes=2, threads=1, imgsz=64, conf=0.0, tracker_cfg=str(cfg)).start()
+    try:
+        ids = {camera: set() for camera in cameras}
+        for _ in range(3):
+            for camera in cameras:
+                ids[camera] |= set(pool.track(frame, camera)[2].tolist())
+        workers = pool.stats()["cameras"]
+    finally:
+        pool.close()
+
+    assert all(ids.values())
+    for i, a in enumerate(cameras):
+        assert all(tid // pool.id_range == workers[a] for tid in ids[a])
+        assert not any(ids[a] & ids[b] for b in cameras[i + 1 :])
+
+
+def test_dead_worker_fails_its_frames(weights):
+    frame = np.zeros((64, 96, 3), dtype=np.uint8)
+    pool = InferenceWorkerPool(weights, processes=2, threads=1, imgsz=64).start()
+    try:
+        pool.track(frame, "cam_0")
+        pool.track(frame, "cam_1")
+        worker = pool.workers[pool.cameras["cam_0"]]
+        os.kill(worker.pid, signal.SIGSTOP)  # hold the frame below in its queue, then kill the worker
+        pending = pool.submit(frame, "cam_0")
+        os.kill(worker.pid, signal.SIGKILL)
+        with pytest.raises(RuntimeError, match="exited with code"):
+            pending.result(timeout=30)
+        with pytest.raises(RuntimeError, match="exited with code"):
+            pool.track(frame, "cam_0")
+        assert len(pool.track(frame, "cam_1")) == 3  # the other worker keeps running
+        assert pool.stats()["pending"] == 0
+    finally:
+        pool.close()
+
+
+def test_dead_worker_is_found_while_others_stay_busy(weights):
+    frame = np.zeros((64, 96, 3), dtype=np.uint8)
+    pool = InferenceWorkerPool(weights, processes=2, threads=1, imgsz=64).start()
+    stop = threading.Event()
+    try:
+        pool.track(frame, "cam_0")
+        pool.track(frame, "cam_1")
+        worker = pool.workers[pool.cameras["cam_0"]]
+        os.kill(worker.pid, signal.SIGSTOP)
+        with pytest.raises(RuntimeError, match="did not process"):  # alive but stuck
+            pool.track(frame, "cam_0", timeout=1.0)
+
+        def busy():  # the other worker keeps the results queue from ever going idle
+            while not stop.is_set():
+                pool.track(frame, "cam_1")
+
+        feeder = threading.Thread(target=busy, daemon=True)
+        feeder.start()
+        pending = pool.submit(frame, "cam_0")
+        os.kill(worker.pid, signal.SIGKILL)
+        with pytest.raises(RuntimeError, match="exited with code"):
+            pending.result(timeout=10)
+        assert feeder.is_alive()
+    finally:
+        stop.set()
+        pool.close()
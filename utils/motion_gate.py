@@ -0,0 +1,88 @@
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Cheap change detector that decides whether a frame needs a fresh YOLO pass.
+
+    Frames are downscaled, converted to blurred grayscale and compared against the
+    last frame that was actually sent to the model, only inside the watched zones.
+    A frame is skipped when the fraction of changed pixels stays below
+    `min_changed_ratio`; a refresh is forced every `refresh_interval` frames.
+    """
+
+    def __init__(self, zones=None, scale=0.25, pixel_threshold=25, min_changed_ratio=0.002,
+                 refresh_interval=30, padding=20):
+        self.zones = zones or {}
+        self.scale = scale
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_ratio = min_changed_ratio
+        self.refresh_interval = refresh_interval
+        self.padding = padding
+
+        self.reference = None  # downscaled gray frame of the last inferred frame
+        self.mask = None
+        self.frames_since_inference = 0
+        self.last_changed_ratio = 0.0
+        self.frames = 0
+        self.inferred = 0
+        self.skipped = 0
+
+    def _prepare(self, frame):
+        small = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+        return cv2.GaussianBlur(gray, (5, 5), 0)
+
+    def _build_mask(self, shape):
+        h, w = shape
+        if not self.zones:
+            return np.ones((h, w), dtype=bool)
+        mask = np.zeros((h, w), dtype=bool)
+        for x1, y1, x2, y2 in self.zones.values():
+            sx1 = max(0, int((x1 - self.padding) * self.scale))
+            sy1 = max(0, int((y1 - self.padding) * self.scale))
+            sx2 = min(w, int(np.ceil((x2 + self.padding) * self.scale)))
+            sy2 = min(h, int(np.ceil((y2 + self.padding) * self.scale)))
+            mask[sy1:sy2, sx1:sx2] = True
+        return mask
+
+    def should_infer(self, frame, force=False):
+        """Return True if `frame` must go through the model, False if the last detections can be reused."""
+        self.frames += 1
+        gray = self._prepare(frame)
+
+        if self.reference is None or self.reference.shape != gray.shape:
+            self.mask = self._build_mask(gray.shape)
+            force = True
+
+        if not force and self.frames_since_inference + 1 < self.refresh_interval:
+            diff = cv2.absdiff(gray, self.reference)
+            changed = np.count_nonzero((diff > self.pixel_threshold) & self.mask)
+            self.last_changed_ratio = changed / max(1, np.count_nonzero(self.mask))
+            if self.last_changed_ratio < self.min_changed_ratio:
+                self.frames_since_inference += 1
+                self.skipped += 1
+                return False
+
+        self.reference = gray
+        self.frames_since_inference = 0
+        self.inferred += 1
+        return True
+
+    @property
+    def skip_rate(self):
+        return self.skipped / self.frames if self.frames else 0.0
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "inferred": self.inferred,
+            "skipped": self.skipped,
+            "skip_rate": round(self.skip_rate, 4),
+            "last_changed_ratio": round(float(self.last_changed_ratio), 6),
+        }
+
+    def reset(self):
+        self.reference = None
+        self.mask = None
+        self.frames_since_inference = 0
@@ -42,6 +42,27 @@ class VirtualIDTracker:
         self.positions = new_positions
         return updated_map
 
+    def state_dict(self):
+        """Return the id counter, id map and position histories as flat arrays (see `load_state_dict`)."""
+        vids = list(self.positions)
+        return {
+            "next_id": self.next_id,
+            "real_ids": np.array(list(self.object_map), dtype=np.int64),
+            "mapped_ids": np.array(list(self.object_map.values()), dtype=np.int64),
+            "virtual_ids": np.array(vids, dtype=np.int64),
+            "lengths": np.array([len(self.positions[v]) for v in vids], dtype=np.int64),
+            "centers": np.array([c for v in vids for c in self.positions[v]], dtype=np.float64).reshape(-1, 2),
+        }
+
+    def load_state_dict(self, state):
+        self.next_id = int(state["next_id"])
+        self.object_map = dict(zip(state["real_ids"].tolist(), state["mapped_ids"].tolist()))
+        centers = np.split(state["centers"], np.cumsum(state["lengths"])[:-1])
+        self.positions = {
+            vid: deque(map(tuple, c.tolist()), maxlen=self.max_history)
+            for vid, c in zip(state["virtual_ids"].tolist(), centers)
+        }
+
     def get_velocity(self, virtual_id):
         if virtual_id not in self.positions or len(self.positions[virtual_id]) < 2:
             return 0.0
@@ -74,7 +74,15 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
 
     # Remove files
     models = [path for x in ["*.onnx", "*.torchscript"] for path in WEIGHTS_DIR.rglob(x)]
-    for file in ["decelera_portrait_min.mov", "bus.jpg", "yolo11n.onnx", "yolo11n.torchscript"] + models:
+    files = [
+        "decelera_portrait_min.mov",
+        "bus.jpg",
+        "yolo11n.onnx",
+        "yolo11n_int8.onnx",
+        "yolo11n.torchscript",
+        "yolov12n.onnx",
+    ]
+    for file in files + models:
         Path(file).unlink(missing_ok=True)
 
     # Remove directories
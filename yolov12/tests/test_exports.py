@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from tests import MODEL, SOURCE
+from tests import CFG, MODEL, SOURCE
 from ultralytics import YOLO
 from ultralytics.cfg import TASK2DATA, TASK2MODEL, TASKS
 from ultralytics.utils import (
@@ -32,6 +32,106 @@ def test_export_onnx():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+def test_export_onnx_attention_mha():
+    """Test that attention='mha' exports YOLOv12 area attention as fused MultiHeadAttention ops matching 'sdpa'."""
+    import numpy as np
+    import onnx
+    import onnxruntime
+
+    model = YOLO("yolov12n.yaml")
+    im = np.random.default_rng(0).random((1, 3, 64, 64), dtype=np.float32)
+    outputs = {}
+    for attention in ("sdpa", "mha"):
+        file = model.export(format="onnx", imgsz=64, attention=attention)
+        ops = [node.op_type for node in onnx.load(file).graph.node]
+        assert ("MultiHeadAttention" in ops) == (attention == "mha") and "Softmax" in ops  # Detect DFL softmax
+        session = onnxruntime.InferenceSession(file, providers=["CPUExecutionProvider"])
+        outputs[attention] = session.run(None, {"images": im})[0]
+    assert np.allclose(outputs["mha"], outputs["sdpa"], atol=1e-3)
+
+
+def test_export_onnx_int8(tmp_path):
+    """Test INT8 ONNX export calibrated on a local dataset keeps the model metadata and runs inference."""
+    import onnx
+
+    from ultralytics.utils import ASSETS
+
+    (tmp_path / "images").mkdir()
+    (tmp_path / "labels").mkdir()
+    for name in ("bus", "zidane"):
+        shutil.copy(ASSETS / f"{name}.jpg", tmp_path / "images")
+        (tmp_path / "labels" / f"{name}.txt").write_text("0 0.5 0.5 0.2 0.4\n")
+    data = tmp_path / "data.yaml"
+    data.write_text(f"path: {tmp_path}\ntrain: images\nval: images\nnames:\n  0: Hand\n")
+
+    file = YOLO(CFG).export(format="onnx", imgsz=64, int8=True, data=str(data))
+    assert file.endswith("_int8.onnx")
+    model = onnx.load(file)
+    assert any(node.op_type == "QuantizeLinear" for node in model.graph.node)
+    assert {p.key for p in model.metadata_props} >= {"names", "stride", "imgsz"}
+    YOLO(file)(SOURCE, imgsz=64)  # exported model inference
+
+
+def test_onnx_io_binding():
+    """Test that ONNX Runtime outputs are bound to reused tensors that match session.run, with session options."""
+    import numpy as np
+    import torch
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    file = YOLO(CFG).export(format="onnx", imgsz=64, dynamic=True)
+    backend = AutoBackend(file, session_options={"intra_op_threads": 1, "graph_optimization": "basic"})
+    im = torch.rand(2, 3, 64, 64)
+    y0, y1 = backend(im), backend(im)  # the first call with a new shape lets ONNX Runtime allocate the outputs
+    assert y1.data_ptr() == backend(im).data_ptr()  # preallocated outputs reused for the same shape
+    assert np.allclose(y0.numpy(), backend.session.run(None, {"images": im.numpy()})[0], atol=1e-5)
+    assert torch.allclose(y0, y1) and backend(im[:1]).shape[0] == 1
+    with pytest.raises(ValueError):
+        AutoBackend(file, session_options={"execution_mode": "async"})
+
+
+def test_export_onnx_nms(tmp_path):
+    """Test that an ONNX export with nms=True takes uint8 frames and matches the Python pre and postprocessing."""
+    import cv2
+    import numpy as np
+
+    model = YOLO(CFG)
+    args = dict(imgsz=64, conf=0.0, max_det=20)
+    file = shutil.move(model.export(format="onnx", nms=True, **args), tmp_path / "nms.onnx")
+    reference = YOLO(model.export(format="onnx", imgsz=64))
+    e2e = YOLO(file, task="detect")
+
+    frame = cv2.imread(str(SOURCE))[:64, :48]  # letterbox only pads, resizing is not bit-exact with cv2
+    boxes = e2e(frame)[0].boxes.data
+    assert e2e.predictor.model.frame_input and len(boxes)
+    assert np.allclose(boxes.numpy(), reference(frame, **args)[0].boxes.data.numpy(), atol=1e-3)
+
+    frame = cv2.imread(str(SOURCE))  # dynamic frame shape, boxes in frame coordinates
+    boxes = e2e(frame)[0].boxes.xyxy
+    assert (boxes >= 0).all() and (boxes[:, 2] <= frame.shape[1]).all() and (boxes[:, 3] <= frame.shape[0]).all()
+
+
+def test_model_cache(tmp_path):
+    """Test that fused PyTorch models and optimized ONNX Runtime graphs are cached and reused with equal outputs."""
+    import torch
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    model = YOLO(CFG)
+    model.save(tmp_path / "model.pt")
+    im = torch.rand(1, 3, 64, 64)
+    for file in tmp_path / "model.pt", model.export(format="onnx", imgsz=64, dynamic=True):
+        y = AutoBackend(file)(im)[0]
+        built = AutoBackend(file, cache_dir=tmp_path / "cache")
+        cached = AutoBackend(file, cache_dir=tmp_path / "cache")
+        assert len(list((tmp_path / "cache").glob(f"*{Path(file).suffix}"))) == 1
+        assert torch.allclose(built(im)[0], y, atol=1e-4) and torch.allclose(cached(im)[0], y, atol=1e-4)
+
+    model = YOLO(tmp_path / "model.pt")  # in-memory module loaded from a cached file is fused with the cached layers
+    model.predict(SOURCE, imgsz=64, model_cache=tmp_path / "cache")
+    assert model.predictor.model.model.is_fused()
+
+
 @pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
 def test_export_openvino():
     """Test YOLO exports to OpenVINO format for model inference compatibility."""
@@ -39,6 +139,58 @@ def test_export_openvino():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+@pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
+def test_openvino_async_queue():
+    """Test that batches submitted to the persistent OpenVINO infer queue match synchronous inference."""
+    import torch
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    file = YOLO(MODEL).export(format="openvino", imgsz=32)
+    model = AutoBackend(file, performance_hint="THROUGHPUT")
+    assert model.asynchronous
+    batches = [torch.rand(2, 3, 32, 32) for _ in range(3)]
+    futures = [model.submit(im) for im in batches]  # all batches in flight at once
+    queue = model.ov_queue
+    for im, future in zip(batches, futures):
+        assert torch.allclose(future.result(), model(im), atol=1e-4)
+    assert model.ov_queue is queue  # one queue for the lifetime of the backend
+    YOLO(file)([SOURCE] * 3, imgsz=32, pipeline=2)  # pipelined prediction on submitted batches
+
+
+def test_openvino_async_callback_errors():
+    """Test that an error in an OpenVINO infer request callback fails the submitted batch instead of hanging it."""
+    import threading
+    from types import SimpleNamespace
+
+    import torch
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    class InferQueue:
+        """AsyncInferQueue stand-in running the callback in another thread, outputs are the per-channel sums."""
+
+        def __init__(self, callback, fail=None):
+            self.callback, self.fail, self.started = callback, fail, 0
+
+        def start_async(self, inputs, userdata):
+            data = None if self.started == self.fail else inputs["images"].sum((2, 3))  # None.copy() raises
+            request = SimpleNamespace(output_tensors=[SimpleNamespace(data=data)])
+            threading.Thread(target=self.callback, args=(request, userdata)).start()
+            self.started += 1
+
+    model = AutoBackend.__new__(AutoBackend)  # no OpenVINO model, only the attributes used by submit()
+    torch.nn.Module.__init__(model)
+    model.__dict__.update(ov_lock=threading.Lock(), input_name="images", names={0: "a"}, task="detect", device="cpu")
+    im = torch.rand(3, 3, 8, 8)
+    model.ov_queue = InferQueue(model._ov_callback)
+    assert torch.allclose(model.submit(im).result(timeout=10), im.sum((2, 3)))
+    for fail in 0, 2:
+        model.ov_queue = InferQueue(model._ov_callback, fail)
+        with pytest.raises(AttributeError):
+            model.submit(im).result(timeout=10)
+
+
 @pytest.mark.slow
 @pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
 @pytest.mark.parametrize(
@@ -197,6 +197,333 @@ def test_track_stream():
         model.track(video_url, imgsz=160, tracker=tracker)
 
 
+def test_predict_raw():
+    """Test that raw=True returns structured detection arrays matching the boxes of regular Results."""
+    from ultralytics.engine.results import RAW_DETECTIONS_DTYPE
+
+    model = YOLO(CFG)
+    results = model.predict([SOURCE, SOURCE], imgsz=64, conf=0.0)
+    raw = model.predict([SOURCE, SOURCE], imgsz=64, conf=0.0, raw=True)
+    assert len(raw) == 2
+    for r, det in zip(results, raw):
+        assert isinstance(det, np.ndarray) and det.dtype == RAW_DETECTIONS_DTYPE
+        assert np.allclose(det["xyxy"], r.boxes.xyxy.cpu().numpy())
+        assert np.allclose(det["conf"], r.boxes.conf.cpu().numpy())
+        assert (det["cls"] == r.boxes.cls.cpu().numpy()).all()
+        assert (det["track_id"] == -1).all()
+    assert not isinstance(model.predict(SOURCE, imgsz=64)[0], np.ndarray)  # raw does not stick to later calls
+
+
+def test_predict_infer_frames():
+    """Test that BasePredictor.infer_frames matches a regular predict call and reuses its source setup."""
+    model = YOLO(CFG)
+    im = cv2.imread(str(SOURCE))
+    raw = model.predict(im, imgsz=64, conf=0.0, raw=True)[0]
+    assert np.array_equal(model.predictor.infer_frames([im])[0], raw)
+    dataset = model.predictor.dataset
+    assert len(model.predictor.infer_frames([im, im])) == 2
+    assert model.predictor.dataset is dataset  # source is set up once
+
+
+@pytest.mark.parametrize("sparse_match", [False, True])
+def test_array_byte_tracker(sparse_match):
+    """Test that ArrayBYTETracker returns the same tracks as BYTETracker on a synthetic sequence."""
+    from ultralytics.trackers import ArrayBYTETracker, BYTETracker
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.benchmarks import synthetic_track_sequence
+    from ultralytics.utils.checks import check_yaml
+
+    args = IterableSimpleNamespace(**yaml_load(check_yaml("bytetrack.yaml")))
+    sequence = synthetic_track_sequence(30, 60, noise=4, miss=0.15)
+
+    tracker = BYTETracker(args)
+    expected = [tracker.update(det) for det in sequence]
+    tracker = ArrayBYTETracker(IterableSimpleNamespace(**vars(args), sparse_match=sparse_match), capacity=4)
+    for det, ref in zip(sequence, expected):
+        out = tracker.update(det)
+        assert out.shape == ref.reshape(-1, 8).shape
+        assert np.allclose(out, ref.reshape(-1, 8), atol=1e-3)
+    assert [t.track_id for t in tracker.tracked_stracks if t.is_activated] == out[:, 4].astype(int).tolist()
+
+
+@pytest.mark.parametrize("kf_type", ["xyah", "xywh"])
+def test_kalman_filter_batched(kf_type):
+    """Test that the batched Kalman filter project, update and gating methods match the per-track methods."""
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH, KalmanFilterXYWH
+
+    kf = {"xyah": KalmanFilterXYAH, "xywh": KalmanFilterXYWH}[kf_type]()
+    rng = np.random.default_rng(0)
+    measurements = rng.uniform(1, 100, (16, 4))
+    states = [kf.predict(*kf.initiate(m)) for m in measurements]
+    mean = np.stack([m for m, _ in states])
+    covariance = np.stack([c for _, c in states])
+    observed = measurements + rng.normal(0, 2, measurements.shape)
+
+    projected = kf.multi_project(mean, covariance)
+    updated = kf.multi_update(mean, covariance, observed)
+    for i, (m, c) in enumerate(states):
+        for batched, single in zip((projected[0][i], projected[1][i]), kf.project(m, c)):
+            assert np.allclose(batched, single)
+        for batched, single in zip((updated[0][i], updated[1][i]), kf.update(m, c, observed[i])):
+            assert np.allclose(batched, single)
+
+    for only_position in (False, True):
+        for metric in ("gaussian", "maha"):
+            batched = kf.multi_gating_distance(mean, covariance, observed, only_position, metric)
+            single = np.stack([kf.gating_distance(m, c, observed, only_position, metric) for m, c in states])
+            assert batched.shape == (16, 16)
+            assert np.allclose(batched, single)
+    with pytest.raises(ValueError):
+        kf.multi_gating_distance(mean, covariance, observed, metric="l1")
+
+
+def test_partitioned_tracker():
+    """Test that PartitionedTracker tracks each configured class like a separate ArrayBYTETracker with its settings."""
+    from types import SimpleNamespace
+
+    from ultralytics.trackers import ArrayBYTETracker, PartitionedTracker
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.benchmarks import synthetic_track_sequence
+    from ultralytics.utils.checks import check_yaml
+
+    cfg = yaml_load(check_yaml("bytetrack_partitioned.yaml"))
+    overrides = {"track_buffer": 10, "match_thresh": 0.9, "std_weight_velocity": 1 / 80}
+    sequence = synthetic_track_sequence(40, 40, num_classes=4, fixed_cls=True)
+
+    tracker = PartitionedTracker(IterableSimpleNamespace(**{**cfg, "partitions": {0: overrides}}))
+    reference = ArrayBYTETracker(IterableSimpleNamespace(**{**cfg, **overrides}))
+    assert tracker.trackers[0].kalman_filter._std_weight_velocity == 1 / 80
+    for det in sequence:
+        tracks = tracker.update(det)
+        assert len(np.unique(tracks[:, 4])) == len(tracks)  # ids are unique across partitions
+        assert np.all(det.cls[tracks[:, 7].astype(int)] == tracks[:, 6])  # no track switched class
+        idx = np.flatnonzero(det.cls == 0)
+        expected = reference.update(SimpleNamespace(xywh=det.xywh[idx], conf=det.conf[idx], cls=det.cls[idx]))
+        assert np.allclose(tracks[tracks[:, 6] == 0, :4], expected[:, :4])
+        assert np.array_equal(tracks[tracks[:, 6] == 0, 7], idx[expected[:, 7].astype(int)])
+
+
+def test_tracker_state_snapshot(tmp_path):
+    """Test that a tracker restored from a snapshot continues exactly like the tracker that was never stopped."""
+    from ultralytics.trackers import PartitionedTracker
+    from ultralytics.trackers.utils.snapshot import load_state, save_state
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.benchmarks import synthetic_track_sequence
+    from ultralytics.utils.checks import check_yaml
+
+    cfg = IterableSimpleNamespace(**{**yaml_load(check_yaml("bytetrack_partitioned.yaml")), "partitions": {0: None}})
+    sequence = synthetic_track_sequence(40, 40, miss=0.2, fixed_cls=True)
+
+    tracker = PartitionedTracker(cfg)  # trackers share one id counter, so they are run one after another
+    expected = [tracker.update(det) for det in sequence]
+    tracker = PartitionedTracker(cfg)
+    for det in sequence[:20]:
+        tracker.update(det)
+    save_state(tmp_path / "state.npz", {"camera": tracker.state_dict()})
+
+    restored = PartitionedTracker(cfg)
+    restored.load_state_dict(load_state(tmp_path / "state.npz")["camera"])
+    assert restored.frame_id == 20 and len(restored.lost_stracks) > 0
+    for det, tracks in zip(sequence[20:], expected[20:]):
+        assert np.array_equal(restored.update(det), tracks)
+
+    state = {"rtsp://host/stream": {"100%/2F": 1}, "store/cam1": {"ids": np.arange(3)}}
+    save_state(tmp_path / "cameras.npz", state)
+    loaded = load_state(tmp_path / "cameras.npz")
+    assert loaded.keys() == state.keys() and loaded["rtsp://host/stream"] == {"100%/2F": 1}
+    assert np.array_equal(loaded["store/cam1"]["ids"], state["store/cam1"]["ids"])
+
+
+def test_gmc_interval_and_static_skip():
+    """Test that GMC skips static and in-between frames while returning the camera motion of every single frame."""
+    from ultralytics.trackers.utils.gmc import GMC
+
+    rng = np.random.default_rng(0)
+    scene = cv2.GaussianBlur(rng.integers(0, 255, (400, 700, 3), dtype=np.uint8), (7, 7), 0)
+    frames = [scene[20:380, 20:660]] * 10 + [scene[20:380, 20 + 3 * i : 660 + 3 * i] for i in range(1, 11)]
+
+    gmc = GMC("sparseOptFlow")
+    shift = sum(gmc.apply(np.ascontiguousarray(f))[0, 2] for f in frames)
+    assert abs(shift + 30) < 3  # 10 frames panning 3 px each
+
+    gmc = GMC("sparseOptFlow", downscale=4, interval=5, static_thresh=2.0)
+    shifts = [gmc.apply(np.ascontiguousarray(f))[0, 2] for f in frames]
+    assert all(abs(x) < 0.5 for x in shifts[:14])  # static, then panning frames before the first estimate
+    assert all(abs(x + 3) < 0.5 for x in shifts[14:])  # one frame of motion per call, not the motion since the estimate
+    assert gmc.timings["calls"] == len(frames) and gmc.timings["total_ms"] > 0
+    assert gmc.timings["static_skipped"] > 0 and gmc.timings["interval_skipped"] > 0
+    assert gmc.timings["estimated"] < len(frames) // 2
+
+    gmc = GMC("sparseOptFlow", downscale=4, interval=5)
+    shifts = [gmc.apply(np.ascontiguousarray(f))[0, 2] for f in frames[9:]]
+    assert all(abs(x + 3) < 0.5 for x in shifts[4:])  # estimated frames and the frames reusing their warp
+
+
+def test_preprocess_into_buffers():
+    """Test that buffered preprocessing matches the stacked letterbox pipeline and reuses its buffers."""
+    model = YOLO(CFG)
+    model.predict(np.zeros((480, 640, 3), dtype=np.uint8), imgsz=320, verbose=False)
+    predictor = model.predictor
+    rng = np.random.default_rng(0)
+    for shapes in ([(480, 640)], [(720, 1280)] * 3, [(480, 640), (720, 1280), (300, 300)], [(320, 320)]):
+        im = [rng.integers(0, 255, (*shape, 3), dtype=np.uint8) for shape in shapes]
+        expected = np.stack(predictor.pre_transform(im))[..., ::-1].transpose(0, 3, 1, 2)
+        expected = torch.from_numpy(np.ascontiguousarray(expected)).float() / 255
+        out = predictor.preprocess(im)
+        assert torch.equal(out, expected) and out.is_contiguous()
+    buffers = list(predictor.buffers)
+    predictor.preprocess(im)
+    assert all(a is b for a, b in zip(predictor.buffers, buffers))  # same shape, no new allocation
+
+
+def test_pipelined_stream_inference(tmp_path):
+    """Test that pipelined streaming yields the same results in the same order as sequential streaming."""
+    video = str(tmp_path / "pan.mp4")
+    scene = np.random.default_rng(0).integers(0, 255, (240, 480, 3), dtype=np.uint8)
+    writer = cv2.VideoWriter(video, cv2.VideoWriter_fourcc(*"mp4v"), 30, (320, 240))
+    for i in range(12):
+        writer.write(scene[:, i * 8 : i * 8 + 320])
+    writer.release()
+
+    runs = []
+    for pipeline in (0, 2):
+        model = YOLO(CFG)
+        runs.append(list(model.track(video, imgsz=160, conf=1e-4, pipeline=pipeline, stream=True, verbose=False)))
+    assert model.predictor.queue_depth.keys() == {"preprocess", "inference"}
+    assert model.predictor.num_buffers == 1  # ring released after the stream
+    assert [len(r.boxes) for r in runs[0]] == [len(r.boxes) for r in runs[1]] and len(runs[1]) == 12
+    assert sum(len(r.boxes) for r in runs[1]) > 0
+    assert all(torch.equal(a.boxes.data, b.boxes.data) for a, b in zip(*runs))
+
+
+def test_pipelined_inputs_outlive_postprocess(tmp_path):
+    """Test that pipelined preprocessing does not overwrite an input before its batch is postprocessed."""
+    import time
+
+    video = str(tmp_path / "noise.mp4")
+    rng = np.random.default_rng(0)
+    writer = cv2.VideoWriter(video, cv2.VideoWriter_fourcc(*"mp4v"), 30, (160, 128))
+    for _ in range(10):
+        writer.write(rng.integers(0, 255, (128, 160, 3), dtype=np.uint8))
+    writer.release()
+
+    model = YOLO(CFG)
+    model.predict(SOURCE, imgsz=64, verbose=False)
+    predictor, inputs, unchanged = model.predictor, [], []
+    preprocess, postprocess = predictor.preprocess, predictor.postprocess
+
+    def record(im):
+        im = preprocess(im)
+        inputs.append(im.clone())
+        return im
+
+    def check(preds, im, im0s):
+        time.sleep(0.05)  # preprocessing runs ahead until the queues are full
+        unchanged.append(torch.equal(im, inputs[len(unchanged)]))
+        return postprocess(preds, im, im0s)
+
+    predictor.preprocess, predictor.postprocess = record, check
+    list(model.predict(video, imgsz=64, pipeline=1, stream=True, verbose=False))
+    assert len(unchanged) == 10 and all(unchanged)
+
+
+def test_compiled_inference(tmp_path):
+    """Test that compiled inference matches eager for each input shape and that frozen TorchScript models are cached."""
+    from ultralytics.nn.autobackend import AutoBackend
+
+    file = tmp_path / "model.pt"
+    YOLO(CFG).save(file)
+    eager = AutoBackend(file)
+    for _ in range(2):  # compiled and cached, then loaded from the cache
+        backend = AutoBackend(file, compile_mode="jit", cache_dir=tmp_path / "cache")
+        for shape in (64, 64), (96, 64):
+            im = torch.rand(1, 3, *shape)
+            assert torch.allclose(backend(im)[0], eager(im)[0], atol=1e-4)
+        assert len(backend.compiled) == 2  # one compiled model per input shape
+    assert len(list((tmp_path / "cache").glob("*.torchscript"))) == 2
+    with pytest.raises(ValueError):
+        AutoBackend(file, compile_mode="aot")
+
+    im = torch.rand(1, 3, 64, 64)
+    AutoBackend(file, compile_mode="jit", cache_dir=tmp_path / "cache", bf16=True)(im)  # bfloat16 graph cached
+    backend = AutoBackend(file, compile_mode="jit", cache_dir=tmp_path / "cache")
+    assert torch.allclose(backend(im)[0], eager(im)[0], atol=1e-4)  # FP32 graph, not the bfloat16 one
+    assert len(list((tmp_path / "cache").glob("*.torchscript"))) == 3
+
+
+def test_predict_bf16(tmp_path):
+    """Test that CPU BF16 mode runs channels_last under autocast and returns FP32 boxes close to FP32 inference."""
+    from copy import deepcopy
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    YOLO(CFG).save(tmp_path / "model.pt")
+    backend = AutoBackend(tmp_path / "model.pt", bf16=True)
+    assert backend.bf16 and backend.model.model[0].conv.weight.is_contiguous(memory_format=torch.channels_last)
+
+    net = YOLO(CFG).model.eval()
+    fp32, bf16 = AutoBackend(deepcopy(net)), AutoBackend(net, bf16=True)
+    assert bf16.model is net and not net.model[0].conv.weight.is_contiguous(memory_format=torch.channels_last)
+    assert "_inference" not in vars(net.model[-1])  # the caller's module is not patched
+    im = torch.rand(2, 3, 64, 96)
+    y, y_bf16 = fp32(im)[0], bf16(im)[0]
+    assert y_bf16.dtype == torch.float32 and torch.allclose(y_bf16[:, :4], y[:, :4], atol=1.0)  # FP32 box decoding
+
+    model = YOLO(CFG)
+    model.predict([SOURCE, SOURCE], imgsz=64, bf16=True)
+    assert model.predictor.buffers[-1][1].is_contiguous(memory_format=torch.channels_last)  # model input layout
+
+
+def test_botsort_batched_reid():
+    """Test that ReID embeds a batch of frames like single frames and that BOTSORT tracks with ReID features."""
+    from types import SimpleNamespace
+
+    from ultralytics.trackers import BOTSORT
+    from ultralytics.trackers.bot_sort import ReID
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.checks import check_yaml
+
+    im = cv2.imread(str(SOURCE))
+    boxes = np.array([[100, 100, 40, 80], [300, 200, 60, 120], [im.shape[1], im.shape[0], 40, 40]], dtype=np.float32)
+    encoder = ReID("yolo11n-cls.yaml")
+    single = encoder.inference(im, boxes)
+    assert single.shape[0] == 3 and np.allclose(np.linalg.norm(single, axis=1), 1, atol=1e-4)
+    batched = encoder.batch_inference([(im, boxes), (im[::-1].copy(), boxes[:2]), (im, boxes[:0])])
+    assert [len(f) for f in batched] == [3, 2, 0]
+    assert np.allclose(batched[0], single, atol=1e-4)
+
+    args = yaml_load(check_yaml("botsort.yaml"))
+    tracker = BOTSORT(IterableSimpleNamespace(**{**args, "with_reid": True, "reid_model": "yolo11n-cls.yaml"}))
+    det = SimpleNamespace(xywh=boxes, conf=np.full(3, 0.9, dtype=np.float32), cls=np.zeros(3, dtype=np.float32))
+    for _ in range(3):
+        tracks = tracker.update(det, im, features=single)
+    assert len(tracks) == 3
+    assert all(np.allclose(t.smooth_feat, f) for t, f in zip(tracker.tracked_stracks, single))
+
+
+def test_sparse_linear_assignment():
+    """Test that sparse IoU association gives the same costs and matches as the dense matrix path."""
+    from ultralytics.trackers.utils import matching
+
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 1000, (300, 2))
+    a = np.concatenate([xy, xy + rng.uniform(10, 60, xy.shape)], 1).astype(np.float32)
+    b = (a + rng.normal(0, 8, a.shape)).astype(np.float32)[rng.permutation(300)[:250]]
+
+    dense = matching.iou_distance(list(a), list(b))
+    ia, ib, cost = matching.sparse_iou_distance(a, b)
+    assert np.all(dense[ia, ib] == cost)
+    dense[ia, ib] = 1
+    assert np.all(dense == 1)  # every overlapping pair was found
+
+    dense[ia, ib] = cost
+    for thresh in (0.5, 0.8):
+        matches, u_a, u_b = matching.linear_assignment(dense, thresh)
+        sparse_matches, sparse_u_a, sparse_u_b = matching.sparse_linear_assignment(ia, ib, cost, dense.shape, thresh)
+        assert np.array_equal(np.asarray(matches).reshape(-1, 2), sparse_matches)
+        assert np.array_equal(u_a, sparse_u_a) and np.array_equal(u_b, sparse_u_b)
+
+
 def test_val():
     """Test the validation mode of the YOLO model."""
     YOLO(MODEL).val(data="coco8.yaml", imgsz=32, save_hybrid=True)
@@ -502,6 +829,49 @@ def test_nn_modules_block():
     BottleneckCSP(c1, c2)(x)
 
 
+def test_nn_modules_area_attention():
+    """Test that the fused and tiled AAttn CPU paths match the reference attention that materialises all scores."""
+    from ultralytics.nn.modules.block import AAttn, attention_math, attention_tiled
+
+    q, k, v = torch.randn(3, 2, 4, 1000, 32).unbind(0)
+    assert torch.allclose(attention_tiled(q, k, v, chunk=300), attention_math(q, k, v), atol=1e-5)
+
+    grads = []
+    for attention in (lambda *x: attention_tiled(*x, chunk=300), attention_math):  # trainable with N > chunk
+        inputs = [t.clone().requires_grad_() for t in (q, k, v)]
+        attention(*inputs).sum().backward()
+        grads.append([t.grad for t in inputs])
+    assert all(torch.allclose(a, b, atol=1e-4) for a, b in zip(*grads))
+
+    m = AAttn(dim=128, num_heads=4, area=4).eval()
+    x = torch.randn(2, 128, 20, 20)
+    with torch.inference_mode():
+        outputs = {}
+        for backend in ("math", "tiled", "sdpa", None):
+            m.backend = backend
+            outputs[backend] = m(x)
+    for backend in ("tiled", "sdpa", None):
+        assert torch.allclose(outputs[backend], outputs["math"], atol=1e-5)
+
+
+def test_nn_modules_attention_backend():
+    """Test lazy per-module attention backend resolution, forcing via `attention=` and reporting in model info."""
+    from ultralytics.nn.modules.block import AAttn, set_attention_backend
+
+    model = YOLO("yolov12n.yaml")
+    attns = [m for m in model.model.modules() if isinstance(m, AAttn)]
+    im = np.zeros((64, 64, 3), dtype=np.uint8)
+    model.predict(im, imgsz=64, device="cpu", verbose=False)
+    assert attns and {m.attention_backend for m in attns} == {"sdpa"}
+    model.predict(im, imgsz=64, device="cpu", verbose=False, attention="tiled")
+    assert {m.attention_backend for m in attns} == {"tiled"}
+    set_attention_backend(model.model, "flash")  # falls back on CPU
+    model.model(torch.zeros(1, 3, 64, 64))
+    assert {m.attention_backend for m in attns} == {"sdpa"}
+    with pytest.raises(ValueError):
+        set_attention_backend(model.model, "fast")
+
+
 @pytest.mark.skipif(not ONLINE, reason="environment is offline")
 def test_hub():
     """Test Ultralytics HUB functionalities (e.g. export formats, logout)."""
@@ -191,6 +191,9 @@ CFG_INT_KEYS = {  # integer-only arguments
     "line_width",
     "nbs",
     "save_period",
+    "pipeline",
+    "intra_op_threads",
+    "inter_op_threads",
 }
 CFG_BOOL_KEYS = {  # boolean-only arguments
     "save",
@@ -205,6 +208,7 @@ CFG_BOOL_KEYS = {  # boolean-only arguments
     "save_json",
     "save_hybrid",
     "half",
+    "bf16",
     "dnn",
     "plots",
     "show",
@@ -227,6 +231,7 @@ CFG_BOOL_KEYS = {  # boolean-only arguments
     "nms",
     "profile",
     "multi_scale",
+    "raw",
 }
 
 
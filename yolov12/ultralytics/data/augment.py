@@ -1491,6 +1491,7 @@ class LetterBox:
 
     Methods:
         __call__: Resize and pad image, update labels and bounding boxes.
+        output_shape: Shape of the letterboxed image for a given input shape.
 
     Examples:
         >>> transform = LetterBox(new_shape=(640, 640))
@@ -1532,7 +1533,7 @@ class LetterBox:
         self.stride = stride
         self.center = center  # Put the image in the middle or top-left
 
-    def __call__(self, labels=None, image=None):
+    def __call__(self, labels=None, image=None, dst=None):
         """
         Resizes and pads an image for object detection, instance segmentation, or pose estimation tasks.
 
@@ -1542,6 +1543,8 @@ class LetterBox:
         Args:
             labels (Dict | None): A dictionary containing image data and associated labels, or empty dict if None.
             image (np.ndarray | None): The input image as a numpy array. If None, the image is taken from 'labels'.
+            dst (np.ndarray | None): Optional preallocated (h, w, c) output of shape `output_shape(image.shape)`. The
+                image is resized straight into it and the border is filled in place, without intermediate images.
 
         Returns:
             (Dict | Tuple): If 'labels' is provided, returns an updated dictionary with the resized and padded image,
@@ -1557,8 +1560,39 @@ class LetterBox:
         if labels is None:
             labels = {}
         img = labels.get("img") if image is None else image
-        shape = img.shape[:2]  # current shape [height, width]
         new_shape = labels.pop("rect_shape", self.new_shape)
+        ratio, new_unpad, (top, bottom, left, right) = self._geometry(img.shape[:2], new_shape)
+
+        if dst is not None:
+            assert not len(labels), "LetterBox(dst=...) only supports images without labels"
+            assert dst.shape[:2] == (new_unpad[1] + top + bottom, new_unpad[0] + left + right), "dst shape mismatch"
+            w, h = new_unpad
+            if img.shape[1::-1] != new_unpad:  # resize into the unpadded region
+                cv2.resize(img, new_unpad, dst=dst[top : top + h, left : left + w], interpolation=cv2.INTER_LINEAR)
+            else:
+                dst[top : top + h, left : left + w] = img
+            dst[:top] = dst[top + h :] = 114  # add border
+            dst[top : top + h, :left] = dst[top : top + h, left + w :] = 114
+            return dst
+
+        if img.shape[1::-1] != new_unpad:  # resize
+            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
+        img = cv2.copyMakeBorder(
+            img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
+        )  # add border
+        if labels.get("ratio_pad"):
+            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
+
+        if len(labels):
+            labels = self._update_labels(labels, ratio, left, top)
+            labels["img"] = img
+            labels["resized_shape"] = new_shape
+            return labels
+        else:
+            return img
+
+    def _geometry(self, shape, new_shape):
+        """Returns the (width, height) ratio, the resized (width, height) and the (top, bottom, left, right) padding."""
         if isinstance(new_shape, int):
             new_shape = (new_shape, new_shape)
 
@@ -1582,23 +1616,20 @@ class LetterBox:
             dw /= 2  # divide padding into 2 sides
             dh /= 2
 
-        if shape[::-1] != new_unpad:  # resize
-            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
         top, bottom = int(round(dh - 0.1)) if self.center else 0, int(round(dh + 0.1))
         left, right = int(round(dw - 0.1)) if self.center else 0, int(round(dw + 0.1))
-        img = cv2.copyMakeBorder(
-            img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
-        )  # add border
-        if labels.get("ratio_pad"):
-            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
+        return ratio, new_unpad, (top, bottom, left, right)
 
-        if len(labels):
-            labels = self._update_labels(labels, ratio, left, top)
-            labels["img"] = img
-            labels["resized_shape"] = new_shape
-            return labels
-        else:
-            return img
+    def output_shape(self, shape):
+        """
+        Returns the (height, width) of the letterboxed image for an input image of the given shape.
+
+        Examples:
+            >>> LetterBox(new_shape=(640, 640), auto=True).output_shape((720, 1280))
+            (384, 640)
+        """
+        _, (w, h), (top, bottom, left, right) = self._geometry(shape[:2], self.new_shape)
+        return h + top + bottom, w + left + right
 
     @staticmethod
     def _update_labels(labels, ratio, padw, padh):
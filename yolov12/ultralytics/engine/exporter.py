@@ -74,6 +74,7 @@ from ultralytics.data.dataset import YOLODataset
 from ultralytics.data.utils import check_cls_dataset, check_det_dataset
 from ultralytics.nn.autobackend import check_class_names, default_class_names
 from ultralytics.nn.modules import C2f, Classify, Detect, RTDETRDecoder
+from ultralytics.nn.modules.block import set_attention_backend
 from ultralytics.nn.tasks import DetectionModel, SegmentationModel, WorldModel
 from ultralytics.utils import (
     ARM64,
@@ -100,8 +101,8 @@ from ultralytics.utils.checks import (
 )
 from ultralytics.utils.downloads import attempt_download_asset, get_github_assets, safe_download
 from ultralytics.utils.files import file_size, spaces_in_path
-from ultralytics.utils.ops import Profile
-from ultralytics.utils.torch_utils import TORCH_1_13, get_latest_opset, select_device
+from ultralytics.utils.ops import Profile, xywh2xyxy
+from ultralytics.utils.torch_utils import TORCH_1_13, TORCH_2_9, get_latest_opset, select_device
 
 
 def export_formats():
@@ -109,7 +110,14 @@ def export_formats():
     x = [
         ["PyTorch", "-", ".pt", True, True, []],
         ["TorchScript", "torchscript", ".torchscript", True, True, ["batch", "optimize"]],
-        ["ONNX", "onnx", ".onnx", True, True, ["batch", "dynamic", "half", "opset", "simplify"]],
+        [
+            "ONNX",
+            "onnx",
+            ".onnx",
+            True,
+            True,
+            ["batch", "dynamic", "half", "int8", "opset", "simplify", "attention", "nms"],
+        ],
         ["OpenVINO", "openvino", "_openvino_model", True, False, ["batch", "dynamic", "half", "int8"]],
         ["TensorRT", "engine", ".engine", False, True, ["batch", "dynamic", "half", "int8", "simplify"]],
         ["CoreML", "coreml", ".mlpackage", True, False, ["batch", "half", "int8", "nms"]],
@@ -271,6 +279,12 @@ class Exporter:
             LOGGER.warning("WARNING ⚠️ half=True only compatible with GPU export, i.e. use device=0")
             self.args.half = False
             assert not self.args.dynamic, "half=True not compatible with dynamic=True, i.e. use only one."
+        if self.args.attention == "mha" and not onnx:
+            LOGGER.warning("WARNING ⚠️ attention='mha' only supported for format='onnx', setting attention='sdpa'.")
+            self.args.attention = "sdpa"
+        if self.args.nms and onnx and (model.task != "detect" or getattr(model, "end2end", False)):
+            LOGGER.warning("WARNING ⚠️ ONNX 'nms=True' only supported for Detect models, setting nms=False.")
+            self.args.nms = False
         self.imgsz = check_imgsz(self.args.imgsz, stride=model.stride, min_dim=2)  # check image size
         if self.args.int8 and engine:
             self.args.dynamic = True  # enforce dynamic to export TensorRT INT8
@@ -315,6 +329,8 @@ class Exporter:
         model.eval()
         model.float()
         model = model.fuse()
+        if self.args.attention:
+            set_attention_backend(model, self.args.attention)
 
         if imx:
             from ultralytics.utils.torch_utils import FXModel
@@ -496,9 +512,22 @@ class Exporter:
         LOGGER.info(f"\n{prefix} starting export with onnx {onnx.__version__} opset {opset_version}...")
         f = str(self.file.with_suffix(".onnx"))
 
+        model, im = self.model, self.im
         output_names = ["output0", "output1"] if isinstance(self.model, SegmentationModel) else ["output0"]
         dynamic = self.args.dynamic
-        if dynamic:
+        if self.args.nms and self.args.format == "onnx":  # uint8 frame in, final detections out
+            nms = dict(
+                conf=0.25 if self.args.conf is None else self.args.conf,
+                iou=self.args.iou,
+                max_det=self.args.max_det,
+                agnostic_nms=self.args.agnostic_nms,
+            )
+            self.metadata["args"].update(nms)
+            model = FrameDetectModel(self.model, self.imgsz, **nms).eval()
+            im = torch.zeros(*self.imgsz, 3, dtype=torch.uint8)  # HWC
+            dynamic = {"images": {0: "height", 1: "width"}, "output0": {0: "detections"}}  # shape(1080,1920,3), (N,6)
+            LOGGER.info(f"{prefix} embedding letterbox, normalization and NMS, input uint8 BGR (height, width, 3)")
+        elif dynamic:
             dynamic = {"images": {0: "batch", 2: "height", 3: "width"}}  # shape(1,3,640,640)
             if isinstance(self.model, SegmentationModel):
                 dynamic["output0"] = {0: "batch", 2: "anchors"}  # shape(1, 116, 8400)
@@ -507,8 +536,8 @@ class Exporter:
                 dynamic["output0"] = {0: "batch", 2: "anchors"}  # shape(1, 84, 8400)
 
         torch.onnx.export(
-            self.model.cpu() if dynamic else self.model,  # dynamic=True only compatible with cpu
-            self.im.cpu() if dynamic else self.im,
+            model.cpu() if dynamic else model,  # dynamic=True only compatible with cpu
+            im.cpu() if dynamic else im,
             f,
             verbose=False,
             opset_version=opset_version,
@@ -516,6 +545,7 @@ class Exporter:
             input_names=["images"],
             output_names=output_names,
             dynamic_axes=dynamic or None,
+            **({"dynamo": False} if TORCH_2_9 else {}),  # symbolic functions need the TorchScript-based exporter
         )
 
         # Checks
@@ -528,6 +558,8 @@ class Exporter:
 
                 LOGGER.info(f"{prefix} slimming with onnxslim {onnxslim.__version__}...")
                 model_onnx = onnxslim.slim(model_onnx)
+                if self.args.nms and self.args.format == "onnx":  # rank-0 shape inferred for the dynamic frame Resize
+                    del model_onnx.graph.value_info[:]  # intermediate shapes are optional, ONNX Runtime infers them
 
             except Exception as e:
                 LOGGER.warning(f"{prefix} simplifier failure: {e}")
@@ -538,8 +570,64 @@ class Exporter:
             meta.key, meta.value = k, str(v)
 
         onnx.save(model_onnx, f)
+        if self.args.int8 and self.args.format == "onnx":  # other formats built from ONNX quantize on their own
+            return self._quantize_onnx(f, model_onnx, prefix)
         return f, model_onnx
 
+    def _quantize_onnx(self, f, model_onnx, prefix=colorstr("ONNX:")):
+        """Statically quantize exported ONNX model `f` to INT8 (QDQ) with ONNX Runtime, calibrated on `data`."""
+        check_requirements("onnxruntime" + ("-gpu" if torch.cuda.is_available() else ""))
+        import onnx  # noqa
+        import onnxruntime
+        from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+
+        LOGGER.info(f"{prefix} starting INT8 quantization with onnxruntime {onnxruntime.__version__}...")
+        fq = str(self.file.with_name(f"{self.file.stem}_int8.onnx"))
+        dataloader = self.get_int8_calibration_dataloader(prefix)
+        dynamic, nms = self.args.dynamic, self.args.nms
+
+        def inputs():
+            """Normalized calibration batches, skipping a smaller last batch unless the model is dynamic."""
+            for batch in dataloader:
+                im = batch["img"]
+                if nms:  # nms=True model input is one uint8 BGR HWC frame, letterboxed images pass through unchanged
+                    yield from ({"images": x.permute(1, 2, 0).flip(-1).contiguous().numpy()} for x in im)
+                elif dynamic or len(im) == dataloader.batch_size:
+                    yield {"images": im.numpy().astype(np.float32) / 255.0}  # uint8 to fp32, 0-255 to 0.0-1.0
+
+        class Reader(CalibrationDataReader):
+            """Feeds `inputs()` to ONNX Runtime calibration."""
+
+            def __init__(self):
+                self.inputs = inputs()
+
+            def get_next(self):
+                return next(self.inputs, None)
+
+        # Weights per channel and activations per tensor for Conv and MatMul, the DFL decode stays in FP32
+        exclude = []
+        if isinstance(self.model.model[-1], Detect):
+            head = ".".join(list(self.model.named_modules())[-1][0].split(".")[:2])  # i.e. 'model.21'
+            exclude = [n.name for n in model_onnx.graph.node if f"/{head}/dfl" in n.name]  # '/model' prefix if nms
+        quantize_static(
+            f,
+            fq,
+            Reader(),
+            quant_format=QuantFormat.QDQ,
+            op_types_to_quantize=["Conv", "MatMul"],
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            nodes_to_exclude=exclude,
+        )
+
+        model_onnx = onnx.load(fq)  # quantize_static does not keep metadata
+        for k, v in self.metadata.items():
+            meta = model_onnx.metadata_props.add()
+            meta.key, meta.value = k, str(v)
+        onnx.save(model_onnx, fq)
+        return fq, model_onnx
+
     @try_export
     def export_openvino(self, prefix=colorstr("OpenVINO:")):
         """YOLO OpenVINO export."""
@@ -1474,3 +1562,80 @@ class IOSDetectModel(torch.nn.Module):
         """Normalize predictions of object detection model with input size-dependent factors."""
         xywh, cls = self.model(x)[0].transpose(0, 1).split((4, self.nc), 1)
         return cls, xywh * self.normalize  # confidence (3780, 80), coordinates (3780, 4)
+
+
+class NHWCResize(torch.autograd.Function):
+    """Bilinear resize of a (1, H, W, 3) tensor to (h, w), exported as one ONNX Resize without transposing the frame."""
+
+    @staticmethod
+    def forward(ctx, x, h, w):
+        """Resize `x` with `torch.nn.functional.interpolate` in BCHW and return it in BHWC."""
+        x = torch.nn.functional.interpolate(x.permute(0, 3, 1, 2), size=(int(h), int(w)), mode="bilinear")
+        return x.permute(0, 2, 3, 1)
+
+    @staticmethod
+    def symbolic(g, x, h, w):
+        """ONNX Resize to sizes (1, h, w, 3) with half-pixel coordinates like `interpolate(align_corners=False)`."""
+        one, three = g.op("Constant", value_t=torch.tensor([1])), g.op("Constant", value_t=torch.tensor([3]))
+        sizes = g.op("Concat", one, g.op("Reshape", h, one), g.op("Reshape", w, one), three, axis_i=0)
+        empty = g.op("Constant", value_t=torch.tensor([], dtype=torch.float32))
+        y = g.op("Resize", x, empty, empty, sizes, mode_s="linear", coordinate_transformation_mode_s="half_pixel")
+        return y.setType(x.type().with_sizes([1, None, None, 3]))
+
+
+class FrameDetectModel(torch.nn.Module):
+    """Wrap an Ultralytics YOLO Detect model with letterbox, normalization and NMS for end-to-end ONNX export."""
+
+    def __init__(self, model, imgsz, conf=0.25, iou=0.7, max_det=300, agnostic_nms=False):
+        """
+        Initialize the FrameDetectModel with a YOLO Detect model in export mode and NMS settings.
+
+        Args:
+            model (torch.nn.Module): Detect model whose head returns (1, 4 + nc, anchors) xywh predictions.
+            imgsz (tuple): Model input (height, width), frames are letterboxed to it.
+            conf (float): Confidence threshold.
+            iou (float): NMS IoU threshold.
+            max_det (int): Maximum number of detections per frame.
+            agnostic_nms (bool): Class-agnostic NMS.
+        """
+        import torchvision  # scope for faster 'import ultralytics', loading its ops inside the ONNX trace fails
+
+        super().__init__()
+        self.model = model
+        self.nms = torchvision.ops.nms
+        self.conf, self.iou, self.max_det = conf, iou, max_det
+        self.max_wh = 0 if agnostic_nms else 7680  # class offset for batched NMS, as in ops.non_max_suppression
+        self.imgsz = tuple(imgsz)
+        self.register_buffer("size", torch.tensor(imgsz, dtype=torch.float32), persistent=False)  # h, w
+
+    def forward(self, im):
+        """
+        Detect objects in one frame.
+
+        The letterbox follows `LetterBox(auto=False)`: a bilinear resize of the uint8 frame keeping the aspect ratio,
+        then padding to `imgsz` with 114. Sizes and padding are computed in the graph, so frame shapes stay dynamic.
+
+        Args:
+            im (torch.Tensor): (H, W, 3) uint8 BGR frame.
+
+        Returns:
+            (torch.Tensor): (N, 6) detections x1, y1, x2, y2, conf, cls in frame coordinates, sorted by confidence.
+        """
+        shape = torch._shape_as_tensor(im)[:2].float()  # h, w, traced as a graph input shape
+        r = (self.size / shape).min()  # gain
+        new = torch.round(shape * r)  # unpadded h, w
+        pad = torch.round((self.size - new) / 2 - 0.1)  # top, left
+        pad = torch.cat((pad, self.size - new - pad)).long()  # top, left, bottom, right
+        x = NHWCResize.apply(im[None], new[0].long(), new[1].long())  # resize before transposing the frame
+        x = x.flip(3).permute(0, 3, 1, 2).float()  # BGR BHWC to RGB BCHW
+        x = torch.nn.functional.pad(x, (pad[1], pad[3], pad[0], pad[2]), value=114) / 255
+        x = x.reshape(1, 3, *self.imgsz)  # static model input shape from here on
+
+        p = self.model(x)[0].transpose(0, 1)  # (anchors, 4 + nc)
+        conf, cls = p[:, 4:].max(1)
+        i = conf > self.conf
+        boxes, conf, cls = xywh2xyxy(p[i, :4]), conf[i], cls[i].float()
+        i = self.nms(boxes + cls[:, None] * self.max_wh, conf, self.iou)[: self.max_det]
+        boxes = (boxes[i] - pad[[1, 0, 1, 0]]) / r
+        boxes = torch.min(boxes.clamp(min=0), shape[[1, 0, 1, 0]])  # clip to frame
+        return torch.cat((boxes, conf[i, None], cls[i, None]), 1)
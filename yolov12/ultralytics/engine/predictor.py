@@ -33,7 +33,9 @@ Usage - formats:
 import platform
 import re
 import threading
+import time
 from pathlib import Path
+from queue import Empty, Full, Queue
 
 import cv2
 import numpy as np
@@ -43,6 +45,7 @@ from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox, classify_transforms
 from ultralytics.nn.autobackend import AutoBackend
+from ultralytics.nn.modules.block import set_attention_backend
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
 from ultralytics.utils.files import increment_path
@@ -100,6 +103,7 @@ class BasePredictor:
         self.imgsz = None
         self.device = None
         self.dataset = None
+        self._frames_dataset = None  # source set up by infer_frames(), reused until a regular call replaces it
         self.vid_writer = {}  # dict of {save_path: video_writer, ...}
         self.plotted_img = None
         self.source_type = None
@@ -107,7 +111,11 @@ class BasePredictor:
         self.windows = []
         self.batch = None
         self.results = None
+        self.speed = None
         self.transforms = None
+        self.buffers = []  # ring of reused (uint8 BHWC, float BCHW) preprocessing buffers, see preprocess_into_buffers
+        self.num_buffers = 1  # ring size, one per batch that can be in flight at the same time
+        self.queue_depth = {}  # batches waiting between pipeline stages, see pipelined_batches
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.txt_path = None
         self._lock = threading.Lock()  # for automatic thread-safe inference
@@ -120,7 +128,12 @@ class BasePredictor:
         Args:
             im (torch.Tensor | List(np.ndarray)): BCHW for tensor, [(HWC) x B] for list.
         """
+        if self.model.frame_input:  # letterbox and normalization run inside the model
+            return im
         not_tensor = not isinstance(im, torch.Tensor)
+        default_letterbox = type(self).pre_transform is BasePredictor.pre_transform
+        if not_tensor and default_letterbox and all(x.shape[2:] == (3,) for x in im):
+            return self.preprocess_into_buffers(im)
         if not_tensor:
             im = np.stack(self.pre_transform(im))
             im = im[..., ::-1].transpose((0, 3, 1, 2))  # BGR to RGB, BHWC to BCHW, (n, 3, h, w)
@@ -133,8 +146,53 @@ class BasePredictor:
             im /= 255  # 0 - 255 to 0.0 - 1.0
         return im
 
+    def preprocess_into_buffers(self, im):
+        """
+        Letterbox BGR images straight into reused buffers and return the normalized (B, 3, H, W) model input.
+
+        Same result as `pre_transform` followed by the stack/flip/transpose/float/divide steps of `preprocess`, without
+        the full-size copies in between: each image is resized into its slot of a preallocated uint8 (B, H, W, 3)
+        buffer (pinned on CUDA) and the border is filled in place. On CPU, BGR to RGB, HWC to CHW and the division by
+        255 then run as one strided pass per channel into a reused float (B, 3, H, W) tensor; on other devices the
+        uint8 buffer is uploaded and converted there. Buffers are reallocated only when the letterboxed shape changes
+        or the batch grows, and are used round-robin from a ring of `num_buffers`, so the returned tensor is
+        overwritten `num_buffers` calls later.
+
+        Args:
+            im (List[np.ndarray]): [(h, w, 3) x B] BGR images.
+
+        Returns:
+            (torch.Tensor): (B, 3, H, W) input on `self.device`.
+        """
+        letterbox = self.letterbox(im)
+        n, (h, w) = len(im), letterbox.output_shape(im[0].shape)
+        del self.buffers[: max(len(self.buffers) - self.num_buffers, 0)]
+        slot = self.buffers.pop(0) if len(self.buffers) == self.num_buffers else None  # least recently used
+        if slot is None or slot[0].shape[1:3] != (h, w) or len(slot[0]) < n:
+            with torch.inference_mode(False):  # normal tensors, writable inside and outside of inference mode
+                hwc = torch.empty((n, h, w, 3), dtype=torch.uint8, pin_memory=self.device.type == "cuda")
+                layout = torch.channels_last if self.model.bf16 else torch.contiguous_format  # model input layout
+                chw = torch.empty((n, 3, h, w), memory_format=layout) if self.device.type == "cpu" else None
+            slot = hwc, chw
+        self.buffers.append(slot)
+        hwc, chw = slot
+        hwc_np = hwc.numpy()
+        for i, x in enumerate(im):
+            letterbox(image=x, dst=hwc_np[i])
+
+        if chw is None:
+            im = hwc[:n].to(self.device, non_blocking=True).permute(0, 3, 1, 2).flip(1).contiguous()  # BGR to RGB
+            im = im.half() if self.model.fp16 else im.float()
+            im /= 255
+            return im
+        for c in range(3):  # BGR to RGB, BHWC to BCHW and 0 - 255 to 0.0 - 1.0 in one pass
+            torch.div(hwc[:n, ..., 2 - c], 255, out=chw[:n, c])
+        return chw[:n].half() if self.model.fp16 else chw[:n]
+
     def inference(self, im, *args, **kwargs):
         """Runs inference on a given image using the specified model and arguments."""
+        if self.model.frame_input:  # one uint8 frame per call, (N, 6) detections in frame coordinates
+            return [self.model(x) for x in im]
         visualize = (
             increment_path(self.save_dir / Path(self.batch[0][0]).stem, mkdir=True)
             if self.args.visualize and (not self.source_type.tensor)
@@ -152,13 +210,22 @@ class BasePredictor:
         Returns:
             (list): A list of transformed images.
         """
+        letterbox = self.letterbox(im)
+        return [letterbox(image=x) for x in im]
+
+    def letterbox(self, im):
+        """
+        Returns the LetterBox transform for a batch of images, with minimum-rectangle padding if shapes match.
+
+        Compiled PyTorch models get the full `imgsz`, so they compile for one input shape, not one per aspect ratio.
+        """
         same_shapes = len({x.shape for x in im}) == 1
-        letterbox = LetterBox(
+        dynamic = (self.model.pt and not self.model.compile_mode) or getattr(self.model, "dynamic", False)
+        return LetterBox(
             self.imgsz,
-            auto=same_shapes and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx)),
+            auto=same_shapes and dynamic and not self.model.imx,
             stride=self.model.stride,
         )
-        return [letterbox(image=x) for x in im]
 
     def postprocess(self, preds, img, orig_imgs):
         """Post-processes predictions for an image and returns them."""
@@ -188,6 +255,69 @@ class BasePredictor:
         for _ in gen:  # sourcery skip: remove-empty-nested-block, noqa
             pass
 
+    @smart_inference_mode()
+    def infer_frames(self, frames):
+        """
+        Run inference on in-memory frames, reusing source, args and letterbox setup across calls.
+
+        The first call (or the first one after a regular predict/track call) sets up the source and runs the
+        'on_predict_start' callbacks. Later calls skip `get_cfg`, `setup_source`, `check_imgsz` and the generator
+        machinery of `stream_inference` and only run preprocess, inference, postprocess and the
+        'on_predict_postprocess_end' callbacks (i.e. tracking). Arguments are those of the last regular call.
+
+        Args:
+            frames (List[np.ndarray]): BGR HWC frames, processed as one batch.
+
+        Returns:
+            (List[Results] | List[np.ndarray]): One result per frame, structured arrays if `raw=True`.
+
+        Examples:
+            >>> model = YOLO("yolo11n.pt")
+            >>> model.track(frame, persist=True)  # regular call sets up the predictor and trackers
+            >>> results = model.predictor.infer_frames([frame])
+        """
+        if not self.model:
+            self.setup_model(None)
+
+        with self._lock:
+            if self.dataset is None or self.dataset is not self._frames_dataset:
+                self.setup_source(frames)
+                self._frames_dataset = self.dataset
+                if not self.done_warmup:
+                    bs = 1 if self.model.pt or self.model.triton else self.dataset.bs
+                    self.model.warmup(imgsz=(bs, 3, *self.imgsz))
+                    self.done_warmup = True
+                self._frames_profilers = (
+                    ops.Profile(device=self.device),
+                    ops.Profile(device=self.device),
+                    ops.Profile(device=self.device),
+                )
+                self.run_callbacks("on_predict_start")
+
+            profilers = self._frames_profilers
+            n = len(frames)
+            self.batch = [f"image{i}.jpg" for i in range(n)], frames, [""] * n
+            self.run_callbacks("on_predict_batch_start")
+            with profilers[0]:
+                im = self.preprocess(frames)
+            with profilers[1]:
+                preds = self.inference(im)
+            with profilers[2]:
+                self.results = self.postprocess(preds, im, frames)
+            self.run_callbacks("on_predict_postprocess_end")
+
+            self.seen += n
+            self.speed = {
+                "preprocess": profilers[0].dt * 1e3 / n,
+                "inference": profilers[1].dt * 1e3 / n,
+                "postprocess": profilers[2].dt * 1e3 / n,
+            }
+            if not self.args.raw:
+                for result in self.results:
+                    result.speed = self.speed.copy()
+            self.run_callbacks("on_predict_batch_end")
+            return self.results
+
     def setup_source(self, source):
         """Sets up source and inference mode."""
         self.imgsz = check_imgsz(self.args.imgsz, stride=self.model.stride, min_dim=2)  # check image size
@@ -225,6 +355,8 @@ class BasePredictor:
         # Setup model
         if not self.model:
             self.setup_model(model)
+        elif self.args.attention:  # args are updated between calls of a reused predictor
+            set_attention_backend(self.model, self.args.attention)
 
         with self._lock:  # for thread-safe inference
             # Setup source every time predict is called
@@ -233,6 +365,8 @@ class BasePredictor:
             # Check if save_dir/ label file exists
             if self.args.save or self.args.save_txt:
                 (self.save_dir / "labels" if self.args.save_txt else self.save_dir).mkdir(parents=True, exist_ok=True)
+            if self.args.raw and (self.args.save or self.args.save_txt or self.args.save_crop or self.args.show):
+                LOGGER.warning("WARNING ⚠️ 'raw=True' results carry no images, save and show args are ignored.")
 
             # Warmup model
             if not self.done_warmup:
@@ -246,20 +380,15 @@ class BasePredictor:
                 ops.Profile(device=self.device),
             )
             self.run_callbacks("on_predict_start")
-            for self.batch in self.dataset:
-                self.run_callbacks("on_predict_batch_start")
+            if self.args.pipeline and not (self.args.embed or self.args.visualize):
+                batches = self.pipelined_batches(profilers, *args, **kwargs)
+            else:
+                batches = self.sequential_batches(profilers, *args, **kwargs)
+            for self.batch, im, preds, dt in batches:
                 paths, im0s, s = self.batch
-
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
-
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
+                if self.args.embed:
+                    yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                    continue
 
                 # Postprocess
                 with profilers[2]:
@@ -268,13 +397,16 @@ class BasePredictor:
 
                 # Visualize, save, write results
                 n = len(im0s)
+                self.speed = {
+                    "preprocess": dt[0] * 1e3 / n,
+                    "inference": dt[1] * 1e3 / n,
+                    "postprocess": profilers[2].dt * 1e3 / n,
+                }
                 for i in range(n):
                     self.seen += 1
-                    self.results[i].speed = {
-                        "preprocess": profilers[0].dt * 1e3 / n,
-                        "inference": profilers[1].dt * 1e3 / n,
-                        "postprocess": profilers[2].dt * 1e3 / n,
-                    }
+                    if self.args.raw:  # structured arrays carry no metadata, speed stays on self.speed
+                        continue
+                    self.results[i].speed = self.speed.copy()
                     if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
                         s[i] += self.write_results(i, Path(paths[i]), im, s)
 
@@ -295,7 +427,7 @@ class BasePredictor:
             t = tuple(x.t / self.seen * 1e3 for x in profilers)  # speeds per image
             LOGGER.info(
                 f"Speed: %.1fms preprocess, %.1fms inference, %.1fms postprocess per image at shape "
-                f"{(min(self.args.batch, self.seen), 3, *im.shape[2:])}" % t
+                f"{(min(self.args.batch, self.seen), 3, *(self.imgsz if self.model.frame_input else im.shape[2:]))}" % t
             )
         if self.args.save or self.args.save_txt or self.args.save_crop:
             nl = len(list(self.save_dir.glob("labels/*.txt")))  # number of labels
@@ -303,6 +435,116 @@ class BasePredictor:
             LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}{s}")
         self.run_callbacks("on_predict_end")
 
+    def sequential_batches(self, profilers, *args, **kwargs):
+        """
+        Preprocess and run inference on each batch of the dataset in turn.
+
+        Yields:
+            (tuple): (batch, im, preds, (preprocess_seconds, inference_seconds)) for each batch.
+        """
+        for batch in self.dataset:
+            self.batch = batch
+            self.run_callbacks("on_predict_batch_start")
+            with profilers[0]:
+                im = self.preprocess(batch[1])
+            with profilers[1]:
+                preds = self.inference(im, *args, **kwargs)
+            yield batch, im, preds, (profilers[0].dt, profilers[1].dt)
+
+    def pipelined_batches(self, profilers, *args, **kwargs):
+        """
+        Run dataset reading and preprocessing, and inference, in two threads overlapping with postprocessing.
+
+        The stages are connected by FIFO queues holding at most `args.pipeline` batches each, so batches come out in
+        dataset order and memory stays bounded. Postprocessing, callbacks (e.g. tracking) and result writing stay in
+        the calling thread. `on_predict_batch_start` runs when a batch reaches postprocessing, and `queue_depth`
+        holds the number of batches waiting in each queue at that time. Exceptions of a stage are re-raised here.
+
+        Asynchronous backends (OpenVINO with a THROUGHPUT hint) are not waited for in the inference stage: batches are
+        submitted to the backend's persistent infer queue and resolved here, so up to `args.pipeline` batches, e.g.
+        frames from several cameras, are in inference at once on separate CPU streams.
+
+        Yields:
+            (tuple): (batch, im, preds, (preprocess_seconds, inference_seconds)) for each batch.
+        """
+        prepared, inferred = Queue(self.args.pipeline), Queue(self.args.pipeline)
+        stop = threading.Event()
+
+        def put(q, item):
+            """Put `item` in `q` unless the pipeline is stopped, returns False if it was."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def drain(q):
+            """Yield the items of `q` until the producing stage ends, re-raising its exception."""
+            while not stop.is_set():
+                try:
+                    item = q.get(timeout=0.1)
+                except Empty:
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+                if item is None:
+                    return
+                yield item
+
+        @smart_inference_mode()  # inference mode is per thread
+        def stage(fn, source, q):
+            """Apply `fn` to every item of `source` and put the results in `q`, followed by None or the exception."""
+            try:
+                for item in source:
+                    if not put(q, fn(item)):
+                        return
+                end = None
+            except BaseException as e:
+                end = e
+            put(q, end)
+
+        def preprocess(batch):
+            with profilers[0]:
+                im = self.preprocess(batch[1])
+            return batch, im, profilers[0].dt
+
+        asynchronous = self.model.asynchronous
+
+        def inference(item):
+            batch, im, dt = item
+            with profilers[1]:
+                preds = self.model.submit(im) if asynchronous else self.inference(im, *args, **kwargs)
+            return batch, im, preds, (dt, profilers[1].dt)
+
+        # Inputs live until their batch is postprocessed: one buffer per batch queued for inference or postprocessing,
+        # plus the ones being preprocessed, in inference and in postprocessing. ONNX Runtime outputs are created in
+        # inference: one set per batch queued for postprocessing, plus the ones in inference and in postprocessing
+        self.num_buffers = 2 * self.args.pipeline + 3
+        self.model.num_io_bindings = self.args.pipeline + 2
+        threads = [
+            threading.Thread(target=stage, args=(preprocess, self.dataset, prepared), daemon=True),
+            threading.Thread(target=stage, args=(inference, drain(prepared), inferred), daemon=True),
+        ]
+        for t in threads:
+            t.start()
+        try:
+            for item in drain(inferred):
+                if asynchronous:  # inference time is submitting plus waiting for the result
+                    batch, im, future, (dt0, dt1) = item
+                    t = time.perf_counter()
+                    item = batch, im, future.result(), (dt0, dt1 + time.perf_counter() - t)
+                self.queue_depth = {"preprocess": prepared.qsize(), "inference": inferred.qsize()}
+                self.batch = item[0]
+                self.run_callbacks("on_predict_batch_start")
+                yield item
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+            self.num_buffers = self.model.num_io_bindings = 1
+
     def setup_model(self, model, verbose=True):
         """Initialize YOLO model with given parameters and set it to evaluation mode."""
         self.model = AutoBackend(
@@ -314,16 +556,30 @@ class BasePredictor:
             batch=self.args.batch,
             fuse=True,
             verbose=verbose,
+            session_options={
+                "intra_op_threads": self.args.intra_op_threads,
+                "inter_op_threads": self.args.inter_op_threads,
+                "graph_optimization": self.args.graph_optimization,
+                "execution_mode": self.args.execution_mode,
+            },
+            performance_hint="THROUGHPUT" if self.args.pipeline and self.args.batch == 1 else None,
+            cache_dir=self.args.model_cache,
+            compile_mode=self.args.compile,
+            bf16=self.args.bf16,
         )
 
         self.device = self.model.device  # update device
         self.args.half = self.model.fp16  # update half
+        self.args.bf16 = self.model.bf16  # update bf16
+        if self.args.attention:
+            set_attention_backend(self.model, self.args.attention)
         self.model.eval()
 
     def write_results(self, i, p, im, s):
         """Write inference results to a file or directory."""
         string = ""  # print string
-        if len(im.shape) == 3:
+        frames = self.model.frame_input  # im is the list of frames, letterboxed inside the model
+        if not frames and len(im.shape) == 3:
             im = im[None]  # expand for batch dim
         if self.source_type.stream or self.source_type.from_img or self.source_type.tensor:  # batch_size >= 1
             string += f"{i}: "
@@ -333,7 +589,7 @@ class BasePredictor:
             frame = int(match[1]) if match else None  # 0 if frame undetermined
 
         self.txt_path = self.save_dir / "labels" / (p.stem + ("" if self.dataset.mode == "image" else f"_{frame}"))
-        string += "{:g}x{:g} ".format(*im.shape[2:])
+        string += "{:g}x{:g} ".format(*(im[i].shape[:2] if frames else im.shape[2:]))
         result = self.results[i]
         result.save_dir = self.save_dir.__str__()  # used in other locations
         string += f"{result.verbose()}{result.speed['inference']:.1f}ms"
@@ -345,7 +601,7 @@ class BasePredictor:
                 boxes=self.args.show_boxes,
                 conf=self.args.show_conf,
                 labels=self.args.show_labels,
-                im_gpu=None if self.args.retina_masks else im[i],
+                im_gpu=None if self.args.retina_masks or frames else im[i],
             )
 
         # Save results
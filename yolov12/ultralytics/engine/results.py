@@ -18,6 +18,11 @@ from ultralytics.utils.checks import check_requirements
 from ultralytics.utils.plotting import Annotator, colors, save_one_box
 from ultralytics.utils.torch_utils import smart_inference_mode
 
+# Per-image structured array returned by detection predictors with `raw=True`, track_id is -1 for untracked boxes
+RAW_DETECTIONS_DTYPE = np.dtype(
+    [("xyxy", np.float32, (4,)), ("conf", np.float32), ("cls", np.int32), ("track_id", np.int32)]
+)
+
 
 class BaseTensor(SimpleClass):
     """
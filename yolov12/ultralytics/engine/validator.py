@@ -31,6 +31,7 @@ import torch
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data.utils import check_cls_dataset, check_det_dataset
 from ultralytics.nn.autobackend import AutoBackend
+from ultralytics.nn.modules.block import set_attention_backend
 from ultralytics.utils import LOGGER, TQDM, callbacks, colorstr, emojis
 from ultralytics.utils.checks import check_imgsz
 from ultralytics.utils.ops import Profile
@@ -129,10 +130,14 @@ class BaseValidator:
                 dnn=self.args.dnn,
                 data=self.args.data,
                 fp16=self.args.half,
+                bf16=self.args.bf16,
             )
             # self.model = model
             self.device = model.device  # update device
             self.args.half = model.fp16  # update half
+            self.args.bf16 = model.bf16  # update bf16
+            if self.args.attention:
+                set_attention_backend(model, self.args.attention)
             stride, pt, jit, engine = model.stride, model.pt, model.jit, model.engine
             imgsz = check_imgsz(self.args.imgsz, stride=stride)
             if engine:
@@ -435,6 +435,10 @@ class Predictor(BasePredictor):
         self.model.triton = False
         self.model.stride = 32
         self.model.fp16 = False
+        self.model.frame_input = False
+        self.model.asynchronous = False
+        self.model.compile_mode = None
+        self.model.bf16 = False
         self.done_warmup = True
 
     def get_model(self):
@@ -1,7 +1,10 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import numpy as np
+import torch
+
 from ultralytics.engine.predictor import BasePredictor
-from ultralytics.engine.results import Results
+from ultralytics.engine.results import RAW_DETECTIONS_DTYPE, Results
 from ultralytics.utils import ops
 
 
@@ -22,20 +25,59 @@ class DetectionPredictor(BasePredictor):
 
     def postprocess(self, preds, img, orig_imgs):
         """Post-processes predictions and returns a list of Results objects."""
-        preds = ops.non_max_suppression(
-            preds,
-            self.args.conf,
-            self.args.iou,
-            agnostic=self.args.agnostic_nms,
-            max_det=self.args.max_det,
-            classes=self.args.classes,
-        )
+        if self.model.frame_input:  # NMS and box scaling ran inside the model
+            if self.args.classes is not None:
+                preds = [p[(p[:, 5:6] == torch.tensor(self.args.classes, device=p.device)).any(1)] for p in preds]
+        else:
+            preds = ops.non_max_suppression(
+                preds,
+                self.args.conf,
+                self.args.iou,
+                agnostic=self.args.agnostic_nms,
+                max_det=self.args.max_det,
+                classes=self.args.classes,
+            )
+
+        if self.args.raw:
+            return self.construct_raw_results(preds, img, orig_imgs)
 
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
 
         results = []
         for pred, orig_img, img_path in zip(preds, orig_imgs, self.batch[0]):
-            pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
+            if not self.model.frame_input:
+                pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
             results.append(Results(orig_img, path=img_path, names=self.model.names, boxes=pred))
         return results
+
+    def construct_raw_results(self, preds, img, orig_imgs):
+        """
+        Builds one structured array of RAW_DETECTIONS_DTYPE per image without creating Results or Boxes objects.
+
+        Boxes of the whole batch are rescaled on device and copied to the CPU in a single transfer, and the original
+        images are not referenced by the output.
+
+        Args:
+            preds (List[torch.Tensor]): Per-image (N, 6) detections after NMS.
+            img (torch.Tensor | List[np.ndarray]): Preprocessed input batch, the frames for `frame_input` models.
+            orig_imgs (List[np.ndarray] | torch.Tensor): Original images.
+
+        Returns:
+            (List[np.ndarray]): Per-image structured arrays with fields xyxy, conf, cls and track_id.
+        """
+        if isinstance(orig_imgs, list):
+            shapes = [x.shape[:2] for x in orig_imgs]
+        else:  # input images are a torch.Tensor (B, 3, H, W)
+            shapes = [orig_imgs.shape[2:]] * len(preds)
+        for pred, shape in zip(preds, shapes):
+            if not self.model.frame_input:
+                pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], shape)
+
+        data = torch.cat(preds).float().cpu().numpy()
+        out = np.empty(len(data), dtype=RAW_DETECTIONS_DTYPE)
+        out["xyxy"] = data[:, :4]
+        out["conf"] = data[:, 4]
+        out["cls"] = data[:, 5]
+        out["track_id"] = -1
+        return np.split(out, np.cumsum([len(pred) for pred in preds])[:-1])
@@ -1,10 +1,15 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import ast
+import hashlib
 import json
+import os
 import platform
+import threading
+import warnings
 import zipfile
 from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
 from pathlib import Path
 
 import cv2
@@ -13,6 +18,7 @@ import torch
 import torch.nn as nn
 from PIL import Image
 
+from ultralytics import __version__
 from ultralytics.utils import ARM64, IS_JETSON, IS_RASPBERRYPI, LINUX, LOGGER, ROOT, yaml_load
 from ultralytics.utils.checks import check_requirements, check_suffix, check_version, check_yaml
 from ultralytics.utils.downloads import attempt_download_asset, is_url
@@ -51,6 +57,106 @@ def default_class_names(data=None):
     return {i: f"class{i}" for i in range(999)}  # return default if above errors
 
 
+def model_cache_file(cache_dir, weights, suffix, **key):
+    """
+    Return the path of a cached ready-to-run artefact of a weights file.
+
+    The file name hashes the weights file contents together with the ultralytics version and `key` (e.g. backend
+    version, dtype, batch or input shape), so new weights, upgrades or other settings create a new entry instead of
+    reusing a stale one.
+
+    Args:
+        cache_dir (str | Path): Cache directory, created if missing.
+        weights (str | Path): Weights file the artefact is built from.
+        suffix (str): Artefact file suffix, i.e. '.pt' or '.onnx'.
+        **key (Any): Settings the artefact depends on, must be JSON serializable or convertible with str().
+
+    Returns:
+        (Path): Path of the artefact, which exists only if it was cached before.
+    """
+    h = hashlib.sha256(Path(weights).read_bytes())
+    h.update(json.dumps({"ultralytics": __version__, **key}, sort_keys=True, default=str).encode())
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{Path(weights).stem}-{h.hexdigest()[:16]}{suffix}"
+
+
+def ort_session_options(intra_op_threads=None, inter_op_threads=None, graph_optimization=None, execution_mode=None):
+    """
+    Build ONNX Runtime session options, arguments left as None keep the ONNX Runtime defaults.
+
+    Args:
+        intra_op_threads (int, optional): Threads used within an operator, ONNX Runtime uses all physical cores.
+        inter_op_threads (int, optional): Threads used across operators when `execution_mode='parallel'`.
+        graph_optimization (str, optional): Graph optimization level, 'disable', 'basic', 'extended' or 'all'.
+        execution_mode (str, optional): Run independent operators 'sequential' or 'parallel'.
+
+    Returns:
+        (onnxruntime.SessionOptions): Session options for `onnxruntime.InferenceSession`.
+    """
+    import onnxruntime
+
+    levels = {
+        "disable": onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        "basic": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        "extended": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        "all": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    modes = {"sequential": onnxruntime.ExecutionMode.ORT_SEQUENTIAL, "parallel": onnxruntime.ExecutionMode.ORT_PARALLEL}
+    if graph_optimization is not None and graph_optimization not in levels:
+        raise ValueError(f"Invalid graph_optimization='{graph_optimization}', valid values are {list(levels)}.")
+    if execution_mode is not None and execution_mode not in modes:
+        raise ValueError(f"Invalid execution_mode='{execution_mode}', valid values are {list(modes)}.")
+
+    options = onnxruntime.SessionOptions()
+    if intra_op_threads:
+        options.intra_op_num_threads = intra_op_threads
+    if inter_op_threads:
+        options.inter_op_num_threads = inter_op_threads
+    if graph_optimization is not None:
+        options.graph_optimization_level = levels[graph_optimization]
+    if execution_mode is not None:
+        options.execution_mode = modes[execution_mode]
+    return options
+
+
+def _torch_cache_key(fp16):
+    """Return the settings a cached fused PyTorch model depends on."""
+    return {"torch": torch.__version__, "dtype": "float16" if fp16 else "float32", "fuse": True}
+
+
+def _optimize_torchscript(model, im):
+    """
+    Trace `model` for the shape of `im` and freeze it, inlining weights and folding constants.
+
+    optimize_for_inference is not applied: its MKLDNN layout conversions made YOLOv12 slower than eager on CPU.
+    """
+    with torch.inference_mode(False), torch.no_grad(), warnings.catch_warnings():  # no inference tensors in traces
+        warnings.filterwarnings("ignore", category=torch.jit.TracerWarning)  # anchors are constant for one shape
+        model = torch.jit.trace(model.eval(), im.clone(), strict=False, check_trace=False)
+        return torch.jit.freeze(model)
+
+
+def _to_float(y):
+    """Cast the tensors in a (nested) tuple or list of model outputs to float32."""
+    if isinstance(y, torch.Tensor):
+        return y.float()
+    return type(y)(_to_float(x) for x in y) if isinstance(y, (list, tuple)) else y
+
+
+def _cache_tmp(file):
+    """Return a per-process temporary path next to `file`, moved in place once written."""
+    return file.with_suffix(f".{os.getpid()}.tmp")
+
+
+def _save_cache(obj, file):
+    """Save `obj` to `file` atomically, so concurrently starting workers never read a partial file."""
+    tmp = _cache_tmp(file)
+    torch.save(obj, tmp)
+    tmp.replace(file)
+    LOGGER.info(f"Cached {file}")
+
+
 class AutoBackend(nn.Module):
     """
     Handles dynamic backend selection for running inference using Ultralytics YOLO models.
@@ -91,6 +197,11 @@ class AutoBackend(nn.Module):
         batch=1,
         fuse=True,
         verbose=True,
+        session_options=None,
+        performance_hint=None,
+        cache_dir=None,
+        compile_mode=None,
+        bf16=False,
     ):
         """
         Initialize the AutoBackend for inference.
@@ -104,6 +215,18 @@ class AutoBackend(nn.Module):
             batch (int): Batch-size to assume for inference.
             fuse (bool): Fuse Conv2D + BatchNorm layers for optimization. Defaults to True.
             verbose (bool): Enable verbose logging. Defaults to True.
+            session_options (dict, optional): ONNX Runtime session options 'intra_op_threads', 'inter_op_threads',
+                'graph_optimization' ('disable', 'basic', 'extended' or 'all') and 'execution_mode' ('sequential' or
+                'parallel'), None values keep the ONNX Runtime defaults.
+            performance_hint (str, optional): OpenVINO performance hint 'LATENCY', 'THROUGHPUT' or
+                'CUMULATIVE_THROUGHPUT'. Defaults to None, LATENCY for batch=1 and CUMULATIVE_THROUGHPUT otherwise.
+            cache_dir (str | Path, optional): Directory of ready-to-run artefacts reused across starts: fused PyTorch
+                models, optimized ONNX Runtime graphs and OpenVINO compiled blobs. Defaults to None (no cache).
+            compile_mode (str, optional): Compile PyTorch models per input shape on first use, 'inductor' for
+                torch.compile or 'jit' for frozen TorchScript. Defaults to None (eager). Inductor kernels are cached in
+                the process-wide TORCHINDUCTOR_CACHE_DIR, set to `cache_dir` by the first backend compiling with one.
+            bf16 (bool): Run PyTorch models on CPU in channels_last memory format under bfloat16 autocast, with box
+                decoding and all outputs in float32. Defaults to False.
         """
         super().__init__()
         w = str(weights[0] if isinstance(weights, list) else weights)
@@ -126,7 +249,10 @@ class AutoBackend(nn.Module):
             imx,
             triton,
         ) = self._model_type(w)
-        fp16 &= pt or jit or onnx or xml or engine or nn_module or triton  # FP16
+        if bf16 and not ((pt or nn_module) and device.type == "cpu"):
+            LOGGER.warning("WARNING ⚠️ bf16=True is only supported for PyTorch models on CPU, ignoring")
+            bf16 = False
+        fp16 &= (pt or jit or onnx or xml or engine or nn_module or triton) and not bf16  # FP16
         nhwc = coreml or saved_model or pb or tflite or edgetpu  # BHWC formats (vs torch BCWH)
         stride = 32  # default stride
         model, metadata, task = None, None, None
@@ -144,6 +270,15 @@ class AutoBackend(nn.Module):
         # In-memory PyTorch model
         if nn_module:
             model = weights.to(device)
+            if fuse and cache_dir and Path(getattr(model, "pt_path", "")).is_file() and not model.is_fused():
+                # Module loaded from a weights file, fuse it in place with the cached layers of that file
+                f = model_cache_file(cache_dir, model.pt_path, ".pt", **_torch_cache_key(fp16))
+                fused = torch.load(f, map_location=device, weights_only=False) if f.is_file() else None
+                if fused is None:
+                    _save_cache(model.fuse(verbose=verbose), f)
+                else:
+                    model.model = fused.model
+                    LOGGER.info(f"Loaded fused layers from {f}")
             if fuse:
                 model = model.fuse(verbose=verbose)
             if hasattr(model, "kpt_shape"):
@@ -158,14 +293,23 @@ class AutoBackend(nn.Module):
         elif pt:
             from ultralytics.nn.tasks import attempt_load_weights
 
-            model = attempt_load_weights(
-                weights if isinstance(weights, list) else w, device=device, inplace=True, fuse=fuse
-            )
+            f = None
+            if cache_dir and fuse and not isinstance(weights, list):
+                f = model_cache_file(cache_dir, w, ".pt", **_torch_cache_key(fp16))
+            if f and f.is_file():
+                model = torch.load(f, map_location=device, weights_only=False)
+                LOGGER.info(f"Loaded fused model from {f}")
+            else:
+                model = attempt_load_weights(
+                    weights if isinstance(weights, list) else w, device=device, inplace=True, fuse=fuse
+                )
             if hasattr(model, "kpt_shape"):
                 kpt_shape = model.kpt_shape  # pose-only
             stride = max(int(model.stride.max()), 32)  # model stride
             names = model.module.names if hasattr(model, "module") else model.names  # get class names
             model.half() if fp16 else model.float()
+            if f and not f.is_file():
+                _save_cache(model, f)
             self.model = model  # explicitly assign for to(), cpu(), cuda(), half()
 
         # TorchScript
@@ -201,7 +345,23 @@ class AutoBackend(nn.Module):
                 cuda = False
             LOGGER.info(f"Using ONNX Runtime {providers[0]}")
             if onnx:
-                session = onnxruntime.InferenceSession(w, providers=providers)
+                options = ort_session_options(**(session_options or {}))
+                f = None
+                if cache_dir:  # optimized graphs may hold CPU-specific layouts, so the CPU is part of the key
+                    from ultralytics.utils.torch_utils import get_cpu_info
+
+                    key = dict(onnxruntime=onnxruntime.__version__, providers=providers, cpu=get_cpu_info())
+                    f = model_cache_file(cache_dir, w, ".onnx", **key, session_options=session_options)
+                if f and f.is_file():
+                    LOGGER.info(f"Loading optimized graph {f}")
+                    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+                    session = onnxruntime.InferenceSession(str(f), options, providers=providers)
+                else:
+                    if f:  # ONNX Runtime writes the graph while creating the session, move it in place after
+                        options.optimized_model_filepath = str(_cache_tmp(f))
+                    session = onnxruntime.InferenceSession(w, options, providers=providers)
+                    if f:
+                        Path(options.optimized_model_filepath).replace(f)
             else:
                 check_requirements(
                     ["model-compression-toolkit==2.1.1", "sony-custom-layers[torch]==0.2.0", "onnxruntime-extensions"]
@@ -219,20 +379,7 @@ class AutoBackend(nn.Module):
             output_names = [x.name for x in session.get_outputs()]
             metadata = session.get_modelmeta().custom_metadata_map
             dynamic = isinstance(session.get_outputs()[0].shape[0], str)
-            if not dynamic:
-                io = session.io_binding()
-                bindings = []
-                for output in session.get_outputs():
-                    y_tensor = torch.empty(output.shape, dtype=torch.float16 if fp16 else torch.float32).to(device)
-                    io.bind_output(
-                        name=output.name,
-                        device_type=device.type,
-                        device_id=device.index if cuda else 0,
-                        element_type=np.float16 if fp16 else np.float32,
-                        shape=tuple(y_tensor.shape),
-                        buffer_ptr=y_tensor.data_ptr(),
-                    )
-                    bindings.append(y_tensor)
+            io_bindings, num_io_bindings = [], 1  # ring of IO bindings with their output tensors, see _ort_forward
 
         # OpenVINO
         elif xml:
@@ -241,6 +388,8 @@ class AutoBackend(nn.Module):
             import openvino as ov
 
             core = ov.Core()
+            if cache_dir:  # OpenVINO keys compiled blobs by model, device, config and version itself
+                core.set_property({"CACHE_DIR": str(Path(cache_dir) / "openvino")})
             w = Path(w)
             if not w.is_file():  # if not *.xml
                 w = next(w.glob("*.xml"))  # get *.xml file from *_openvino_model dir
@@ -248,8 +397,9 @@ class AutoBackend(nn.Module):
             if ov_model.get_parameters()[0].get_layout().empty:
                 ov_model.get_parameters()[0].set_layout(ov.Layout("NCHW"))
 
-            # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (not recommended), or 'CUMULATIVE_THROUGHPUT'
-            inference_mode = "CUMULATIVE_THROUGHPUT" if batch > 1 else "LATENCY"
+            # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (CPU streams for overlapping requests of a stream
+            # of frames, see submit()), or 'CUMULATIVE_THROUGHPUT'
+            inference_mode = performance_hint or ("CUMULATIVE_THROUGHPUT" if batch > 1 else "LATENCY")
             LOGGER.info(f"Using OpenVINO {inference_mode} mode for batch={batch} inference...")
             ov_compiled_model = core.compile_model(
                 ov_model,
@@ -257,6 +407,7 @@ class AutoBackend(nn.Module):
                 config={"PERFORMANCE_HINT": inference_mode},
             )
             input_name = ov_compiled_model.input().get_any_name()
+            ov_queue, ov_lock = None, threading.Lock()  # persistent AsyncInferQueue, created on first submit()
             metadata = w.parent / "metadata.yaml"
 
         # TensorRT
@@ -477,7 +628,7 @@ class AutoBackend(nn.Module):
             for k, v in metadata.items():
                 if k in {"stride", "batch"}:
                     metadata[k] = int(v)
-                elif k in {"imgsz", "names", "kpt_shape"} and isinstance(v, str):
+                elif k in {"imgsz", "names", "kpt_shape", "args"} and isinstance(v, str):
                     metadata[k] = eval(v)
             stride = metadata["stride"]
             task = metadata["task"]
@@ -492,6 +643,22 @@ class AutoBackend(nn.Module):
         if "names" not in locals():  # names missing
             names = default_class_names(data)
         names = check_class_names(names)
+        frame_input = onnx and isinstance(metadata, dict) and metadata.get("args", {}).get("nms", False)  # end-to-end
+
+        # Compiled PyTorch inference, one compiled model per input shape and dtype built on first use
+        if compile_mode not in {None, "inductor", "jit"}:
+            raise ValueError(f"Invalid compile='{compile_mode}', valid modes are 'inductor', 'jit' or None (eager)")
+        if compile_mode and not pt:
+            LOGGER.warning(f"WARNING ⚠️ compile='{compile_mode}' is only supported for PyTorch models, ignoring")
+            compile_mode = None
+        compiled, graph_breaks = {}, []
+
+        # BF16 autocast on channels_last inputs, Detect heads decode boxes in FP32 under CPU bfloat16 autocast. Weights
+        # are converted to channels_last only when loaded here, in-memory modules are the caller's (e.g. YOLO.model,
+        # shared by ModelManager) and keep their layout for save(), export() and train(), convolutions still run
+        # channels_last on channels_last inputs
+        if bf16 and not nn_module:
+            model.to(memory_format=torch.channels_last)
 
         # Disable gradients
         if pt:
@@ -505,7 +672,8 @@ class AutoBackend(nn.Module):
         Runs inference on the YOLOv8 MultiBackend model.
 
         Args:
-            im (torch.Tensor): The image tensor to perform inference on.
+            im (torch.Tensor | np.ndarray): The image tensor to perform inference on, or one (H, W, 3) uint8 BGR frame
+                for `frame_input` models (ONNX exported with nms=True).
             augment (bool): whether to perform data augmentation during inference, defaults to False
             visualize (bool): whether to visualize the output predictions, defaults to False
             embed (list, optional): A list of feature vectors/embeddings to return.
@@ -513,6 +681,9 @@ class AutoBackend(nn.Module):
         Returns:
             (tuple): Tuple containing the raw output tensor, and processed output for visualization (if visualize=True)
         """
+        if self.frame_input:  # letterbox, normalization and NMS in the graph, (N, 6) detections in frame coordinates
+            return self.from_numpy(self.session.run(self.output_names, {"images": im})[0])
+
         b, ch, h, w = im.shape  # batch, channel, height, width
         if self.fp16 and im.dtype != torch.float16:
             im = im.half()  # to FP16
@@ -521,7 +692,15 @@ class AutoBackend(nn.Module):
 
         # PyTorch
         if self.pt or self.nn_module:
-            y = self.model(im, augment=augment, visualize=visualize, embed=embed)
+            if self.bf16:
+                im = im.contiguous(memory_format=torch.channels_last)  # no-op for channels_last predictor buffers
+            with torch.autocast("cpu", dtype=torch.bfloat16, enabled=self.bf16):
+                if self.compile_mode and not (augment or visualize or embed):
+                    y = self._compile(im)(im)
+                else:
+                    y = self.model(im, augment=augment, visualize=visualize, embed=embed)
+            if self.bf16:
+                y = _to_float(y)  # NMS, masks and keypoints in FP32
 
         # TorchScript
         elif self.jit:
@@ -535,46 +714,17 @@ class AutoBackend(nn.Module):
 
         # ONNX Runtime
         elif self.onnx or self.imx:
-            if self.dynamic:
-                im = im.cpu().numpy()  # torch to numpy
-                y = self.session.run(self.output_names, {self.session.get_inputs()[0].name: im})
-            else:
-                if not self.cuda:
-                    im = im.cpu()
-                self.io.bind_input(
-                    name="images",
-                    device_type=im.device.type,
-                    device_id=im.device.index if im.device.type == "cuda" else 0,
-                    element_type=np.float16 if self.fp16 else np.float32,
-                    shape=tuple(im.shape),
-                    buffer_ptr=im.data_ptr(),
-                )
-                self.session.run_with_iobinding(self.io)
-                y = self.bindings
+            y = self._ort_forward(im)
             if self.imx:
                 # boxes, conf, cls
-                y = np.concatenate([y[0], y[1][:, :, None], y[2][:, :, None]], axis=-1)
+                y = torch.cat([y[0], y[1][:, :, None], y[2][:, :, None]], -1)
 
         # OpenVINO
         elif self.xml:
             im = im.cpu().numpy()  # FP32
 
             if self.inference_mode in {"THROUGHPUT", "CUMULATIVE_THROUGHPUT"}:  # optimized for larger batch-sizes
-                n = im.shape[0]  # number of images in batch
-                results = [None] * n  # preallocate list with None to match the number of images
-
-                def callback(request, userdata):
-                    """Places result in preallocated list using userdata index."""
-                    results[userdata] = request.results
-
-                # Create AsyncInferQueue, set the callback and start asynchronous inference for each input image
-                async_queue = self.ov.runtime.AsyncInferQueue(self.ov_compiled_model)
-                async_queue.set_callback(callback)
-                for i in range(n):
-                    # Start async inference with userdata=i to specify the position in results list
-                    async_queue.start_async(inputs={self.input_name: im[i : i + 1]}, userdata=i)  # keep image as BCHW
-                async_queue.wait_all()  # wait for all inference requests to complete
-                y = np.concatenate([list(r.values())[0] for r in results])
+                return self.submit(im).result()  # one request per image on the persistent AsyncInferQueue
 
             else:  # inference_mode = "LATENCY", optimized for fastest first result at batch-size 1
                 y = list(self.ov_compiled_model(im).values())
@@ -695,6 +845,10 @@ class AutoBackend(nn.Module):
 
         # for x in y:
         #     print(type(x), len(x)) if isinstance(x, (list, tuple)) else print(type(x), x.shape)  # debug shapes
+        return self._to_tensors(y)
+
+    def _to_tensors(self, y):
+        """Convert raw backend outputs to the torch tensor (or list of tensors) returned by forward()."""
         if isinstance(y, (list, tuple)):
             if len(self.names) == 999 and (self.task == "segment" or len(y) == 2):  # segments and names not defined
                 nc = y[0].shape[1] - y[1].shape[1] - 4  # y = (1, 32, 160, 160), (1, 116, 8400)
@@ -703,6 +857,166 @@ class AutoBackend(nn.Module):
         else:
             return self.from_numpy(y)
 
+    def _compile(self, im):
+        """
+        Return the model compiled for the shape and dtype of `im`, compiling it on first use.
+
+        'inductor' wraps the model in torch.compile with static shapes and logs the graph breaks found by TorchDynamo,
+        which are also kept in `graph_breaks`. 'jit' traces and freezes the model as TorchScript. With `cache_dir`,
+        inductor kernels and frozen TorchScript models are reused across starts.
+
+        Args:
+            im (torch.Tensor): Input batch of the shape and dtype to compile for.
+
+        Returns:
+            (Callable): The compiled model.
+        """
+        key = (tuple(im.shape), im.dtype, self.fp16, self.bf16)  # bf16 autocast casts are traced into the graph
+        if key in self.compiled:
+            return self.compiled[key]
+
+        LOGGER.info(f"Compiling model with compile='{self.compile_mode}' for input {key[0]} {key[1]}...")
+        source = Path(getattr(self.model, "pt_path", ""))
+        if self.compile_mode == "inductor":
+            if self.cache_dir:  # inductor only reads its cache dir from the environment, so it is process-wide
+                inductor_dir = str(Path(self.cache_dir) / "inductor")
+                current = os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", inductor_dir)
+                if current == inductor_dir:
+                    LOGGER.info(f"Caching inductor kernels of all models in this process in {current}")
+                else:
+                    LOGGER.warning(f"WARNING ⚠️ Inductor cache is process-wide, using {current} not {inductor_dir}")
+            explanation = torch._dynamo.explain(self.model)(im)
+            self.graph_breaks = [str(x.reason) for x in explanation.break_reasons]
+            LOGGER.info(
+                f"torch.compile: {explanation.graph_count} graphs, {explanation.graph_break_count} graph breaks"
+                + "".join(f"\n  {r}" for r in self.graph_breaks)
+            )
+            model = torch.compile(self.model, backend="inductor", dynamic=False)
+        elif self.cache_dir and source.is_file():
+            f = model_cache_file(
+                self.cache_dir,
+                source,
+                ".torchscript",
+                torch=torch.__version__,
+                shape=key[:2],
+                jit=True,
+                fp16=self.fp16,
+                bf16=self.bf16,
+            )
+            if f.is_file():
+                model = torch.jit.load(f, map_location=self.device)
+            else:
+                model = _optimize_torchscript(self.model, im)
+                tmp = _cache_tmp(f)
+                torch.jit.save(model, tmp)
+                tmp.replace(f)
+        else:
+            model = _optimize_torchscript(self.model, im)
+        self.compiled[key] = model
+        return model
+
+    @property
+    def asynchronous(self):
+        """Whether submit() overlaps inference of consecutive batches, i.e. OpenVINO with a THROUGHPUT hint."""
+        return self.xml and self.inference_mode in {"THROUGHPUT", "CUMULATIVE_THROUGHPUT"}
+
+    def submit(self, im):
+        """
+        Start OpenVINO inference of a batch on the persistent AsyncInferQueue without waiting for it to finish.
+
+        Every image is its own infer request, so images of one batch and of consecutive batches (e.g. frames from
+        several cameras) run in parallel on the CPU streams of the THROUGHPUT hints. Inputs are copied into the
+        requests, and `start_async` only blocks while all requests are busy.
+
+        Args:
+            im (torch.Tensor | np.ndarray): The (B, 3, H, W) input batch.
+
+        Returns:
+            (concurrent.futures.Future): Resolved with the same outputs as forward(im) once every image is done.
+
+        Examples:
+            >>> futures = [model.submit(im) for im in batches]  # queue several batches
+            >>> preds = [f.result() for f in futures]
+        """
+        if self.ov_queue is None:
+            self.ov_queue = self.ov.runtime.AsyncInferQueue(self.ov_compiled_model)  # optimal number of requests
+            self.ov_queue.set_callback(self._ov_callback)
+        if isinstance(im, torch.Tensor):
+            im = im.cpu().numpy()  # FP32
+        future, outputs, pending = Future(), [None] * len(im), [len(im)]
+        for i in range(len(im)):
+            self.ov_queue.start_async(inputs={self.input_name: im[i : i + 1]}, userdata=(future, outputs, pending, i))
+        return future
+
+    def _ov_callback(self, request, userdata):
+        """
+        Store the outputs of a finished infer request and resolve the batch future after its last image.
+
+        Exceptions raised in the callback are lost in OpenVINO's thread, so they are set on the future instead and the
+        callers waiting on it do not block forever.
+        """
+        future, outputs, pending, i = userdata
+        if future.done():  # an earlier image of the batch failed
+            return
+        try:
+            outputs[i] = [x.data.copy() for x in request.output_tensors]  # copy, the request is reused by the queue
+            with self.ov_lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            future.set_result(self._to_tensors([np.concatenate(x) for x in zip(*outputs)]))
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+
+    def _ort_forward(self, im):
+        """
+        Run ONNX Runtime with the input and outputs bound to torch tensors, without numpy conversions or copies.
+
+        Outputs are written into tensors preallocated for the input shape and reused by later calls with that shape.
+        Bindings are used round-robin from a ring of `num_io_bindings`, so returned outputs are overwritten
+        `num_io_bindings` calls later (the pipelined predictor keeps one per batch in flight). On the first call with
+        a new input shape, ONNX Runtime allocates the outputs of a dynamic model itself, which gives their shapes.
+
+        Args:
+            im (torch.Tensor): (B, 3, H, W) input, moved to CPU unless running on CUDA.
+
+        Returns:
+            (List[torch.Tensor]): Model outputs on `self.device`.
+        """
+        im = (im if self.cuda else im.cpu()).contiguous()
+        device_type, device_id = im.device.type, im.device.index or 0
+        element_type = np.float16 if self.fp16 else np.float32
+        del self.io_bindings[: max(len(self.io_bindings) - self.num_io_bindings, 0)]
+        slot = self.io_bindings.pop(0) if len(self.io_bindings) == self.num_io_bindings else None  # least recently used
+        if slot is None:
+            slot = {"io": self.session.io_binding(), "shape": None, "outputs": []}
+        self.io_bindings.append(slot)
+        io = slot["io"]
+        io.bind_input("images", device_type, device_id, element_type, tuple(im.shape), im.data_ptr())
+
+        if slot["shape"] != im.shape:
+            io.clear_binding_outputs()
+            if self.dynamic:  # output shapes unknown until ONNX Runtime has run this input shape
+                for name in self.output_names:
+                    io.bind_output(name, device_type, device_id)
+                self.session.run_with_iobinding(io)
+                y = io.copy_outputs_to_cpu()
+                specs = [(x.shape, x.dtype) for x in y]
+                y = [torch.from_numpy(x).to(self.device) for x in y]
+                io.clear_binding_outputs()
+            else:
+                y, specs = None, [(output.shape, element_type) for output in self.session.get_outputs()]
+            slot["outputs"] = [torch.from_numpy(np.empty(shape, dtype)).to(im.device) for shape, dtype in specs]
+            for name, x, (shape, dtype) in zip(self.output_names, slot["outputs"], specs):
+                io.bind_output(name, device_type, device_id, dtype, shape, x.data_ptr())
+            slot["shape"] = im.shape
+            if y is not None:
+                return y
+
+        self.session.run_with_iobinding(io)
+        return slot["outputs"]
+
     def from_numpy(self, x):
         """
         Convert a numpy array to a tensor.
@@ -727,6 +1041,8 @@ class AutoBackend(nn.Module):
         warmup_types = self.pt, self.jit, self.onnx, self.engine, self.saved_model, self.pb, self.triton, self.nn_module
         if any(warmup_types) and (self.device.type != "cpu" or self.triton):
             im = torch.empty(*imgsz, dtype=torch.half if self.fp16 else torch.float, device=self.device)  # input
+            if self.frame_input:
+                im = np.zeros((*imgsz[2:], 3), dtype=np.uint8)  # one BGR frame
             for _ in range(2 if self.jit else 1):
                 self.forward(im)  # warmup
 
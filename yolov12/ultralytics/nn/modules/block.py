@@ -1,10 +1,13 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 """Block modules."""
 
+import functools
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 
+from ultralytics.utils import LOGGER
 from ultralytics.utils.torch_utils import fuse_conv_and_bn
 
 from .conv import Conv, DWConv, GhostConv, LightConv, RepConv, autopad
@@ -1157,21 +1160,136 @@ class TorchVision(nn.Module):
             y = self.m(x)
         return y
 
-import logging
-logger = logging.getLogger(__name__)
-
-USE_FLASH_ATTN = False
-try:
-    import torch
-    if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 8:  # Ampere or newer
-        from flash_attn.flash_attn_interface import flash_attn_func
-        USE_FLASH_ATTN = True
-    else:
-        from torch.nn.functional import scaled_dot_product_attention as sdpa
-        logger.warning("FlashAttention is not available on this device. Using scaled_dot_product_attention instead.")
-except Exception:
-    from torch.nn.functional import scaled_dot_product_attention as sdpa
-    logger.warning("FlashAttention is not available on this device. Using scaled_dot_product_attention instead.")
+sdpa = getattr(F, "scaled_dot_product_attention", None)  # torch>=2.0
+
+
+@functools.lru_cache(maxsize=None)
+def flash_attn_func_for(device):
+    """Return `flash_attn_func` if FlashAttention can run on CUDA `device`, else None. Probed once per device."""
+    try:
+        if torch.cuda.get_device_capability(device)[0] >= 8:  # Ampere or newer
+            from flash_attn.flash_attn_interface import flash_attn_func
+
+            return flash_attn_func
+    except Exception:
+        pass
+    LOGGER.warning(f"WARNING ⚠️ FlashAttention is not available on {device}, using scaled_dot_product_attention.")
+    return None
+
+
+def attention_flash(q, k, v):
+    """FlashAttention over (B, heads, N, head_dim) CUDA tensors, computed in FP16 unless the inputs are BF16."""
+    dtype = q.dtype
+    half = dtype if dtype in {torch.float16, torch.bfloat16} else torch.float16
+    q, k, v = (t.transpose(1, 2).contiguous().to(half) for t in (q, k, v))  # (B, N, heads, head_dim)
+    return flash_attn_func_for(q.device)(q, k, v).to(dtype).transpose(1, 2)
+
+
+def attention_math(q, k, v):
+    """Reference attention over (B, heads, N, head_dim) tensors, materialising the full N x N score matrix."""
+    attn = (q @ k.transpose(-2, -1)) * (q.shape[-1] ** -0.5)
+    max_attn = attn.max(dim=-1, keepdim=True).values
+    exp_attn = torch.exp(attn - max_attn)
+    attn = exp_attn / exp_attn.sum(dim=-1, keepdim=True)
+    return attn @ v
+
+
+def attention_tiled(q, k, v, chunk=1024):
+    """
+    Attention over (B, heads, N, head_dim) tensors in blocks of `chunk` queries.
+
+    Each query block sees all keys, so its softmax is exact, while the score matrix held at any time is bounded to
+    B x heads x chunk x N instead of B x heads x N x N. Blocks are written into one output tensor at inference and
+    concatenated when gradients are needed, as autograd does not support `out=`.
+    """
+    if q.shape[2] <= chunk:
+        return torch.softmax((q @ k.transpose(-2, -1)) * (q.shape[-1] ** -0.5), dim=-1) @ v
+    k = k.transpose(-2, -1) * (q.shape[-1] ** -0.5)
+    if torch.is_grad_enabled() and any(t.requires_grad for t in (q, k, v)):
+        return torch.cat([torch.softmax(qi @ k, dim=-1) @ v for qi in q.split(chunk, dim=2)], 2)
+    out = torch.empty_like(q)
+    for i in range(0, q.shape[2], chunk):
+        torch.matmul(torch.softmax(q[:, :, i : i + chunk] @ k, dim=-1), v, out=out[:, :, i : i + chunk])
+    return out
+
+
+def attention_sdpa(q, k, v):
+    """Fused attention over (B, heads, N, head_dim) tensors, memory-efficient kernels on CPU and CUDA."""
+    return sdpa(q, k, v) if sdpa is not None else attention_tiled(q, k, v)
+
+
+class MultiHeadAttentionExport(torch.autograd.Function):
+    """Scaled dot-product attention that exports to ONNX as one ONNX Runtime `com.microsoft::MultiHeadAttention` op."""
+
+    @staticmethod
+    def forward(ctx, q, k, v, num_heads):
+        """Compute attention over (B, heads, N, head_dim) tensors for tracing."""
+        return attention_sdpa(q, k, v)
+
+    @staticmethod
+    def symbolic(g, q, k, v, num_heads):
+        """Emit (B, N, heads * head_dim) inputs to MultiHeadAttention, the head transposes cancel out when optimized."""
+        packed = g.op("Constant", value_t=torch.tensor([0, 0, -1]))
+        out_type = q.type()  # contrib ops have no ONNX shape inference, so keep the traced shape for constant folding
+        q, k, v = (g.op("Reshape", g.op("Transpose", t, perm_i=[0, 2, 1, 3]), packed) for t in (q, k, v))
+        x = g.op("com.microsoft::MultiHeadAttention", q, k, v, num_heads_i=num_heads)
+        x = g.op("Reshape", x, g.op("Constant", value_t=torch.tensor([0, 0, num_heads, -1])))
+        x = g.op("Transpose", x, perm_i=[0, 2, 1, 3])
+        x.setType(out_type)
+        return x
+
+
+def attention_mha(q, k, v):
+    """Same as 'sdpa', but exported to ONNX as a fused MultiHeadAttention op instead of MatMul/Softmax/MatMul."""
+    if torch.onnx.is_in_onnx_export():
+        return MultiHeadAttentionExport.apply(q, k, v, int(q.shape[1]))  # heads are constant in the graph
+    return attention_sdpa(q, k, v)
+
+
+ATTENTION_BACKENDS = {
+    "flash": attention_flash,
+    "sdpa": attention_sdpa,
+    "tiled": attention_tiled,
+    "math": attention_math,
+    "mha": attention_mha,
+}
+
+
+def resolve_attention_backend(x, backend=None):
+    """
+    Pick the attention backend for input `x`.
+
+    Args:
+        x (torch.Tensor): Input of the attention module, its device decides whether FlashAttention can be used.
+        backend (str, optional): Forced key of `ATTENTION_BACKENDS`, None for 'flash' where available else 'sdpa'. A
+            forced 'flash' also falls back to 'sdpa' where FlashAttention is unavailable.
+
+    Returns:
+        (str): Key of `ATTENTION_BACKENDS`.
+    """
+    if backend in {None, "flash"}:
+        return "flash" if x.is_cuda and flash_attn_func_for(x.device) is not None else "sdpa"
+    return backend
+
+
+def set_attention_backend(model, backend=None):
+    """
+    Force the attention backend of every `AAttn` in `model`, None restores per-input automatic selection.
+
+    Args:
+        model (nn.Module): Model to update in place.
+        backend (str, optional): Key of `ATTENTION_BACKENDS`.
+
+    Returns:
+        (nn.Module): The updated model.
+    """
+    if backend is not None and backend not in ATTENTION_BACKENDS:
+        raise ValueError(f"Invalid attention backend '{backend}', valid backends are {list(ATTENTION_BACKENDS)}.")
+    for m in model.modules():
+        if isinstance(m, AAttn):
+            m.backend = backend
+    return model
+
 
 class AAttn(nn.Module):
     """
@@ -1181,6 +1299,8 @@ class AAttn(nn.Module):
         dim (int): Number of hidden channels;
         num_heads (int): Number of heads into which the attention mechanism is divided;
         area (int, optional): Number of areas the feature map is divided. Defaults to 1.
+        backend (str | None): Forced key of `ATTENTION_BACKENDS`. Defaults to None, which resolves the backend on the
+            first forward for each input device and dtype, see `resolve_attention_backend`.
 
     Methods:
         forward: Performs a forward process of input tensor and outputs a tensor after the execution of the area attention mechanism.
@@ -1212,7 +1332,14 @@ class AAttn(nn.Module):
         self.proj = Conv(all_head_dim, dim, 1, act=False)
 
         self.pe = Conv(all_head_dim, dim, 5, 1, 2, g=dim, act=False)
+        self.backend = None
+        self.resolved = None  # ((device, dtype, backend), resolved backend) of the last forward
 
+    @property
+    def attention_backend(self):
+        """Backend resolved by the last forward, else the forced `backend` or 'auto'."""
+        resolved = getattr(self, "resolved", None)
+        return resolved[1] if resolved else getattr(self, "backend", None) or "auto"
 
     def forward(self, x):
         """Processes the input tensor 'x' through the area-attention"""
@@ -1230,28 +1357,13 @@ class AAttn(nn.Module):
             B, N, _ = qk.shape
         q, k = qk.split([C, C], dim=2)
 
-        if x.is_cuda and USE_FLASH_ATTN:
-            q = q.view(B, N, self.num_heads, self.head_dim)
-            k = k.view(B, N, self.num_heads, self.head_dim)
-            v = v.view(B, N, self.num_heads, self.head_dim)
-
-            x = flash_attn_func(
-                q.contiguous().half(),
-                k.contiguous().half(),
-                v.contiguous().half()
-            ).to(q.dtype)
-        else:
-            q = q.transpose(1, 2).view(B, self.num_heads, self.head_dim, N)
-            k = k.transpose(1, 2).view(B, self.num_heads, self.head_dim, N)
-            v = v.transpose(1, 2).view(B, self.num_heads, self.head_dim, N)
-
-            attn = (q.transpose(-2, -1) @ k) * (self.head_dim ** -0.5)
-            max_attn = attn.max(dim=-1, keepdim=True).values
-            exp_attn = torch.exp(attn - max_attn)
-            attn = exp_attn / exp_attn.sum(dim=-1, keepdim=True)
-            x = (v @ attn.transpose(-2, -1))
-
-            x = x.permute(0, 3, 1, 2)
+        key = (x.device, x.dtype, getattr(self, "backend", None))  # checkpoints may predate `backend`
+        if getattr(self, "resolved", None) is None or self.resolved[0] != key:
+            self.resolved = key, resolve_attention_backend(x, key[2])
+        q = q.view(B, N, self.num_heads, self.head_dim).transpose(1, 2)
+        k = k.view(B, N, self.num_heads, self.head_dim).transpose(1, 2)
+        v = v.view(B, N, self.num_heads, self.head_dim).transpose(1, 2)
+        x = ATTENTION_BACKENDS[self.resolved[1]](q, k, v).transpose(1, 2)  # (B, N, heads, head_dim)
 
         if self.area > 1:
             x = x.reshape(B // self.area, N * self.area, C)
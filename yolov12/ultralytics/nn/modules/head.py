@@ -9,6 +9,7 @@ import torch.nn as nn
 from torch.nn.init import constant_, xavier_uniform_
 
 from ultralytics.utils.tal import TORCH_1_10, dist2bbox, dist2rbox, make_anchors
+from ultralytics.utils.torch_utils import cpu_autocast_bf16
 
 from .block import DFL, BNContrastiveHead, ContrastiveHead, Proto
 from .conv import Conv, DWConv
@@ -99,6 +100,10 @@ class Detect(nn.Module):
 
     def _inference(self, x):
         """Decode predicted bounding boxes and class probabilities based on multiple-level feature maps."""
+        if not self.export and cpu_autocast_bf16():  # decode in FP32, bfloat16 distances and anchors lose pixels
+            with torch.autocast("cpu", enabled=False):
+                return self._inference([xi.float() for xi in x])
+
         # Inference path
         shape = x[0].shape  # BCHW
         x_cat = torch.cat([xi.view(shape[0], self.no, -1) for xi in x], 2)
@@ -1,7 +1,9 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from .array_byte_tracker import ArrayBYTETracker
 from .bot_sort import BOTSORT
 from .byte_tracker import BYTETracker
+from .partitioned_tracker import PartitionedTracker
 from .track import register_tracker
 
-__all__ = "register_tracker", "BOTSORT", "BYTETracker"  # allow simpler import
+__all__ = "register_tracker", "ArrayBYTETracker", "BOTSORT", "BYTETracker", "PartitionedTracker"  # allow simpler import
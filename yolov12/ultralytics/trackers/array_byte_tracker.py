@@ -0,0 +1,441 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import numpy as np
+
+from ..utils.metrics import batch_probiou, bbox_ioa
+from ..utils.ops import xywh2ltwh
+from .basetrack import BaseTrack, TrackState
+from .byte_tracker import STrack
+from .utils import matching
+from .utils.kalman_filter import KalmanFilterXYAH
+
+
+class ArrayBYTETracker:
+    """
+    Struct-of-arrays ByteTrack: all track state lives in contiguous NumPy arrays instead of one STrack per track.
+
+    Track means, covariances, states, ids, scores and ages are rows of preallocated arrays (the "pool"), and the
+    tracked/lost lists are ordered arrays of row indices into it. Kalman predict, update, GMC and IoU costs run as
+    single batched operations over all affected rows. The association logic is the same as `BYTETracker`, so both
+    trackers return the same `update(results, img)` output for the same detections.
+
+    Attributes:
+        frame_id (int): The current frame ID.
+        args (Namespace): Tracker arguments, see `cfg/trackers/bytetrack.yaml`.
+        max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
+        kalman_filter (KalmanFilterXYAH): Kalman Filter object.
+        mean (np.ndarray): (C, 8) Kalman state means of the pool.
+        covariance (np.ndarray): (C, 8, 8) Kalman state covariances of the pool.
+        state (np.ndarray): (C,) TrackState of each row.
+        track_id (np.ndarray): (C,) Track ids.
+        tracked (np.ndarray): Ordered pool rows of tracked tracks.
+        lost (np.ndarray): Ordered pool rows of lost tracks.
+
+    Methods:
+        update(results, img=None): Updates the tracker with new detections and returns the tracked objects.
+        reset(): Resets the tracker to its initial state.
+        state_dict(): Returns the tracker state as arrays, for snapshots.
+        load_state_dict(state): Restores the tracker from a state dict.
+
+    Examples:
+        >>> tracker = ArrayBYTETracker(args, frame_rate=30)
+        >>> tracks = tracker.update(results.boxes.cpu().numpy(), img)
+    """
+
+    # Per-track pool arrays, one row per track
+    POOL_FIELDS = (
+        "mean",
+        "covariance",
+        "state",
+        "track_id",
+        "is_activated",
+        "score",
+        "cls",
+        "idx",
+        "angle",
+        "frame_ids",
+        "start_frame",
+        "tracklet_len",
+    )
+
+    def __init__(self, args, frame_rate=30, capacity=64):
+        """
+        Initialize an ArrayBYTETracker with a preallocated pool of `capacity` tracks.
+
+        Args:
+            args (Namespace): Tracker arguments containing track_buffer, thresholds, fuse_score and optionally
+                sparse_match to associate only overlapping boxes with `matching.sparse_linear_assignment`,
+                class_aware to never match a track with a detection of another class, and std_weight_position /
+                std_weight_velocity for the Kalman filter noise.
+            frame_rate (int): Frame rate of the video sequence.
+            capacity (int): Initial number of pool rows, grown by doubling when needed.
+        """
+        self.args = args
+        self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
+        self.sparse_match = getattr(args, "sparse_match", False)  # optional keys, off for older tracker YAMLs
+        self.class_aware = getattr(args, "class_aware", False)
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        """Resets the tracker by clearing all tracks and reinitializing the Kalman filter."""
+        c = self.capacity
+        self.mean = np.zeros((c, 8))
+        self.covariance = np.zeros((c, 8, 8))
+        self.state = np.zeros(c, dtype=np.int8)
+        self.track_id = np.zeros(c, dtype=np.int64)
+        self.is_activated = np.zeros(c, dtype=bool)
+        self.score = np.zeros(c, dtype=np.float32)
+        self.cls = np.zeros(c, dtype=np.float32)
+        self.idx = np.zeros(c)
+        self.angle = np.full(c, np.nan)
+        self.frame_ids = np.zeros(c, dtype=np.int64)
+        self.start_frame = np.zeros(c, dtype=np.int64)
+        self.tracklet_len = np.zeros(c, dtype=np.int64)
+        self._free = list(range(c - 1, -1, -1))  # stack of free rows, lowest row popped first
+
+        self.tracked = np.empty(0, dtype=np.int64)
+        self.lost = np.empty(0, dtype=np.int64)
+        self.removed_ids = []  # ids of removed tracks, clipped like BYTETracker.removed_stracks
+        self.frame_id = 0
+        self.kalman_filter = self.get_kalmanfilter()
+        self.reset_id()
+
+    def get_kalmanfilter(self):
+        """Returns a KalmanFilterXYAH, with the noise weights from the tracker arguments when they are set."""
+        weights = {k: v for k, v in vars(self.args).items() if k in {"std_weight_position", "std_weight_velocity"}}
+        return KalmanFilterXYAH(**weights)
+
+    @staticmethod
+    def reset_id():
+        """Resets the shared track ID counter, same counter as STrack."""
+        BaseTrack.reset_id()
+
+    def _alloc(self, n):
+        """Reserve `n` free pool rows, growing all arrays by doubling if needed."""
+        if n > len(self._free):
+            old = self.capacity
+            new = max(old * 2, old + n)
+            for name in self.POOL_FIELDS:
+                arr = getattr(self, name)
+                grown = np.full((new, *arr.shape[1:]), np.nan if name == "angle" else 0, dtype=arr.dtype)
+                grown[:old] = arr
+                setattr(self, name, grown)
+            self._free = list(range(new - 1, old - 1, -1)) + self._free
+            self.capacity = new
+        return np.array([self._free.pop() for _ in range(n)], dtype=np.int64)
+
+    @staticmethod
+    def _detections(dets, scores, cls):
+        """Vectorized equivalent of `STrack(xywh, score, cls)` for every row of `dets`, as a dict of arrays."""
+        tlwh = xywh2ltwh(dets[:, :4]).astype(np.float32)
+        xyah = tlwh.copy()
+        xyah[:, :2] += xyah[:, 2:] / 2
+        xyah[:, 2] /= xyah[:, 3]
+        xyxy = tlwh.copy()
+        xyxy[:, 2:] += xyxy[:, :2]
+        angle = dets[:, 4] if dets.shape[1] == 6 else np.full(len(dets), np.nan)
+        return {
+            "tlwh": tlwh,
+            "xyah": xyah,
+            "xyxy": xyxy,
+            "score": scores,
+            "cls": cls,
+            "idx": dets[:, -1],
+            "angle": angle,
+        }
+
+    @staticmethod
+    def _select(det, rows):
+        """Return the detections at `rows`."""
+        return {k: v[rows] for k, v in det.items()}
+
+    def _track_tlwh(self, rows):
+        """Track boxes in (top left x, top left y, width, height) format from the Kalman means."""
+        ret = self.mean[rows, :4].copy()
+        ret[:, 2] *= ret[:, 3]
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
+
+    def _track_boxes(self, rows):
+        """Track boxes used for IoU, xyxy or xywha for oriented tracks."""
+        tlwh = self._track_tlwh(rows)
+        if len(rows) and not np.isnan(self.angle[rows[0]]):
+            tlwh[:, :2] += tlwh[:, 2:] / 2
+            return np.concatenate([tlwh, self.angle[rows, None]], axis=1)
+        tlwh[:, 2:] += tlwh[:, :2]
+        return tlwh
+
+    @staticmethod
+    def _det_boxes(det):
+        """Detection boxes used for IoU, xyxy or xywha for oriented detections."""
+        if len(det["angle"]) and not np.isnan(det["angle"][0]):
+            xywh = det["tlwh"].copy()
+            xywh[:, :2] += xywh[:, 2:] / 2
+            return np.concatenate([xywh, det["angle"][:, None]], axis=1)
+        return det["xyxy"]
+
+    @staticmethod
+    def _iou_distance(a, b):
+        """Batched equivalent of `matching.iou_distance` on box arrays."""
+        ious = np.zeros((len(a), len(b)), dtype=np.float32)
+        if len(a) and len(b):
+            a, b = np.ascontiguousarray(a, dtype=np.float32), np.ascontiguousarray(b, dtype=np.float32)
+            ious = batch_probiou(a, b).numpy() if a.shape[1] == 5 and b.shape[1] == 5 else bbox_ioa(a, b, iou=True)
+        return 1 - ious
+
+    def associate(self, rows, det, thresh, fuse_score=False):
+        """Match track `rows` to detections `det` on IoU cost, returns (K, 2) matches and unmatched index arrays."""
+        a, b = self._track_boxes(rows), self._det_boxes(det)
+        if self.sparse_match and a.shape[1] == 4 and b.shape[1] == 4:
+            ia, ib, cost = matching.sparse_iou_distance(a, b)
+            if fuse_score:
+                cost = 1 - (1 - cost) * det["score"][ib]
+            if self.class_aware:
+                cost[self.cls[rows[ia]] != det["cls"][ib]] = 1.0
+            return matching.sparse_linear_assignment(ia, ib, cost, (len(a), len(b)), thresh)
+        dists = self._iou_distance(a, b)
+        if fuse_score and dists.size:
+            dists = 1 - (1 - dists) * det["score"][None]
+        if self.class_aware and dists.size:
+            dists[self.cls[rows][:, None] != det["cls"][None]] = 1.0  # block-diagonal by class
+        return self._assign(dists, thresh)
+
+    @staticmethod
+    def _assign(dists, thresh):
+        """Run `matching.linear_assignment` and return matches as an (K, 2) int array and unmatched index arrays."""
+        matches, u_a, u_b = matching.linear_assignment(dists, thresh=thresh)
+        return (
+            np.asarray(matches, dtype=np.int64).reshape(-1, 2),
+            np.asarray(u_a, dtype=np.int64),
+            np.asarray(u_b, dtype=np.int64),
+        )
+
+    def multi_predict(self, rows):
+        """Kalman predict for all `rows` in one batched step, zeroing the height velocity of non-tracked tracks."""
+        if len(rows) == 0:
+            return
+        mean = self.mean[rows].copy()
+        mean[self.state[rows] != TrackState.Tracked, 7] = 0
+        self.mean[rows], self.covariance[rows] = self.kalman_filter.multi_predict(mean, self.covariance[rows])
+
+    def multi_gmc(self, rows, H=np.eye(2, 3)):
+        """Apply the global motion homography `H` to the means and covariances of all `rows` at once."""
+        if len(rows) == 0:
+            return
+        R8x8 = np.kron(np.eye(4, dtype=float), H[:2, :2])
+        mean = self.mean[rows] @ R8x8.T
+        mean[:, :2] += H[:2, 2]
+        self.mean[rows] = mean
+        self.covariance[rows] = R8x8 @ self.covariance[rows] @ R8x8.T
+
+    def multi_update(self, rows, det):
+        """Kalman update of all `rows` with their matched detections `det` in one batched step."""
+        if len(rows):
+            self.mean[rows], self.covariance[rows] = self.kalman_filter.multi_update(
+                self.mean[rows], self.covariance[rows], det["xyah"]
+            )
+
+    def _update_tracks(self, rows, det, reactivate):
+        """Equivalent of `STrack.update` / `STrack.re_activate` for all matched `rows` at once."""
+        self.multi_update(rows, det)
+        self.tracklet_len[rows] = np.where(reactivate, 0, self.tracklet_len[rows] + 1)
+        self.state[rows] = TrackState.Tracked
+        self.is_activated[rows] = True
+        self.frame_ids[rows] = self.frame_id
+        self.score[rows] = det["score"]
+        self.cls[rows] = det["cls"]
+        self.angle[rows] = det["angle"]
+        self.idx[rows] = det["idx"]
+
+    def _activate(self, det):
+        """Equivalent of `STrack.activate` for all new detections, returns their pool rows."""
+        n = len(det["score"])
+        rows = self._alloc(n)
+        if n == 0:
+            return rows
+        self.track_id[rows] = [BaseTrack.next_id() for _ in range(n)]
+        h = det["xyah"][:, 3]
+        wp, wv = self.kalman_filter._std_weight_position, self.kalman_filter._std_weight_velocity
+        std_pos, std_vel = 2 * wp * h, 10 * wv * h
+        std = np.stack(
+            [std_pos, std_pos, np.full(n, 1e-2), std_pos, std_vel, std_vel, np.full(n, 1e-5), std_vel], axis=1
+        )
+        self.mean[rows] = 0
+        self.mean[rows, :4] = det["xyah"]
+        self.covariance[rows] = 0
+        self.covariance[rows[:, None], np.arange(8), np.arange(8)] = np.square(std)
+        self.tracklet_len[rows] = 0
+        self.state[rows] = TrackState.Tracked
+        self.is_activated[rows] = self.frame_id == 1
+        self.frame_ids[rows] = self.start_frame[rows] = self.frame_id
+        self.score[rows] = det["score"]
+        self.cls[rows] = det["cls"]
+        self.angle[rows] = det["angle"]
+        self.idx[rows] = det["idx"]
+        return rows
+
+    def _joint(self, a, b):
+        """Rows of `a` followed by rows of `b` whose track id is not in `a`."""
+        return np.concatenate([a, b[~np.isin(self.track_id[b], self.track_id[a])]])
+
+    def _sub(self, a, b_ids):
+        """Rows of `a` whose track id is not in `b_ids`."""
+        return a[~np.isin(self.track_id[a], b_ids)]
+
+    def remove_duplicate_tracks(self, tracked, lost):
+        """Removes duplicate tracks between the tracked and lost rows based on IoU, keeping the older track."""
+        a, b = self._track_boxes(tracked), self._track_boxes(lost)
+        if self.sparse_match and a.shape[1] == 4:
+            p, q, cost = matching.sparse_iou_distance(a, b)
+            p, q = p[cost < 0.15], q[cost < 0.15]
+        else:
+            p, q = np.where(self._iou_distance(a, b) < 0.15)
+        if self.class_aware:
+            same = self.cls[tracked[p]] == self.cls[lost[q]]
+            p, q = p[same], q[same]
+        timep = self.frame_ids[tracked[p]] - self.start_frame[tracked[p]]
+        timeq = self.frame_ids[lost[q]] - self.start_frame[lost[q]]
+        keep_a = np.ones(len(tracked), dtype=bool)
+        keep_b = np.ones(len(lost), dtype=bool)
+        keep_a[p[timep <= timeq]] = False
+        keep_b[q[timep > timeq]] = False
+        return tracked[keep_a], lost[keep_b]
+
+    def update(self, results, img=None):
+        """Updates the tracker with new detections and returns the current list of tracked objects."""
+        self.frame_id += 1
+        tracked_state = TrackState.Tracked
+
+        scores = results.conf
+        bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
+        bboxes = np.concatenate([bboxes, np.arange(len(bboxes)).reshape(-1, 1)], axis=-1)
+        cls = results.cls
+
+        remain_inds = scores >= self.args.track_high_thresh
+        inds_second = (scores > self.args.track_low_thresh) & (scores < self.args.track_high_thresh)
+        dets = bboxes[remain_inds]
+        detections = self._detections(dets, scores[remain_inds], cls[remain_inds])
+
+        # Step 1: split tracked rows into confirmed and unconfirmed, build the pool with lost tracks
+        activated_mask = self.is_activated[self.tracked]
+        unconfirmed = self.tracked[~activated_mask]
+        strack_pool = self._joint(self.tracked[activated_mask], self.lost)
+        self.multi_predict(strack_pool)
+        if hasattr(self, "gmc") and img is not None:
+            warp = self.gmc.apply(img, dets)
+            self.multi_gmc(strack_pool, warp)
+            self.multi_gmc(unconfirmed, warp)
+
+        # Step 2: first association, with high score detection boxes
+        matches, u_track, u_detection = self.associate(
+            strack_pool, detections, self.args.match_thresh, self.args.fuse_score
+        )
+        rows = strack_pool[matches[:, 0]]
+        refind = rows[self.state[rows] != tracked_state]
+        self._update_tracks(rows, self._select(detections, matches[:, 1]), self.state[rows] != tracked_state)
+
+        # Step 3: second association, with low score detection boxes
+        detections_second = self._detections(bboxes[inds_second], scores[inds_second], cls[inds_second])
+        r_tracked = strack_pool[u_track]
+        r_tracked = r_tracked[self.state[r_tracked] == tracked_state]
+        matches, u_track, _ = self.associate(r_tracked, detections_second, 0.5)
+        rows = r_tracked[matches[:, 0]]
+        self._update_tracks(rows, self._select(detections_second, matches[:, 1]), np.zeros(len(rows), dtype=bool))
+        new_lost = r_tracked[u_track]
+        self.state[new_lost] = TrackState.Lost
+
+        # Deal with unconfirmed tracks, usually tracks with only one beginning frame
+        detections = self._select(detections, u_detection)
+        matches, u_unconfirmed, u_detection = self.associate(unconfirmed, detections, 0.7, self.args.fuse_score)
+        rows = unconfirmed[matches[:, 0]]
+        self._update_tracks(rows, self._select(detections, matches[:, 1]), np.zeros(len(rows), dtype=bool))
+        self.state[unconfirmed[u_unconfirmed]] = TrackState.Removed
+        removed_ids = self.track_id[unconfirmed[u_unconfirmed]].tolist()
+
+        # Step 4: init new tracks
+        detections = self._select(detections, u_detection)
+        new = self._activate(self._select(detections, detections["score"] >= self.args.new_track_thresh))
+
+        # Step 5: update state
+        expired = self.lost[self.frame_id - self.frame_ids[self.lost] > self.max_time_lost]
+        self.state[expired] = TrackState.Removed
+        removed_ids += self.track_id[expired].tolist()
+
+        tracked = self.tracked[self.state[self.tracked] == tracked_state]
+        tracked = self._joint(self._joint(tracked, new), refind)
+        lost = self._sub(self.lost, self.track_id[tracked])
+        lost = np.concatenate([lost, new_lost])
+        lost = self._sub(lost, self.removed_ids)
+        self.tracked, self.lost = self.remove_duplicate_tracks(tracked, lost)
+        self.removed_ids.extend(removed_ids)
+        if len(self.removed_ids) > 1000:
+            self.removed_ids = self.removed_ids[-999:]  # clip removed ids to 1000 maximum
+
+        # Release pool rows that are neither tracked nor lost
+        alive = np.zeros(self.capacity, dtype=bool)
+        alive[self.tracked] = alive[self.lost] = True
+        in_use = np.ones(self.capacity, dtype=bool)
+        in_use[self._free] = False
+        self._free.extend(np.flatnonzero(in_use & ~alive)[::-1].tolist())
+        self._free.sort(reverse=True)
+
+        return self._results(self.tracked[self.is_activated[self.tracked]])
+
+    def _results(self, rows):
+        """Tracker output rows [xyxy | xywha, track_id, score, cls, idx] for the given pool rows."""
+        coords = self._track_boxes(rows)
+        extra = np.stack([self.track_id[rows], self.score[rows], self.cls[rows], self.idx[rows]], axis=1)
+        return np.concatenate([coords, extra], axis=1).astype(np.float32)
+
+    def _strack(self, row):
+        """Materialize an STrack view of a pool row, for inspection and compatibility (not used on the hot path)."""
+        angle = self.angle[row]
+        xywh = self.mean[row, :4].copy()
+        xywh[2] *= xywh[3]
+        xywh = np.r_[xywh, [angle] if not np.isnan(angle) else [], self.idx[row]]
+        track = STrack(xywh, self.score[row], self.cls[row])
+        track.kalman_filter = self.kalman_filter
+        track.mean, track.covariance = self.mean[row].copy(), self.covariance[row].copy()
+        track.track_id, track.state = int(self.track_id[row]), int(self.state[row])
+        track.is_activated = bool(self.is_activated[row])
+        track.frame_id, track.start_frame = int(self.frame_ids[row]), int(self.start_frame[row])
+        track.tracklet_len = int(self.tracklet_len[row])
+        return track
+
+    def state_dict(self):
+        """
+        Return the full tracker state as a dict of arrays and scalars, see `trackers/utils/snapshot.save_state`.
+
+        Only the rows of tracked and lost tracks are stored, tracked rows first. The shared track id counter is
+        included so tracks created after a restore do not reuse ids.
+        """
+        rows = np.concatenate([self.tracked, self.lost])
+        return {
+            **{name: getattr(self, name)[rows] for name in self.POOL_FIELDS},
+            "num_tracked": len(self.tracked),
+            "removed_ids": np.asarray(self.removed_ids, dtype=np.int64),
+            "frame_id": self.frame_id,
+            "next_id": BaseTrack._count,
+        }
+
+    def load_state_dict(self, state):
+        """Restore the tracker from a `state_dict()`, replacing all current tracks and the shared id counter."""
+        self.reset()
+        rows = self._alloc(len(state["track_id"]))
+        for name in self.POOL_FIELDS:
+            getattr(self, name)[rows] = state[name]
+        self.tracked, self.lost = rows[: state["num_tracked"]], rows[state["num_tracked"] :]
+        self.removed_ids = np.asarray(state["removed_ids"], dtype=np.int64).tolist()
+        self.frame_id = int(state["frame_id"])
+        BaseTrack._count = int(state["next_id"])
+
+    @property
+    def tracked_stracks(self):
+        """STrack views of the tracked tracks, in tracker order."""
+        return [self._strack(row) for row in self.tracked]
+
+    @property
+    def lost_stracks(self):
+        """STrack views of the lost tracks, in tracker order."""
+        return [self._strack(row) for row in self.lost]
@@ -2,7 +2,12 @@
 
 from collections import deque
 
+import cv2
 import numpy as np
+import torch
+
+from ultralytics.utils import ops
+from ultralytics.utils.torch_utils import select_device, smart_inference_mode
 
 from .basetrack import TrackState
 from .byte_tracker import BYTETracker, STrack
@@ -157,6 +162,7 @@ class BOTSORT(BYTETracker):
 
     Methods:
         get_kalmanfilter(): Returns an instance of KalmanFilterXYWH for object tracking.
+        update(results, img, features): Embeds all detections for ReID once, then updates the tracker.
         init_track(dets, scores, cls, img): Initialize track with detections, scores, and classes.
         get_dists(tracks, detections): Get distances between tracks and detections using IoU and (optionally) ReID.
         multi_predict(tracks): Predict and track multiple objects with YOLOv8 model.
@@ -189,21 +195,45 @@ class BOTSORT(BYTETracker):
         self.proximity_thresh = args.proximity_thresh
         self.appearance_thresh = args.appearance_thresh
 
-        if args.with_reid:
-            # Haven't supported BoT-SORT(reid) yet
-            self.encoder = None
-        self.gmc = GMC(method=args.gmc_method)
+        self.encoder = ReID(getattr(args, "reid_model", "yolo11n-cls.pt")) if args.with_reid else None
+        self.features = None  # ReID embeddings of the detections of the current frame
+        self.gmc = GMC(
+            method=args.gmc_method,
+            downscale=getattr(args, "gmc_downscale", 2),  # optional keys, defaults match older tracker YAMLs
+            interval=getattr(args, "gmc_interval", 1),
+            static_thresh=getattr(args, "gmc_static_thresh", 0.0),
+        )
 
     def get_kalmanfilter(self):
         """Returns an instance of KalmanFilterXYWH for predicting and updating object states in the tracking process."""
         return KalmanFilterXYWH()
 
+    def update(self, results, img=None, features=None):
+        """
+        Updates the tracker with new detections, embedding all of them for ReID in one forward pass first.
+
+        Args:
+            results (Boxes | SimpleNamespace): Detections with `conf`, `cls` and `xywh` (or `xywhr`) attributes.
+            img (np.ndarray | None): The original image, used by GMC and ReID.
+            features (np.ndarray | None): Precomputed (N, D) ReID embeddings of `results`, e.g. from one
+                `ReID.batch_inference` call over the frames of several cameras.
+
+        Returns:
+            (np.ndarray): Tracks in the same format as `BYTETracker.update`.
+        """
+        self.features = None
+        if self.args.with_reid and self.encoder is not None:
+            if features is None:
+                features = self.encoder.inference(img, results.xywhr if hasattr(results, "xywhr") else results.xywh)
+            self.features = features
+        return super().update(results, img)
+
     def init_track(self, dets, scores, cls, img=None):
         """Initialize object tracks using detection bounding boxes, scores, class labels, and optional ReID features."""
         if len(dets) == 0:
             return []
-        if self.args.with_reid and self.encoder is not None:
-            features_keep = self.encoder.inference(img, dets)
+        if self.features is not None:
+            features_keep = self.features[dets[:, -1].astype(int)]  # last column is the detection index
             return [BOTrack(xyxy, s, c, f) for (xyxy, s, c, f) in zip(dets, scores, cls, features_keep)]  # detections
         else:
             return [BOTrack(xyxy, s, c) for (xyxy, s, c) in zip(dets, scores, cls)]  # detections
@@ -231,3 +261,89 @@ class BOTSORT(BYTETracker):
         """Resets the BOTSORT tracker to its initial state, clearing all tracked objects and internal states."""
         super().reset()
         self.gmc.reset_params()
+
+
+class ReID:
+    """
+    Batched ReID encoder for BOTSORT, embedding all detection crops of one or more frames in a single forward pass.
+
+    Crops are resized to a fixed `imgsz` and stacked into one tensor, so ReID costs one model call per frame, or per
+    batch of frames across cameras, instead of one per box. Any Ultralytics model can be the embedding model, features
+    are the pooled output of its last layer before the head. A small classification model such as `yolo11n-cls.pt`
+    is a lightweight choice. Embeddings are L2-normalized and smoothed per track with an EMA by `BOTrack`.
+
+    Attributes:
+        weights (str): Path to the embedding model, loaded on first use.
+        imgsz (tuple): (height, width) every crop is resized to.
+        half (bool): Run the model in FP16.
+        model (torch.nn.Module | None): The loaded embedding model.
+
+    Methods:
+        inference(img, dets): Embeds the detections of one frame.
+        batch_inference(frames): Embeds the detections of several frames in one forward pass.
+
+    Examples:
+        >>> encoder = ReID("yolo11n-cls.pt")
+        >>> features = encoder.inference(img, boxes.xywh)  # (N, D) unit vectors
+    """
+
+    def __init__(self, model="yolo11n-cls.pt", imgsz=(128, 64), device="", half=False):
+        """
+        Initialize the ReID encoder without loading the model yet.
+
+        Args:
+            model (str): Path to the embedding model.
+            imgsz (tuple): (height, width) every crop is resized to.
+            device (str): Device to run the model on.
+            half (bool): Run the model in FP16.
+        """
+        self.weights = model
+        self.imgsz = imgsz
+        self.device = device
+        self.half = half
+        self.model = None
+
+    def load(self):
+        """Load and fuse the embedding model and pick the layer whose pooled output is used as the embedding."""
+        from ultralytics import YOLO
+
+        self.device = select_device(self.device, verbose=False)
+        model = YOLO(self.weights).model.fuse(verbose=False).to(self.device).eval()
+        self.model = model.half() if self.half else model.float()
+        self.embed = [len(self.model.model) - 2]
+
+    def crops(self, img, dets):
+        """Return the (x, y, w, h, ...) `dets` of `img` as resized BGR crops, shape (N, *imgsz, 3)."""
+        h, w = img.shape[:2]
+        xyxy = ops.xywh2xyxy(np.asarray(dets, dtype=np.float32)[:, :4]).round().astype(int)
+        xyxy[:, [0, 2]] = xyxy[:, [0, 2]].clip(0, w - 1)
+        xyxy[:, [1, 3]] = xyxy[:, [1, 3]].clip(0, h - 1)
+        size = (self.imgsz[1], self.imgsz[0])
+        return [cv2.resize(img[y1 : max(y2, y1 + 1), x1 : max(x2, x1 + 1)], size) for x1, y1, x2, y2 in xyxy]
+
+    @smart_inference_mode()
+    def batch_inference(self, frames):
+        """
+        Embed the detections of several frames in one forward pass.
+
+        Args:
+            frames (List[Tuple[np.ndarray, np.ndarray]]): (image, detections) pairs, detections in (x, y, w, h, ...).
+
+        Returns:
+            (List[np.ndarray]): One (N_i, D) float32 array of unit embeddings per frame.
+        """
+        crops = [self.crops(img, dets) if len(dets) else [] for img, dets in frames]
+        counts = [len(c) for c in crops]
+        if not sum(counts):
+            return [np.empty((0, 0), dtype=np.float32) for _ in frames]
+        if self.model is None:
+            self.load()
+        x = np.stack([c for frame in crops for c in frame])[..., ::-1].transpose(0, 3, 1, 2)  # BGR to RGB, BHWC to BCHW
+        x = torch.from_numpy(np.ascontiguousarray(x)).to(self.device)
+        x = (x.half() if self.half else x.float()) / 255
+        features = torch.nn.functional.normalize(torch.stack(self.model(x, embed=self.embed)).float(), dim=1)
+        return np.split(features.cpu().numpy(), np.cumsum(counts)[:-1])
+
+    def inference(self, img, dets):
+        """Embed the detections `dets` of a single image `img`, returns an (N, D) array of unit embeddings."""
+        return self.batch_inference([(img, dets)])[0]
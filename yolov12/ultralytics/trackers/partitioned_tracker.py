@@ -0,0 +1,106 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from ..utils import IterableSimpleNamespace
+from .array_byte_tracker import ArrayBYTETracker
+
+
+class PartitionedTracker:
+    """
+    Class-partitioned ByteTrack: one `ArrayBYTETracker` per configured class, each with its own settings.
+
+    Detections are split by class every frame and each partition runs its own association, so cost matrices are
+    per class (block-diagonal overall) and a track can never switch to a detection of another class. Every key of the
+    tracker YAML can be overridden per class under `partitions`, e.g. `track_buffer`, `match_thresh` or the Kalman
+    noise weights `std_weight_position` / `std_weight_velocity`. Classes without an entry share one default partition
+    that uses the base settings with class-aware association. Track ids are unique across partitions.
+
+    Attributes:
+        args (Namespace): Tracker arguments, see `cfg/trackers/bytetrack_partitioned.yaml`.
+        trackers (dict): Class id -> ArrayBYTETracker for the configured classes.
+        default (ArrayBYTETracker): Tracker for all other classes.
+
+    Methods:
+        update(results, img=None): Updates all partitions with their detections and returns the merged tracks.
+        reset(): Resets all partitions.
+        state_dict(): Returns the state of all partitions, for snapshots.
+        load_state_dict(state): Restores all partitions from a state dict.
+
+    Examples:
+        >>> tracker = PartitionedTracker(args, frame_rate=30)
+        >>> tracks = tracker.update(results.boxes.cpu().numpy(), img)
+    """
+
+    def __init__(self, args, frame_rate=30):
+        """
+        Initialize a PartitionedTracker, creating all partitions up front.
+
+        Args:
+            args (Namespace): Base tracker arguments, with optional per-class overrides in `partitions`.
+            frame_rate (int): Frame rate of the video sequence.
+        """
+        self.args = args
+        base = {k: v for k, v in vars(args).items() if k not in {"tracker_type", "partitions"}}
+        partitions = getattr(args, "partitions", None) or {}
+        # All partitions are created before the first update, constructing a tracker resets the shared id counter
+        self.trackers = {
+            int(cls): ArrayBYTETracker(IterableSimpleNamespace(**{**base, **(cfg or {})}), frame_rate)
+            for cls, cfg in partitions.items()
+        }
+        self.default = ArrayBYTETracker(IterableSimpleNamespace(**{**base, "class_aware": True}), frame_rate)
+
+    @property
+    def frame_id(self):
+        """The current frame ID."""
+        return self.default.frame_id
+
+    def reset(self):
+        """Resets all partitions."""
+        for tracker in (*self.trackers.values(), self.default):
+            tracker.reset()
+
+    def state_dict(self):
+        """Returns the state of every partition, keyed by class id, plus the default partition."""
+        return {
+            "partitions": {str(cls): tracker.state_dict() for cls, tracker in self.trackers.items()},
+            "default": self.default.state_dict(),
+        }
+
+    def load_state_dict(self, state):
+        """Restores every partition from `state_dict()`, partitions missing from `state` are reset."""
+        partitions = state.get("partitions", {})
+        for cls, tracker in self.trackers.items():
+            if str(cls) in partitions:
+                tracker.load_state_dict(partitions[str(cls)])
+            else:
+                tracker.reset()
+        self.default.load_state_dict(state["default"])  # last, all partitions share one id counter
+
+    def update(self, results, img=None):
+        """Updates every partition with the detections of its classes and returns the merged list of tracks."""
+        cls = np.asarray(results.cls)
+        key = "xywhr" if hasattr(results, "xywhr") else "xywh"
+        bboxes = getattr(results, key)
+        listed = np.isin(cls, list(self.trackers))
+
+        outputs = []
+        for c, tracker in (*self.trackers.items(), (None, self.default)):
+            idx = np.flatnonzero(cls == c if c is not None else ~listed)
+            tracks = tracker.update(SimpleNamespace(conf=results.conf[idx], cls=cls[idx], **{key: bboxes[idx]}), img)
+            if len(tracks):
+                tracks[:, -1] = idx[tracks[:, -1].astype(int)]  # partition detection index -> frame detection index
+                outputs.append(tracks)
+        return np.concatenate(outputs) if outputs else np.empty((0, 9 if key == "xywhr" else 8), dtype=np.float32)
+
+    @property
+    def tracked_stracks(self):
+        """STrack views of the tracked tracks of all partitions."""
+        return [t for tracker in (*self.trackers.values(), self.default) for t in tracker.tracked_stracks]
+
+    @property
+    def lost_stracks(self):
+        """STrack views of the lost tracks of all partitions."""
+        return [t for tracker in (*self.trackers.values(), self.default) for t in tracker.lost_stracks]
@@ -2,17 +2,26 @@
 
 from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
 import torch
 
-from ultralytics.utils import IterableSimpleNamespace, yaml_load
+from ultralytics.utils import IterableSimpleNamespace, ops, yaml_load
 from ultralytics.utils.checks import check_yaml
 
+from .array_byte_tracker import ArrayBYTETracker
 from .bot_sort import BOTSORT
 from .byte_tracker import BYTETracker
+from .partitioned_tracker import PartitionedTracker
 
 # A mapping of tracker types to corresponding tracker classes
-TRACKER_MAP = {"bytetrack": BYTETracker, "botsort": BOTSORT}
+TRACKER_MAP = {
+    "bytetrack": BYTETracker,
+    "botsort": BOTSORT,
+    "bytetrack_array": ArrayBYTETracker,
+    "bytetrack_partitioned": PartitionedTracker,
+}
 
 
 def on_predict_start(predictor: object, persist: bool = False) -> None:
@@ -24,7 +33,7 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
         persist (bool): Whether to persist the trackers if they already exist.
 
     Raises:
-        AssertionError: If the tracker_type is not 'bytetrack' or 'botsort'.
+        AssertionError: If the tracker_type is not one of the TRACKER_MAP keys.
 
     Examples:
         Initialize trackers for a predictor object:
@@ -37,8 +46,9 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
     tracker = check_yaml(predictor.args.tracker)
     cfg = IterableSimpleNamespace(**yaml_load(tracker))
 
-    if cfg.tracker_type not in {"bytetrack", "botsort"}:
-        raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
+    if cfg.tracker_type not in TRACKER_MAP:
+        supported = ", ".join(map(repr, TRACKER_MAP))
+        raise AssertionError(f"Only {supported} are supported for now, but got '{cfg.tracker_type}'")
 
     trackers = []
     for _ in range(predictor.dataset.bs):
@@ -46,6 +56,9 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
         trackers.append(tracker)
         if predictor.dataset.mode != "stream":  # only need one tracker for other modes.
             break
+    for tracker in trackers[1:]:
+        if getattr(tracker, "encoder", None) is not None:
+            tracker.encoder = trackers[0].encoder  # one ReID model shared by all streams
     predictor.trackers = trackers
     predictor.vid_path = [None] * predictor.dataset.bs  # for determining when to reset tracker on new video
 
@@ -67,6 +80,7 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
 
     is_obb = predictor.args.task == "obb"
     is_stream = predictor.dataset.mode == "stream"
+    features = batched_reid_features(predictor, im0s, is_obb) if is_stream else [None] * len(im0s)
     for i in range(len(im0s)):
         tracker = predictor.trackers[i if is_stream else 0]
         vid_path = predictor.save_dir / Path(path[i]).name
@@ -74,10 +88,15 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
             tracker.reset()
             predictor.vid_path[i if is_stream else 0] = vid_path
 
+        reid = {} if features[i] is None else {"features": features[i]}
+        if isinstance(predictor.results[i], np.ndarray):  # raw=True structured array
+            update_raw_results(predictor, i, tracker, im0s[i], **reid)
+            continue
+
         det = (predictor.results[i].obb if is_obb else predictor.results[i].boxes).cpu().numpy()
         if len(det) == 0:
             continue
-        tracks = tracker.update(det, im0s[i])
+        tracks = tracker.update(det, im0s[i], **reid)
         if len(tracks) == 0:
             continue
         idx = tracks[:, -1].astype(int)
@@ -87,6 +106,54 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
         predictor.results[i].update(**update_args)
 
 
+def batched_reid_features(predictor: object, im0s: list, is_obb: bool = False) -> list:
+    """
+    Embed the detections of all streams of a batch in one ReID forward pass.
+
+    Args:
+        predictor (object): The predictor object containing the predictions and the per-stream trackers.
+        im0s (list): The original images of the batch.
+        is_obb (bool): Whether the results hold oriented boxes.
+
+    Returns:
+        (list): One (N, D) array of embeddings per image, or None per image when the trackers do not use ReID.
+    """
+    encoder = getattr(predictor.trackers[0], "encoder", None)
+    if encoder is None or len(im0s) < 2:
+        return [None] * len(im0s)
+    boxes = []
+    for result in predictor.results:
+        if isinstance(result, np.ndarray):  # raw=True structured array
+            boxes.append(ops.xyxy2xywh(result["xyxy"]))
+        else:
+            boxes.append((result.obb.xywhr if is_obb else result.boxes.xywh).cpu().numpy())
+    return encoder.batch_inference(list(zip(im0s, boxes)))
+
+
+def update_raw_results(predictor: object, i: int, tracker: object, img: np.ndarray, **kwargs) -> None:
+    """
+    Update the tracker with a `raw=True` structured array and write the tracked boxes and ids back in place.
+
+    Args:
+        predictor (object): The predictor object containing the predictions.
+        i (int): Index of the image in the current batch.
+        tracker (object): The tracker assigned to this image.
+        img (np.ndarray): The original image, used by trackers with GMC or ReID.
+        **kwargs (Any): Extra arguments for `tracker.update`, e.g. precomputed ReID `features`.
+    """
+    det = predictor.results[i]
+    if len(det) == 0:
+        return
+    boxes = SimpleNamespace(conf=det["conf"], cls=det["cls"], xywh=ops.xyxy2xywh(det["xyxy"]))
+    tracks = tracker.update(boxes, img, **kwargs)
+    if len(tracks) == 0:
+        return
+    det = det[tracks[:, -1].astype(int)]
+    det["xyxy"] = tracks[:, :4]
+    det["track_id"] = tracks[:, 4]
+    predictor.results[i] = det
+
+
 def register_tracker(model: object, persist: bool) -> None:
     """
     Register tracking callbacks to the model for object tracking during prediction.
@@ -1,6 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import copy
+import time
 
 import cv2
 import numpy as np
@@ -13,11 +14,22 @@ class GMC:
     Generalized Motion Compensation (GMC) class for tracking and object detection in video frames.
 
     This class provides methods for tracking and detecting objects based on several tracking algorithms including ORB,
-    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency.
+    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency, estimating
+    motion only every `interval` frames and skipping estimation while a cheap frame-difference check says the camera
+    is static, which makes GMC nearly free for fixed cameras. Tracks are updated every frame, so every call returns the
+    motion of a single frame: an estimate spanning several frames is divided by their number and reused until the next
+    estimate.
 
     Attributes:
         method (str): The method used for tracking. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
         downscale (int): Factor by which to downscale the frames for processing.
+        interval (int): Motion is estimated every `interval` frames, frames in between return the last per-frame warp.
+        static_thresh (float): Mean absolute gray-level difference, outside detections, below which the camera is
+            considered static and estimation is skipped. 0 disables the check.
+        H (np.ndarray): The last estimated per-frame 2x3 warp matrix.
+        skipped (int): Number of interval-skipped frames since the last estimate.
+        timings (dict): Per-call timing in milliseconds ('last_ms', 'total_ms') and counts of 'calls', 'estimated',
+            'interval_skipped' and 'static_skipped' frames.
         prevFrame (np.ndarray): Stores the previous frame for tracking.
         prevKeyPoints (List): Stores the keypoints from the previous frame.
         prevDescriptors (np.ndarray): Stores the descriptors from the previous frame.
@@ -41,13 +53,18 @@ class GMC:
                [4, 5, 6]])
     """
 
-    def __init__(self, method: str = "sparseOptFlow", downscale: int = 2) -> None:
+    def __init__(
+        self, method: str = "sparseOptFlow", downscale: int = 2, interval: int = 1, static_thresh: float = 0.0
+    ) -> None:
         """
         Initialize a Generalized Motion Compensation (GMC) object with tracking method and downscale factor.
 
         Args:
             method (str): The method used for tracking. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
             downscale (int): Downscale factor for processing frames.
+            interval (int): Estimate motion every `interval` frames.
+            static_thresh (float): Skip estimation while the mean absolute gray-level difference to the last estimated
+                frame, outside detections, is below this value. 0 disables the check.
 
         Examples:
             Initialize a GMC object with the 'sparseOptFlow' method and a downscale factor of 2
@@ -57,6 +74,8 @@ class GMC:
 
         self.method = method
         self.downscale = max(1, downscale)
+        self.interval = max(1, interval)
+        self.static_thresh = static_thresh
 
         if self.method == "orb":
             self.detector = cv2.FastFeatureDetector_create(20)
@@ -88,11 +107,20 @@ class GMC:
         self.prevKeyPoints = None
         self.prevDescriptors = None
         self.initializedFirstFrame = False
+        self.prevThumbnail = None
+        self.frame_id = 0
+        self.H = np.eye(2, 3)
+        self.skipped = 0
+        self.timings = dict.fromkeys(("calls", "estimated", "interval_skipped", "static_skipped"), 0)
+        self.timings.update(last_ms=0.0, total_ms=0.0)
 
     def apply(self, raw_frame: np.array, detections: list = None) -> np.array:
         """
         Apply object detection on a raw frame using the specified method.
 
+        Frames between two `interval` frames return the last per-frame warp, and static frames return the identity. The
+        time spent in every call is recorded in `timings`.
+
         Args:
             raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
             detections (List | None): List of detections to be used in the processing.
@@ -107,14 +135,78 @@ class GMC:
             >>> print(processed_frame.shape)
             (480, 640, 3)
         """
-        if self.method in {"orb", "sift"}:
-            return self.apply_features(raw_frame, detections)
-        elif self.method == "ecc":
-            return self.apply_ecc(raw_frame)
-        elif self.method == "sparseOptFlow":
-            return self.apply_sparseoptflow(raw_frame)
+        t = time.perf_counter()
+        self.frame_id += 1
+        self.timings["calls"] += 1
+        skip = self.method and self.initializedFirstFrame and self.frame_id % self.interval
+        thumbnail = self.thumbnail(raw_frame) if self.static_thresh > 0 and self.method and not skip else None
+        if skip:
+            H = self.H.copy()
+            self.skipped += 1
+            self.timings["interval_skipped"] += 1
+        elif thumbnail is not None and self.is_static(thumbnail, detections, thumbnail.shape[1] / raw_frame.shape[1]):
+            H = self.H = np.eye(2, 3)
+            self.skipped = 0
+            self.timings["static_skipped"] += 1
         else:
-            return np.eye(2, 3)
+            if self.method in {"orb", "sift"}:
+                H = self.apply_features(raw_frame, detections)
+            elif self.method == "ecc":
+                H = self.apply_ecc(raw_frame)
+            elif self.method == "sparseOptFlow":
+                H = self.apply_sparseoptflow(raw_frame)
+            else:
+                H = np.eye(2, 3)
+            H = self.per_frame(H, self.skipped + 1)
+            self.H, self.skipped = H.copy(), 0
+            self.prevThumbnail = thumbnail
+            self.timings["estimated"] += 1
+        self.timings["last_ms"] = (time.perf_counter() - t) * 1e3
+        self.timings["total_ms"] += self.timings["last_ms"]
+        return H
+
+    @staticmethod
+    def per_frame(H: np.array, frames: int) -> np.array:
+        """Return the warp of a single frame from a 2x3 warp `H` spanning `frames` frames of steady motion."""
+        if frames <= 1:
+            return H
+        H = H.copy()
+        H[:, :2] = np.eye(2) + (H[:, :2] - np.eye(2)) / frames
+        H[:, 2] /= frames
+        return H
+
+    @staticmethod
+    def thumbnail(raw_frame: np.array, width: int = 160) -> np.array:
+        """Return a small grayscale copy of `raw_frame`, `width` pixels wide, used for the static-camera check."""
+        height = max(1, round(raw_frame.shape[0] * width / raw_frame.shape[1]))
+        small = cv2.resize(raw_frame, (width, height), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+
+    def is_static(self, thumbnail: np.array, detections: list = None, scale: float = 1.0) -> bool:
+        """
+        Check whether the camera moved since the last estimated frame using a cheap frame difference.
+
+        Moving objects would dominate the difference of a static camera, so the boxes of `detections`, given as
+        (x, y, w, h, ...) like the tracker passes them, are masked out.
+
+        Args:
+            thumbnail (np.ndarray): Output of `thumbnail` for the current frame.
+            detections (List | None): Detections in the current frame, in original image pixels.
+            scale (float): Thumbnail width divided by the original image width.
+
+        Returns:
+            (bool): True if the mean absolute difference outside detections is below `static_thresh`.
+        """
+        if self.prevThumbnail is None or self.prevThumbnail.shape != thumbnail.shape:
+            return False
+        mask = np.ones(thumbnail.shape, dtype=bool)
+        if detections is not None and len(detections):
+            xywh = np.asarray(detections)[:, :4] * scale
+            for x1, y1, x2, y2 in np.concatenate([xywh[:, :2] - xywh[:, 2:] / 2, xywh[:, :2] + xywh[:, 2:] / 2], 1):
+                mask[max(0, int(y1)) : int(np.ceil(y2)), max(0, int(x1)) : int(np.ceil(x2))] = False
+        if not mask.any():
+            return False
+        return float(cv2.absdiff(thumbnail, self.prevThumbnail)[mask].mean()) < self.static_thresh
 
     def apply_ecc(self, raw_frame: np.array) -> np.array:
         """
@@ -375,3 +467,7 @@ class GMC:
         self.prevKeyPoints = None
         self.prevDescriptors = None
         self.initializedFirstFrame = False
+        self.prevThumbnail = None
+        self.frame_id = 0
+        self.H = np.eye(2, 3)
+        self.skipped = 0
@@ -23,9 +23,12 @@ class KalmanFilterXYAH:
         initiate: Creates a track from an unassociated measurement.
         predict: Runs the Kalman filter prediction step.
         project: Projects the state distribution to measurement space.
+        multi_project: Projects multiple state distributions to measurement space (vectorized version).
         multi_predict: Runs the Kalman filter prediction step (vectorized version).
         update: Runs the Kalman filter correction step.
+        multi_update: Runs the Kalman filter correction step (vectorized version).
         gating_distance: Computes the gating distance between state distribution and measurements.
+        multi_gating_distance: Computes gating distances for multiple state distributions (vectorized version).
 
     Examples:
         Initialize the Kalman filter and create a track from a measurement
@@ -36,7 +39,7 @@ class KalmanFilterXYAH:
         >>> print(covariance)
     """
 
-    def __init__(self):
+    def __init__(self, std_weight_position: float = 1.0 / 20, std_weight_velocity: float = 1.0 / 160):
         """
         Initialize Kalman filter model matrices with motion and observation uncertainty weights.
 
@@ -45,6 +48,11 @@ class KalmanFilterXYAH:
         velocities are (vx, vy, va, vh). The filter uses a constant velocity model for object motion and a linear
         observation model for bounding box location.
 
+        Args:
+            std_weight_position (float): Position noise, relative to the box height.
+            std_weight_velocity (float): Velocity noise, relative to the box height. Larger values let tracks follow
+                fast, erratic motion, smaller values smooth slow objects.
+
         Examples:
             Initialize a Kalman filter for tracking:
             >>> kf = KalmanFilterXYAH()
@@ -59,8 +67,8 @@ class KalmanFilterXYAH:
 
         # Motion and observation uncertainty are chosen relative to the current state estimate. These weights control
         # the amount of uncertainty in the model.
-        self._std_weight_position = 1.0 / 20
-        self._std_weight_velocity = 1.0 / 160
+        self._std_weight_position = std_weight_position
+        self._std_weight_velocity = std_weight_velocity
 
     def initiate(self, measurement: np.ndarray) -> tuple:
         """
@@ -162,6 +170,31 @@ class KalmanFilterXYAH:
         covariance = np.linalg.multi_dot((self._update_mat, covariance, self._update_mat.T))
         return mean, covariance + innovation_cov
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray) -> tuple:
+        """
+        Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx4 projected means and Nx4x4 projected covariance matrices.
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = np.random.rand(10, 8)
+            >>> covariance = np.tile(np.eye(8), (10, 1, 1))
+            >>> projected_mean, projected_covariance = kf.multi_project(mean, covariance)
+        """
+        std = self._std_weight_position * mean[:, 3]
+        sqr = np.square(np.stack([std, std, np.full_like(std, 1e-1), std], axis=1))
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        covariance[:, np.arange(4), np.arange(4)] += sqr
+        return mean, covariance
+
     def multi_predict(self, mean: np.ndarray, covariance: np.ndarray) -> tuple:
         """
         Run Kalman filter prediction step for multiple object states (Vectorized version).
@@ -235,6 +268,39 @@ class KalmanFilterXYAH:
         new_covariance = covariance - np.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray) -> tuple:
+        """
+        Run Kalman filter correction step for multiple object states (Vectorized version).
+
+        All N innovation covariances are solved in one batched `np.linalg.solve` call instead of one Cholesky
+        factorization per track, the result matches calling `update` on every row.
+
+        Args:
+            mean (ndarray): The Nx8 dimensional predicted mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+            measurement (ndarray): The Nx4 dimensional measurement matrix, one measurement per state in the format
+                expected by `update`.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx8 corrected means and Nx8x8 corrected covariance matrices.
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = np.random.rand(10, 8)
+            >>> covariance = np.tile(np.eye(8), (10, 1, 1))
+            >>> measurement = np.random.rand(10, 4)
+            >>> new_mean, new_covariance = kf.multi_update(mean, covariance, measurement)
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        kalman_gain = np.linalg.solve(projected_cov, (covariance @ self._update_mat.T).transpose(0, 2, 1))
+        kalman_gain = kalman_gain.transpose(0, 2, 1)
+        innovation = measurement - projected_mean
+
+        new_mean = mean + np.einsum("nij,nj->ni", kalman_gain, innovation)
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose(0, 2, 1)
+        return new_mean, new_covariance
+
     def gating_distance(
         self,
         mean: np.ndarray,
@@ -285,6 +351,49 @@ class KalmanFilterXYAH:
         else:
             raise ValueError("Invalid distance metric")
 
+    def multi_gating_distance(
+        self,
+        mean: np.ndarray,
+        covariance: np.ndarray,
+        measurements: np.ndarray,
+        only_position: bool = False,
+        metric: str = "maha",
+    ) -> np.ndarray:
+        """
+        Compute gating distances between multiple state distributions and measurements (Vectorized version).
+
+        Args:
+            mean (ndarray): The Mx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Mx8x8 covariance matrix of the object states.
+            measurements (ndarray): An (N, 4) matrix of N measurements in the format expected by `gating_distance`.
+            only_position (bool): If True, distance computation is done with respect to box center position only.
+            metric (str): The metric to use for calculating the distance, 'gaussian' or 'maha'.
+
+        Returns:
+            (np.ndarray): Returns an (M, N) array where row i equals `gating_distance(mean[i], covariance[i], ...)`.
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = np.random.rand(3, 8)
+            >>> covariance = np.tile(np.eye(8), (3, 1, 1))
+            >>> measurements = np.array([[1, 1, 1, 1], [2, 2, 1, 1]])
+            >>> distances = kf.multi_gating_distance(mean, covariance, measurements)  # shape (3, 2)
+        """
+        mean, covariance = self.multi_project(mean, covariance)
+        if only_position:
+            mean, covariance = mean[:, :2], covariance[:, :2, :2]
+            measurements = measurements[:, :2]
+
+        d = measurements[None] - mean[:, None]  # (M, N, dim)
+        if metric == "gaussian":
+            return np.sum(d * d, axis=2)
+        elif metric == "maha":
+            cholesky_factor = np.linalg.cholesky(covariance)
+            z = np.linalg.solve(cholesky_factor, d.transpose(0, 2, 1))
+            return np.sum(z * z, axis=1)  # square maha
+        else:
+            raise ValueError("Invalid distance metric")
+
 
 class KalmanFilterXYWH(KalmanFilterXYAH):
     """
@@ -305,6 +414,7 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         initiate: Creates a track from an unassociated measurement.
         predict: Runs the Kalman filter prediction step.
         project: Projects the state distribution to measurement space.
+        multi_project: Projects multiple state distributions to measurement space in a vectorized manner.
         multi_predict: Runs the Kalman filter prediction step in a vectorized manner.
         update: Runs the Kalman filter correction step.
 
@@ -427,6 +537,31 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         covariance = np.linalg.multi_dot((self._update_mat, covariance, self._update_mat.T))
         return mean, covariance + innovation_cov
 
+    def multi_project(self, mean, covariance) -> tuple:
+        """
+        Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx4 projected means and Nx4x4 projected covariance matrices.
+
+        Examples:
+            >>> kf = KalmanFilterXYWH()
+            >>> mean = np.random.rand(5, 8)
+            >>> covariance = np.tile(np.eye(8), (5, 1, 1))
+            >>> projected_mean, projected_cov = kf.multi_project(mean, covariance)
+        """
+        std_w, std_h = self._std_weight_position * mean[:, 2], self._std_weight_position * mean[:, 3]
+        sqr = np.square(np.stack([std_w, std_h, std_w, std_h], axis=1))
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        covariance[:, np.arange(4), np.arange(4)] += sqr
+        return mean, covariance
+
     def multi_predict(self, mean, covariance) -> tuple:
         """
         Run Kalman filter prediction step (Vectorized version).
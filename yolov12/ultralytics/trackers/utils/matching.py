@@ -2,6 +2,8 @@
 
 import numpy as np
 import scipy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import cdist
 
 from ultralytics.utils.metrics import batch_probiou, bbox_ioa
@@ -61,6 +63,148 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     return matches, unmatched_a, unmatched_b
 
 
+def sparse_linear_assignment(ia: np.ndarray, ib: np.ndarray, cost: np.ndarray, shape: tuple, thresh: float) -> tuple:
+    """
+    Perform linear assignment on a sparse cost matrix by solving each connected component separately.
+
+    Only pairs listed in (`ia`, `ib`) with `cost` below `thresh` can be matched, every other pair is treated as
+    unassignable, which is what `linear_assignment` does for any pair whose cost exceeds `thresh`. The bipartite graph
+    of assignable pairs is split into connected components, single-pair components are matched directly and the rest
+    are solved with `lap.lapjv` on their small dense sub-matrix, so the result equals `linear_assignment` on the full
+    matrix while the cost grows with the component sizes instead of N×M.
+
+    Args:
+        ia (np.ndarray): Row indices of the candidate pairs, shape (E,).
+        ib (np.ndarray): Column indices of the candidate pairs, shape (E,).
+        cost (np.ndarray): Cost of each candidate pair, shape (E,).
+        shape (tuple): (N, M) shape of the full cost matrix.
+        thresh (float): Threshold for considering an assignment valid.
+
+    Returns:
+        matched_indices (np.ndarray): Array of matched indices of shape (K, 2), sorted by the first index.
+        unmatched_a (np.ndarray): Array of unmatched indices from the first set, with shape (L,).
+        unmatched_b (np.ndarray): Array of unmatched indices from the second set, with shape (M,).
+
+    Examples:
+        >>> ia, ib, cost = sparse_iou_distance(track_boxes, det_boxes)
+        >>> matches, u_a, u_b = sparse_linear_assignment(ia, ib, cost, (len(track_boxes), len(det_boxes)), 0.8)
+    """
+    n, m = shape
+    keep = cost < thresh
+    ia, ib, cost = ia[keep], ib[keep], cost[keep]
+    matches = [np.empty((0, 2), dtype=np.int64)]
+    if len(ia):
+        graph = coo_matrix((np.ones(len(ia)), (ia, n + ib)), shape=(n + m, n + m))
+        _, labels = connected_components(graph, directed=False)
+        label = labels[ia]
+        edges = np.bincount(label)
+        single = edges[label] == 1
+        matches.append(np.stack([ia[single], ib[single]], axis=1))  # one candidate pair, nothing to solve
+
+        order = np.argsort(label, kind="stable")
+        order = order[~single[order]]
+        for sub in np.split(order, np.flatnonzero(np.diff(label[order])) + 1) if len(order) else ():
+            sa, sb, sc = ia[sub], ib[sub], cost[sub]
+            rows, r = np.unique(sa, return_inverse=True)
+            cols, c = np.unique(sb, return_inverse=True)
+            dense = np.full((len(rows), len(cols)), thresh + 1.0, dtype=np.float64)
+            dense[r, c] = sc
+            _, x, _ = lap.lapjv(dense, extend_cost=True, cost_limit=thresh)
+            matched = np.flatnonzero(x >= 0)
+            matches.append(np.stack([rows[matched], cols[x[matched]]], axis=1))
+
+    matches = np.concatenate(matches).astype(np.int64)
+    matches = matches[np.argsort(matches[:, 0], kind="stable")]
+    unmatched_a = np.setdiff1d(np.arange(n), matches[:, 0])
+    unmatched_b = np.setdiff1d(np.arange(m), matches[:, 1])
+    return matches, unmatched_a, unmatched_b
+
+
+def iou_candidates(aboxes: np.ndarray, bboxes: np.ndarray) -> tuple:
+    """
+    Find all pairs of overlapping (x1, y1, x2, y2) boxes between two sets without computing the dense N×M overlap.
+
+    Boxes are hashed into a uniform grid whose cell size is the largest box side, so every box covers at most 2x2
+    cells and only boxes sharing a cell are compared. The cost is linear in the number of boxes plus the number of
+    boxes sharing cells; a few very large boxes make the grid coarse and fall back towards the dense comparison.
+
+    Args:
+        aboxes (np.ndarray): First set of boxes, shape (N, 4).
+        bboxes (np.ndarray): Second set of boxes, shape (M, 4).
+
+    Returns:
+        (tuple[np.ndarray, np.ndarray]): Indices (ia, ib) into `aboxes` and `bboxes` of pairs with a non-zero
+            intersection, sorted by `ia` then `ib`.
+
+    Examples:
+        >>> aboxes = np.array([[0, 0, 10, 10], [100, 100, 110, 110]])
+        >>> bboxes = np.array([[5, 5, 15, 15]])
+        >>> ia, ib = iou_candidates(aboxes, bboxes)  # (array([0]), array([0]))
+    """
+    empty = np.empty(0, dtype=np.int64)
+    if not len(aboxes) or not len(bboxes):
+        return empty, empty
+    boxes = np.concatenate([aboxes[:, :4], bboxes[:, :4]]).astype(np.float64)
+    cell = max(float((boxes[:, 2:] - boxes[:, :2]).max()), 1.0)
+    lo = np.floor((boxes[:, :2] - boxes[:, :2].min(0)) / cell).astype(np.int64)
+    hi = np.maximum(np.floor((boxes[:, 2:] - boxes[:, :2].min(0)) / cell).astype(np.int64), lo)
+    stride = hi[:, 1].max() + 1
+
+    # Expand each box into the (at most 2x2) grid cells it covers
+    keys, owners = [], []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            valid = (lo[:, 0] + dx <= hi[:, 0]) & (lo[:, 1] + dy <= hi[:, 1])
+            keys.append((lo[valid, 0] + dx) * stride + lo[valid, 1] + dy)
+            owners.append(np.flatnonzero(valid))
+    keys, owners = np.concatenate(keys), np.concatenate(owners)
+    is_a = owners < len(aboxes)
+    ka, oa = keys[is_a], owners[is_a]
+    order = np.argsort(keys[~is_a], kind="stable")
+    kb, ob = keys[~is_a][order], owners[~is_a][order] - len(aboxes)
+
+    # Join a-cells with b-cells on the cell key
+    left, right = np.searchsorted(kb, ka, "left"), np.searchsorted(kb, ka, "right")
+    counts = right - left
+    ia = np.repeat(oa, counts)
+    ib = ob[np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(left, counts)]
+    pairs = np.unique(ia * len(bboxes) + ib)
+    ia, ib = pairs // len(bboxes), pairs % len(bboxes)
+
+    a, b = aboxes[ia], bboxes[ib]
+    overlap = (np.minimum(a[:, 2], b[:, 2]) > np.maximum(a[:, 0], b[:, 0])) & (
+        np.minimum(a[:, 3], b[:, 3]) > np.maximum(a[:, 1], b[:, 1])
+    )
+    return ia[overlap], ib[overlap]
+
+
+def sparse_iou_distance(aboxes: np.ndarray, bboxes: np.ndarray, eps: float = 1e-7) -> tuple:
+    """
+    Compute the IoU cost of overlapping (x1, y1, x2, y2) box pairs only, the sparse counterpart of `iou_distance`.
+
+    Args:
+        aboxes (np.ndarray): First set of boxes, shape (N, 4).
+        bboxes (np.ndarray): Second set of boxes, shape (M, 4).
+        eps (float): A small value to avoid division by zero, same as `bbox_ioa`.
+
+    Returns:
+        (tuple[np.ndarray, np.ndarray, np.ndarray]): Indices (ia, ib) of the overlapping pairs and their cost
+            `1 - IoU`, equal to the matching entries of `iou_distance`. Pairs that are not returned have cost 1.
+
+    Examples:
+        >>> ia, ib, cost = sparse_iou_distance(track_boxes, det_boxes)
+    """
+    aboxes = np.ascontiguousarray(aboxes, dtype=np.float32)
+    bboxes = np.ascontiguousarray(bboxes, dtype=np.float32)
+    ia, ib = iou_candidates(aboxes, bboxes)
+    a, b = aboxes[ia], bboxes[ib]
+    inter = (np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])).clip(0) * (
+        np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    ).clip(0)
+    area = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1]) + (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1]) - inter
+    return ia, ib, 1 - inter / (area + eps)
+
+
 def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     """
     Compute cost based on Intersection over Union (IoU) between tracks.
@@ -0,0 +1,100 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+
+def _escape(key) -> str:
+    """Escape '%' and '/' in a state key, as '/' separates the levels of flattened paths."""
+    return str(key).replace("%", "%25").replace("/", "%2F")
+
+
+def _unescape(key: str) -> str:
+    """Inverse of `_escape`."""
+    return key.replace("%2F", "/").replace("%25", "%")
+
+
+def flatten_state(state: dict, prefix: str = "") -> dict:
+    """
+    Flatten a nested state dict into one level of NumPy arrays keyed by '/'-joined paths.
+
+    Keys may contain '/' (e.g. camera ids that are RTSP URLs), it is escaped as '%2F' and '%' as '%25'.
+
+    Args:
+        state (dict): Nested dict of arrays, lists and scalars, e.g. from a tracker's `state_dict()`.
+        prefix (str): Key prefix for this level.
+
+    Returns:
+        (dict): Path -> np.ndarray, scalars become 0-d arrays.
+
+    Examples:
+        >>> flatten_state({"cam_1": {"frame_id": 3}})
+        {'cam_1/frame_id': array(3)}
+    """
+    flat = {}
+    for key, value in state.items():
+        key = f"{prefix}{_escape(key)}"
+        if isinstance(value, dict):
+            flat.update(flatten_state(value, f"{key}/"))
+        else:
+            flat[key] = np.asarray(value)
+    return flat
+
+
+def unflatten_state(flat: dict) -> dict:
+    """Inverse of `flatten_state`, 0-d arrays are returned as Python scalars."""
+    state = {}
+    for key, value in flat.items():
+        *parents, name = map(_unescape, key.split("/"))
+        node = state
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value.item() if value.ndim == 0 else value
+    return state
+
+
+def save_state(file, state: dict) -> None:
+    """
+    Atomically write a nested state dict to an uncompressed `.npz` snapshot.
+
+    The snapshot is written to a temporary file next to `file` and moved into place, so a crash during the write
+    leaves the previous snapshot intact. Only plain arrays are stored (no pickles), which keeps snapshots compact and
+    loading fast.
+
+    Args:
+        file (str | Path): Snapshot path.
+        state (dict): Nested dict of arrays, lists and scalars.
+
+    Examples:
+        >>> save_state("tracker.npz", {"cam_1": tracker.state_dict()})
+    """
+    file = Path(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=file.parent, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **flatten_state(state))
+        os.replace(tmp, file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_state(file) -> dict:
+    """
+    Load a snapshot written by `save_state`.
+
+    Args:
+        file (str | Path): Snapshot path.
+
+    Returns:
+        (dict): The nested state dict.
+
+    Examples:
+        >>> tracker.load_state_dict(load_state("tracker.npz")["cam_1"])
+    """
+    with np.load(file, allow_pickle=False) as data:
+        return unflatten_state({key: data[key] for key in data.files})
@@ -3,9 +3,19 @@
 Benchmark a YOLO model formats for speed and accuracy.
 
 Usage:
-    from ultralytics.utils.benchmarks import ProfileModels, benchmark
+    from ultralytics.utils.benchmarks import ProfileModels, benchmark, benchmark_frame_overhead
     ProfileModels(['yolov8n.yaml', 'yolov8s.yaml']).profile()
     benchmark(model='yolov8n.pt', imgsz=160)
+    benchmark_frame_overhead(model='yolov8n.pt', imgsz=640)
+    benchmark_trackers(num_tracks=(10, 100, 1000))
+    benchmark_preprocess(model='yolov8n.pt', batch=4)
+    benchmark_pipeline(model='yolov8n.pt', depth=2)
+    benchmark_area_attention(model='yolov12l.yaml', imgsz=640)
+    benchmark_export_attention(model='yolov12l.yaml', format='onnx')
+    benchmark_int8(model='yolov8n.pt', data='coco8.yaml', format='onnx')
+    benchmark_bf16(model='yolov8n.pt', data='coco8.yaml')
+    benchmark_onnx_io(model='yolov8n.pt', batch=(1, 8), intra_op_threads=4)
+    benchmark_compile(model='yolov12m.yaml', imgsz=640, modes=('jit', 'inductor'))
 
 Format                  | `format=argument`         | Model
 ---                     | ---                       | ---
@@ -31,8 +41,10 @@ import platform
 import re
 import shutil
 import time
+from functools import partial
 from pathlib import Path
 
+import cv2
 import numpy as np
 import torch.cuda
 import yaml
@@ -177,6 +189,599 @@ def benchmark(
     return df
 
 
+def benchmark_frame_overhead(model=WEIGHTS_DIR / "yolo11n.pt", imgsz=640, shape=(720, 1280), n=50, track=True):
+    """
+    Measure the fixed per-call overhead of `Model.track`/`Model.predict` versus `BasePredictor.infer_frames`.
+
+    Overhead is the wall time of a call minus the preprocess, inference and postprocess time measured inside it, i.e.
+    argument merging, source setup, `check_imgsz`, generator and callback plumbing.
+
+    Args:
+        model (str | Path | Model): Model or path to the model file.
+        imgsz (int): Inference image size.
+        shape (Tuple[int, int]): (height, width) of the synthetic BGR frame.
+        n (int): Number of timed calls per path.
+        track (bool): Benchmark `track(persist=True)` instead of `predict`.
+
+    Returns:
+        (dict): Per-call total and overhead times in milliseconds for the 'model' and 'infer_frames' paths.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_frame_overhead
+        >>> benchmark_frame_overhead(model="yolo11n.pt", imgsz=640)
+    """
+    if isinstance(model, (str, Path)):
+        model = YOLO(model)
+    frame = np.random.randint(0, 255, (*shape, 3), dtype=np.uint8)
+    call = partial(model.track, persist=True) if track else model.predict
+
+    def timed(fn):
+        fn()  # warmup, also sets up the predictor/source
+        total = pipeline = 0.0
+        for _ in range(n):
+            t = time.perf_counter()
+            fn()
+            total += time.perf_counter() - t
+            pipeline += sum(model.predictor.speed.values()) / 1e3
+        return {"total": total / n * 1e3, "overhead": (total - pipeline) / n * 1e3}
+
+    results = {"model": timed(lambda: call(frame, imgsz=imgsz, verbose=False))}
+    results["infer_frames"] = timed(lambda: model.predictor.infer_frames([frame]))
+    before, after = results["model"], results["infer_frames"]
+    LOGGER.info(
+        f"{'track' if track else 'predict'} at imgsz={imgsz}, frame {shape}: "
+        f"{before['total']:.2f}ms/call ({before['overhead']:.2f}ms overhead) -> "
+        f"infer_frames {after['total']:.2f}ms/call ({after['overhead']:.2f}ms overhead)"
+    )
+    return results
+
+
+def synthetic_track_sequence(
+    n, frames, seed=0, extent=600, speed=0.0, noise=3.0, miss=0.1, num_classes=3, fixed_cls=False
+):
+    """
+    Generate detections of `n` objects moving with constant velocity plus noise, for tracker tests and benchmarks.
+
+    Args:
+        n (int): Number of simultaneous objects.
+        frames (int): Number of frames.
+        seed (int): Random seed.
+        extent (float): Initial x and y positions are uniform in [0, extent).
+        speed (float): Standard deviation of the per-object velocity in pixels per frame, 0 for no drift.
+        noise (float): Standard deviation of the per-frame position noise in pixels.
+        miss (float): Probability that an object is not detected in a frame, making tracks go lost and get re-found.
+        num_classes (int): Number of classes.
+        fixed_cls (bool): Keep the class of each object for the whole sequence instead of drawing it every frame.
+
+    Returns:
+        (List[SimpleNamespace]): Per-frame detections with float32 `xywh`, `conf` and `cls` arrays, confidences
+            spread over the high and low ByteTrack association bands.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import synthetic_track_sequence
+        >>> sequence = synthetic_track_sequence(100, frames=50)
+    """
+    from types import SimpleNamespace
+
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(0, extent, (n, 2))
+    vel = rng.normal(0, speed, (n, 2)) if speed else 0
+    wh = rng.uniform(20, 80, (n, 2))
+    cls = rng.integers(0, num_classes, n).astype(np.float32) if fixed_cls else None
+    sequence = []
+    for _ in range(frames):
+        pos += vel + rng.normal(0, noise, (n, 2))
+        keep = rng.random(n) > miss
+        sequence.append(
+            SimpleNamespace(
+                xywh=np.concatenate([pos, wh], 1)[keep].astype(np.float32),
+                conf=rng.uniform(0.05, 1.0, n)[keep].astype(np.float32),
+                cls=(cls if fixed_cls else rng.integers(0, num_classes, n).astype(np.float32))[keep],
+            )
+        )
+    return sequence
+
+
+def benchmark_trackers(num_tracks=(10, 100, 1000), frames=100, tracker="bytetrack.yaml", seed=0):
+    """
+    Time `BYTETracker.update` against `ArrayBYTETracker.update`, dense and with `sparse_match`, on synthetic detections.
+
+    Each sequence has `num_tracks` objects moving with constant velocity plus noise, ~10% of them missed per frame and
+    confidences spread over the high and low association bands, so every ByteTrack step is exercised.
+
+    Args:
+        num_tracks (Tuple[int]): Numbers of simultaneous objects to benchmark.
+        frames (int): Number of frames per sequence.
+        tracker (str): Tracker YAML providing the thresholds, its `tracker_type` is ignored.
+        seed (int): Random seed for the synthetic sequences.
+
+    Returns:
+        (dict): Mean milliseconds per `update` call, keyed by number of tracks and then tracker name.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_trackers
+        >>> benchmark_trackers(num_tracks=(10, 100, 1000))
+    """
+    from ultralytics.trackers import ArrayBYTETracker, BYTETracker
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.checks import check_yaml
+
+    args = IterableSimpleNamespace(**yaml_load(check_yaml(tracker)))
+    trackers = {
+        "BYTETracker": (BYTETracker, args),
+        "ArrayBYTETracker": (ArrayBYTETracker, IterableSimpleNamespace(**{**vars(args), "sparse_match": False})),
+        "ArrayBYTETracker(sparse)": (ArrayBYTETracker, IterableSimpleNamespace(**{**vars(args), "sparse_match": True})),
+    }
+    results = {}
+    for n in num_tracks:
+        sequence = synthetic_track_sequence(n, frames, seed, extent=4000, speed=3, noise=1)
+        results[n] = {}
+        for name, (cls, cfg) in trackers.items():
+            t = cls(args=cfg, frame_rate=30)
+            start = time.perf_counter()
+            for det in sequence:
+                t.update(det)
+            results[n][name] = (time.perf_counter() - start) / frames * 1e3
+        LOGGER.info(f"{n} tracks: " + ", ".join(f"{k} {v:.2f}ms/frame" for k, v in results[n].items()))
+    return results
+
+
+def benchmark_preprocess(model=WEIGHTS_DIR / "yolo11n.pt", imgsz=640, batch=1, shape=(720, 1280), n=100):
+    """
+    Compare `BasePredictor.preprocess` with reused buffers against the previous stack/transpose/copy pipeline on CPU.
+
+    Both paths produce the same tensor. Reports milliseconds and peak transient NumPy/OpenCV memory (tracemalloc) per
+    frame; the previous pipeline additionally allocates its float32 output in torch on every call, which tracemalloc
+    does not see.
+
+    Args:
+        model (str | Path): Path to the model file or directory.
+        imgsz (int): Inference image size.
+        batch (int): Number of frames per preprocess call.
+        shape (Tuple[int, int]): Height and width of the synthetic BGR frames.
+        n (int): Number of timed calls per path.
+
+    Returns:
+        (dict): {path: {"ms": ms per frame, "peak_mb": peak transient MB per frame}} for 'previous' and 'buffered'.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_preprocess
+        >>> benchmark_preprocess(model="yolo11n.pt", batch=4)
+    """
+    import tracemalloc
+
+    frames = [np.random.default_rng(i).integers(0, 255, (*shape, 3), dtype=np.uint8) for i in range(batch)]
+    model = YOLO(model)
+    model.predict(frames, imgsz=imgsz, device="cpu", verbose=False)  # set up the predictor
+    predictor = model.predictor
+
+    def previous(im):
+        im = np.stack(predictor.pre_transform(im))
+        im = np.ascontiguousarray(im[..., ::-1].transpose((0, 3, 1, 2)))
+        return torch.from_numpy(im).float() / 255
+
+    paths = {"previous": previous, "buffered": predictor.preprocess}
+    assert torch.equal(previous(frames), predictor.preprocess(frames)), "preprocessing paths differ"
+    results = {}
+    for name, fn in paths.items():
+        fn(frames)  # warmup, allocates the buffers once
+        tracemalloc.start()
+        peak = 0
+        for _ in range(3):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn(frames)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in range(n):
+            fn(frames)
+        ms = (time.perf_counter() - start) / n / batch * 1e3
+        results[name] = {"ms": round(ms, 3), "peak_mb": round(peak / batch / 2**20, 2)}
+    LOGGER.info(
+        f"Preprocess {batch}x{shape} -> {imgsz}: "
+        + ", ".join(f"{k} {v['ms']:.2f}ms/frame {v['peak_mb']:.1f}MB/frame" for k, v in results.items())
+    )
+    return results
+
+
+def benchmark_pipeline(model=WEIGHTS_DIR / "yolo11n.pt", imgsz=640, shape=(720, 1280), frames=100, depth=2, track=True):
+    """
+    Compare sustained FPS of sequential and pipelined (`pipeline=depth`) streaming on a synthetic video.
+
+    Args:
+        model (str | Path): Path to the model file or directory.
+        imgsz (int): Inference image size.
+        shape (Tuple[int, int]): (height, width) of the synthetic video.
+        frames (int): Number of video frames.
+        depth (int): Maximum batches queued per pipeline stage.
+        track (bool): Benchmark `track` instead of `predict`, so tracking runs in the postprocess stage.
+
+    Returns:
+        (dict): {"sequential": fps, "pipelined": fps, "queue_depth": last queue depths of the pipelined run}.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_pipeline
+        >>> benchmark_pipeline(model="yolo11n.pt", depth=2)
+    """
+    import tempfile
+
+    rng = np.random.default_rng(0)
+    scene = rng.integers(0, 255, (shape[0], shape[1] + frames * 4, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as tmp:
+        video = str(Path(tmp) / "pipeline.mp4")
+        writer = cv2.VideoWriter(video, cv2.VideoWriter_fourcc(*"mp4v"), 30, shape[::-1])
+        for i in range(frames):
+            writer.write(scene[:, i * 4 : i * 4 + shape[1]])  # camera pan
+        writer.release()
+
+        results = {}
+        for name, pipeline in (("sequential", 0), ("pipelined", depth)):
+            yolo = YOLO(model)
+            call = yolo.track if track else yolo.predict
+            for _ in call(video, imgsz=imgsz, stream=True, verbose=False, vid_stride=frames):  # warmup
+                pass
+            start = time.perf_counter()
+            n = sum(1 for _ in call(video, imgsz=imgsz, stream=True, verbose=False, pipeline=pipeline))
+            results[name] = n / (time.perf_counter() - start)
+        results["queue_depth"] = yolo.predictor.queue_depth
+    LOGGER.info(
+        f"{'track' if track else 'predict'} {frames} frames {shape} at imgsz={imgsz}: sequential "
+        f"{results['sequential']:.1f} FPS, pipelined(depth={depth}) {results['pipelined']:.1f} FPS"
+    )
+    return results
+
+
+def benchmark_area_attention(model="yolov12l.yaml", imgsz=640, batch=1, n=10, backends=("math", "tiled", "sdpa")):
+    """
+    Time every A2C2f stage of a YOLOv12 model with each CPU area-attention backend of `AAttn`.
+
+    The inputs of each stage are captured from one forward pass of a random image, then the stage alone is timed with
+    all of its `AAttn` modules set to each backend. Outputs are compared against the 'math' reference path, which
+    materialises the full N x N score matrix per area and head.
+
+    Args:
+        model (str | Path): Model yaml or weights, randomly initialised yaml models are fine for timing.
+        imgsz (int): Input image size.
+        batch (int): Batch size.
+        n (int): Number of timed forward passes per stage and backend.
+        backends (Tuple[str]): Keys of `ATTENTION_BACKENDS` to compare.
+
+    Returns:
+        (dict): {layer index: {backend: {"ms": ms per forward, "max_diff": max abs difference to 'math'}}}.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_area_attention
+        >>> benchmark_area_attention(model="yolov12l.yaml", imgsz=640)
+    """
+    from ultralytics.nn.modules.block import A2C2f, AAttn
+
+    net = YOLO(model).model.float().eval()
+    stages = {  # A2C2f with a2=False has no attention
+        i: m for i, m in enumerate(net.model) if isinstance(m, A2C2f) and any(isinstance(a, AAttn) for a in m.modules())
+    }
+    inputs = {}
+    hooks = [m.register_forward_pre_hook(lambda m, x, i=i: inputs.setdefault(i, x[0])) for i, m in stages.items()]
+    with torch.inference_mode():
+        net(torch.rand(batch, 3, imgsz, imgsz, generator=torch.Generator().manual_seed(0)))
+    for h in hooks:
+        h.remove()
+
+    results = {}
+    with torch.inference_mode():
+        for i, stage in stages.items():
+            x = inputs[i]
+            attns = [m for m in stage.modules() if isinstance(m, AAttn)]
+            results[i] = {}
+            reference = None
+            for backend in ("math", *[b for b in backends if b != "math"]):
+                for m in attns:
+                    m.backend = backend
+                y = stage(x)  # warmup
+                reference = y if reference is None else reference
+                start = time.perf_counter()
+                for _ in range(n):
+                    stage(x)
+                results[i][backend] = {
+                    "ms": round((time.perf_counter() - start) / n * 1e3, 3),
+                    "max_diff": (y - reference).abs().max().item(),
+                }
+            for m in attns:
+                m.backend = None
+            if "math" not in backends:
+                results[i].pop("math")
+            tokens = x.shape[2] * x.shape[3] // attns[0].area
+            LOGGER.info(
+                f"A2C2f layer {i} {tuple(x.shape)} ({tokens} tokens/area): "
+                + ", ".join(f"{k} {v['ms']:.2f}ms (diff {v['max_diff']:.1e})" for k, v in results[i].items())
+            )
+    return results
+
+
+def benchmark_export_attention(
+    model="yolov12l.yaml", imgsz=640, format="onnx", attention=("math", "sdpa", "mha"), n=10
+):
+    """
+    Compare CPU latency of a YOLOv12 model exported with each area-attention backend.
+
+    'math' traces attention into separate MatMul/ReduceMax/Exp/ReduceSum/Div ops, 'sdpa' into the standard
+    MatMul/Softmax/MatMul subgraph (and to OpenVINO's ScaledDotProductAttention op), and 'mha' (ONNX only) into one
+    ONNX Runtime MultiHeadAttention op per attention with the per-head transposes removed.
+
+    Args:
+        model (str | Path): Model yaml or weights.
+        imgsz (int): Input image size.
+        format (str): Export format, 'onnx' or 'openvino'.
+        attention (Tuple[str]): `attention=` export arguments to compare, the first one is the reference output.
+        n (int): Number of timed inferences per exported model.
+
+    Returns:
+        (dict): {attention: {"ms": ms per inference, "max_diff": max abs output difference to the first export}}.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_export_attention
+        >>> benchmark_export_attention(model="yolov12l.yaml", format="onnx")
+    """
+    import tempfile
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    im = torch.rand(1, 3, imgsz, imgsz, generator=torch.Generator().manual_seed(0))
+    results, reference = {}, None
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in attention:
+            f = YOLO(model).export(format=format, imgsz=imgsz, attention=backend, verbose=False)
+            f = shutil.move(f, Path(tmp) / f"{backend}_{Path(f).name}")
+            exported = AutoBackend(f, device=torch.device("cpu"), verbose=False)
+            for _ in range(2):  # warmup
+                y = exported(im)
+            y = y[0] if isinstance(y, (list, tuple)) else y
+            reference = y if reference is None else reference
+            start = time.perf_counter()
+            for _ in range(n):
+                exported(im)
+            results[backend] = {
+                "ms": round((time.perf_counter() - start) / n * 1e3, 2),
+                "max_diff": float((torch.as_tensor(y) - torch.as_tensor(reference)).abs().max()),
+            }
+    LOGGER.info(
+        f"{Path(model).stem} {format} at imgsz={imgsz} on CPU: "
+        + ", ".join(f"attention={k} {v['ms']:.1f}ms (diff {v['max_diff']:.1e})" for k, v in results.items())
+    )
+    return results
+
+
+def _class_maps(metrics, precision, classes):
+    """Add the per-class and overall mAP50 and mAP50-95 of validation `metrics` to `classes` under `precision`."""
+    names, p = metrics.names, precision.upper()
+    for i, c in enumerate(metrics.ap_class_index):
+        _, _, ap50, ap = metrics.box.class_result(i)
+        classes.setdefault(names[c], {})[f"mAP50 {p}"] = round(ap50, 4)
+        classes[names[c]][f"mAP50-95 {p}"] = round(ap, 4)
+    classes.setdefault("all", {})[f"mAP50 {p}"] = round(metrics.box.map50, 4)
+    classes["all"][f"mAP50-95 {p}"] = round(metrics.box.map, 4)
+
+
+def benchmark_int8(model=WEIGHTS_DIR / "yolo11n.pt", data=None, format="onnx", imgsz=640, split="val", batch=1):
+    """
+    Quantize a detection model to INT8 and report per-class accuracy and latency against its FP32 export.
+
+    The model is exported twice in `format` ('onnx' or 'openvino') on CPU: once in FP32 and once in INT8 with
+    post-training static quantization calibrated on the `split` images of `data`. Both exports are then validated on
+    the same split with `DetectionValidator`.
+
+    Args:
+        model (str | Path): Path to the model weights.
+        data (str | None): Dataset yaml used for calibration and validation, inherited from TASK2DATA if not passed.
+        format (str): Export format, 'onnx' or 'openvino'.
+        imgsz (int): Export and validation image size.
+        split (str): Dataset split used for calibration and validation.
+        batch (int): Export batch size, also used for calibration.
+
+    Returns:
+        (dict): {"classes": pandas.DataFrame of per-class FP32/INT8 mAP50 and mAP50-95 and their delta,
+            "fp32": {...}, "int8": {...} with 'file', 'size_mb', 'mAP50-95' and 'ms' (inference ms/image),
+            "speedup": FP32 ms / INT8 ms}.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_int8
+        >>> report = benchmark_int8(model="best.pt", data="PizzaStore/data.yaml", format="onnx")
+        >>> report["classes"].loc[["Hand", "Scooper"]]
+    """
+    import pandas as pd  # scope for faster 'import ultralytics'
+
+    assert format in {"onnx", "openvino"}, f"benchmark_int8 supports format='onnx' or 'openvino', not '{format}'"
+    model = YOLO(model)
+    data = data or TASK2DATA[model.task]
+    results, classes = {}, {}
+    for precision in ("fp32", "int8"):
+        int8 = precision == "int8"
+        file = model.export(format=format, imgsz=imgsz, batch=batch, int8=int8, data=data, split=split, device="cpu")
+        metrics = YOLO(file, task=model.task).val(
+            data=data, split=split, imgsz=imgsz, batch=batch, device="cpu", plots=False, verbose=False
+        )
+        results[precision] = {
+            "file": file,
+            "size_mb": round(file_size(file), 1),
+            "mAP50-95": round(metrics.box.map, 4),
+            "ms": round(metrics.speed["inference"], 2),
+        }
+        _class_maps(metrics, precision, classes)
+
+    df = pd.DataFrame.from_dict(classes, orient="index")
+    df["Delta mAP50-95"] = (df["mAP50-95 INT8"] - df["mAP50-95 FP32"]).round(4)
+    speedup = round(results["fp32"]["ms"] / max(results["int8"]["ms"], 1e-3), 2)
+    s = (
+        f"\nINT8 {format} report for {Path(model.ckpt_path or model.cfg).name} on {data} '{split}' at imgsz={imgsz}\n"
+        f"{df}\n"
+        f"FP32 {results['fp32']['ms']}ms/im {results['fp32']['size_mb']}MB, "
+        f"INT8 {results['int8']['ms']}ms/im {results['int8']['size_mb']}MB, {speedup}x speedup\n"
+    )
+    LOGGER.info(s)
+    with open("benchmarks.log", "a", errors="ignore", encoding="utf-8") as f:
+        f.write(s)
+    return {"classes": df, **results, "speedup": speedup}
+
+
+def benchmark_bf16(model=WEIGHTS_DIR / "yolo11n.pt", data=None, imgsz=640, split="val", batch=1):
+    """
+    Validate a PyTorch detection model on CPU in FP32 and in BF16 mode and report per-class accuracy and latency.
+
+    BF16 mode (`bf16=True`) runs the model in channels_last memory format under bfloat16 autocast with box decoding
+    and NMS in FP32. It is fast on CPUs with AVX512-BF16 or AMX and slow on CPUs without native bfloat16.
+
+    Args:
+        model (str | Path): Path to the model weights.
+        data (str | None): Dataset yaml used for validation, inherited from TASK2DATA if not passed.
+        imgsz (int): Validation image size.
+        split (str): Dataset split used for validation.
+        batch (int): Validation batch size.
+
+    Returns:
+        (dict): {"classes": pandas.DataFrame of per-class FP32/BF16 mAP50 and mAP50-95 and their delta,
+            "fp32": {...}, "bf16": {...} with 'mAP50-95' and 'ms' (inference ms/image), "speedup": FP32 ms / BF16 ms}.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_bf16
+        >>> report = benchmark_bf16(model="best.pt", data="PizzaStore/data.yaml")
+        >>> report["classes"].loc[["Hand", "Scooper"]]
+    """
+    import pandas as pd  # scope for faster 'import ultralytics'
+
+    model = YOLO(model)
+    data = data or TASK2DATA[model.task]
+    results, classes = {}, {}
+    for precision in ("fp32", "bf16"):
+        metrics = YOLO(model.ckpt_path or model.cfg, task=model.task).val(
+            data=data, split=split, imgsz=imgsz, batch=batch, device="cpu", bf16=precision == "bf16", plots=False
+        )
+        results[precision] = {"mAP50-95": round(metrics.box.map, 4), "ms": round(metrics.speed["inference"], 2)}
+        _class_maps(metrics, precision, classes)
+
+    df = pd.DataFrame.from_dict(classes, orient="index")
+    df["Delta mAP50-95"] = (df["mAP50-95 BF16"] - df["mAP50-95 FP32"]).round(4)
+    speedup = round(results["fp32"]["ms"] / max(results["bf16"]["ms"], 1e-3), 2)
+    s = (
+        f"\nBF16 report for {Path(model.ckpt_path or model.cfg).name} on {data} '{split}' at imgsz={imgsz}\n"
+        f"{df}\n"
+        f"FP32 {results['fp32']['ms']}ms/im, BF16 {results['bf16']['ms']}ms/im, {speedup}x speedup\n"
+    )
+    LOGGER.info(s)
+    with open("benchmarks.log", "a", errors="ignore", encoding="utf-8") as f:
+        f.write(s)
+    return {"classes": df, **results, "speedup": speedup}
+
+
+def benchmark_onnx_io(model=WEIGHTS_DIR / "yolo11n.pt", imgsz=640, batch=(1, 8), n=20, **session_options):
+    """
+    Compare ONNX Runtime CPU inference through numpy `session.run` with the IO-bound path of `AutoBackend`.
+
+    The model is exported once with dynamic batch. 'run' feeds `im.numpy()` to `session.run` and copies the outputs
+    into new tensors, as `AutoBackend` did for dynamic models; 'iobinding' is `AutoBackend.forward`, which binds the
+    input tensor and preallocated output tensors to the same session. Both use `session_options`.
+
+    Args:
+        model (str | Path): Path to the model weights.
+        imgsz (int): Input image size.
+        batch (Tuple[int]): Batch sizes to benchmark.
+        n (int): Number of timed inferences per batch size and path.
+        **session_options (Any): `intra_op_threads`, `inter_op_threads`, `graph_optimization` and `execution_mode`.
+
+    Returns:
+        (dict): {batch: {"run": ms per batch, "iobinding": ms per batch, "speedup": run / iobinding}}.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_onnx_io
+        >>> benchmark_onnx_io(model="yolo11n.pt", batch=(1, 8), intra_op_threads=4)
+    """
+    import tempfile
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        f = YOLO(model).export(format="onnx", imgsz=imgsz, dynamic=True, verbose=False)
+        f = shutil.move(f, Path(tmp) / Path(f).name)
+        backend = AutoBackend(f, device=torch.device("cpu"), verbose=False, session_options=session_options)
+        session, names = backend.session, backend.output_names
+
+        def run(im):
+            """Previous path for dynamic models: numpy input, numpy outputs copied into new tensors."""
+            return [torch.tensor(y) for y in session.run(names, {"images": im.numpy()})]
+
+        for b in batch:
+            im = torch.rand(b, 3, imgsz, imgsz, generator=torch.Generator().manual_seed(0))
+            results[b] = {}
+            for name, fn in (("run", run), ("iobinding", backend)):
+                for _ in range(2):  # warmup, the first IO-bound call also allocates the outputs
+                    fn(im)
+                start = time.perf_counter()
+                for _ in range(n):
+                    fn(im)
+                results[b][name] = round((time.perf_counter() - start) / n * 1e3, 2)
+            results[b]["speedup"] = round(results[b]["run"] / results[b]["iobinding"], 3)
+    LOGGER.info(
+        f"{Path(model).stem} ONNX Runtime at imgsz={imgsz} on CPU {session_options or ''}: "
+        + ", ".join(f"batch {b} run {v['run']:.1f}ms, iobinding {v['iobinding']:.1f}ms" for b, v in results.items())
+    )
+    return results
+
+
+def benchmark_compile(model="yolov12m.yaml", imgsz=640, batch=1, n=10, modes=("jit", "inductor")):
+    """
+    Compare eager CPU inference of a PyTorch model with the compiled modes of `AutoBackend`.
+
+    Every mode gets its own fused `AutoBackend`. The first call, which compiles for the input shape, is timed
+    separately from the `n` timed calls after one warmup. Outputs are compared against eager.
+
+    Args:
+        model (str | Path): Model yaml or weights, randomly initialised yaml models are fine for timing.
+        imgsz (int): Input image size.
+        batch (int): Batch size.
+        n (int): Number of timed inferences per mode.
+        modes (Tuple[str]): `compile_mode` values to compare with eager, 'jit' and/or 'inductor'.
+
+    Returns:
+        (dict): {mode: {"compile": seconds to compile, "ms": ms per batch, "speedup": eager / mode,
+            "max_diff": max abs difference to eager, "graph_breaks": TorchDynamo graph breaks}}, with "eager" first.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_compile
+        >>> benchmark_compile(model="yolov12l.yaml", imgsz=640, modes=("inductor",))
+    """
+    from copy import deepcopy
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    net = YOLO(model).model.eval()
+    im = torch.rand(batch, 3, imgsz, imgsz, generator=torch.Generator().manual_seed(0))
+    results, reference = {}, None
+    with torch.inference_mode():
+        for mode in (None, *modes):
+            backend = AutoBackend(deepcopy(net), device=torch.device("cpu"), verbose=False, compile_mode=mode)
+            start = time.perf_counter()
+            y = backend(im)[0]  # compiles on first call
+            compile_time = time.perf_counter() - start
+            reference = y if reference is None else reference
+            backend(im)  # warmup
+            start = time.perf_counter()
+            for _ in range(n):
+                backend(im)
+            results[mode or "eager"] = {
+                "compile": round(compile_time, 2) if mode else 0.0,
+                "ms": round((time.perf_counter() - start) / n * 1e3, 2),
+                "max_diff": (y - reference).abs().max().item(),
+                "graph_breaks": len(backend.graph_breaks),
+            }
+    for v in results.values():
+        v["speedup"] = round(results["eager"]["ms"] / v["ms"], 3)
+    LOGGER.info(
+        f"{Path(model).stem} at imgsz={imgsz} batch={batch} on CPU: "
+        + ", ".join(f"{k} {v['ms']:.1f}ms (compile {v['compile']:.1f}s)" for k, v in results.items())
+    )
+    return results
+
+
 class RF100Benchmark:
     """Benchmark YOLO model performance across various formats for speed and accuracy."""
 
@@ -36,6 +36,7 @@ TORCH_1_9 = check_version(torch.__version__, "1.9.0")
 TORCH_1_13 = check_version(torch.__version__, "1.13.0")
 TORCH_2_0 = check_version(torch.__version__, "2.0.0")
 TORCH_2_4 = check_version(torch.__version__, "2.4.0")
+TORCH_2_9 = check_version(torch.__version__, "2.9.0")
 TORCHVISION_0_10 = check_version(TORCHVISION_VERSION, "0.10.0")
 TORCHVISION_0_11 = check_version(TORCHVISION_VERSION, "0.11.0")
 TORCHVISION_0_13 = check_version(TORCHVISION_VERSION, "0.13.0")
@@ -103,6 +104,13 @@ def autocast(enabled: bool, device: str = "cuda"):
         return torch.cuda.amp.autocast(enabled)
 
 
+def cpu_autocast_bf16():
+    """Return True inside an enabled CPU autocast region with dtype bfloat16."""
+    if TORCH_2_4:
+        return torch.is_autocast_enabled("cpu") and torch.get_autocast_dtype("cpu") == torch.bfloat16
+    return torch.is_autocast_cpu_enabled() and torch.get_autocast_cpu_dtype() == torch.bfloat16
+
+
 def get_cpu_info():
     """Return a string with system CPU information, i.e. 'Apple M2'."""
     from ultralytics.utils import PERSISTENT_CACHE  # avoid circular import error
@@ -317,7 +325,9 @@ def model_info(model, detailed=False, verbose=True, imgsz=640):
     fs = f", {flops:.1f} GFLOPs" if flops else ""
     yaml_file = getattr(model, "yaml_file", "") or getattr(model, "yaml", {}).get("yaml_file", "")
     model_name = Path(yaml_file).stem.replace("yolo", "YOLO") or "Model"
-    LOGGER.info(f"{model_name} summary{fused}: {n_l:,} layers, {n_p:,} parameters, {n_g:,} gradients{fs}")
+    backends = sorted({m.attention_backend for m in model.modules() if hasattr(m, "attention_backend")})
+    attn = f", {'/'.join(backends)} attention" if backends else ""
+    LOGGER.info(f"{model_name} summary{fused}: {n_l:,} layers, {n_p:,} parameters, {n_g:,} gradients{fs}{attn}")
     return n_l, n_p, n_g, flops
 
 
@@ -445,6 +455,10 @@ def get_latest_opset():
     """Return the second-most recent ONNX opset version supported by this version of PyTorch, adjusted for maturity."""
     if TORCH_1_13:
         # If the PyTorch>=1.13, dynamically compute the latest opset minus one using 'symbolic_opset'
+        if TORCH_2_9:  # most 'symbolic_opset' modules moved out of the torch.onnx namespace
+            from torch.onnx import _constants
+
+            return getattr(_constants, "ONNX_TORCHSCRIPT_EXPORTER_MAX_OPSET", _constants.ONNX_MAX_OPSET) - 1
         return max(int(k[14:]) for k in vars(torch.onnx) if "symbolic_opset" in k) - 1
     # Otherwise for PyTorch<=1.12 return the corresponding predefined opset
     version = torch.onnx.producer_version.rsplit(".", 1)[0]  # i.e. '2.3'